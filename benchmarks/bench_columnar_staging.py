@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare re-opening a parsed resource from the pickle cache and from staging.
+
+Usage: python -m benchmarks.bench_columnar_staging --rows 200000 --cols 20
+
+The staging files are Feather files when pyarrow is installed, see
+`columnar_staging`. With --raw the columns are object cells of mixed types,
+like the output of an import without types.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pandas import DataFrame
+
+from benchmarks.synthetic import DTYPE_MIXES, column_types, make_dataframe
+from src.cached_importer import CachedImporter
+from src.columnar_staging import StagedImporter
+from src.common_importer_functions import coerce_types
+
+
+class FrameImporter:
+    def __init__(self, data: DataFrame):
+        self.data = data
+
+    def load_data(self, source, section=None, types=None) -> DataFrame:
+        return self.data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--dtype-mix", choices=DTYPE_MIXES, default="numeric")
+    parser.add_argument("--raw", action="store_true", help="Don't coerce the types")
+    parser.add_argument("--dirty-ratio", type=float, default=0.0)
+    args = parser.parse_args()
+
+    data = make_dataframe(
+        args.rows, args.cols, args.dirty_ratio, dtype_mix=args.dtype_mix
+    )
+    if not args.raw:  # Typed like an import with the expected types
+        data = coerce_types(data, column_types(args.cols, args.dtype_mix))
+    importer = FrameImporter(data)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, wrapper in (("pickle", CachedImporter), ("staged", StagedImporter)):
+            cache = wrapper(importer, Path(tmp_dir) / name)
+            start = time.perf_counter()
+            cache.load_data(b"source", "bench")
+            store_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            cache.load_data(b"source", "bench")
+            open_seconds = time.perf_counter() - start
+            size = sum(entry.stat().st_size for entry in cache.cache_dir.iterdir())
+            print(
+                f"{name}: store {store_seconds:.3f}s, open {open_seconds:.3f}s, "
+                f"{size / 1024**2:.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare the per-cell and the vectorized common validations.
+
+Usage: python -m benchmarks.bench_common_validations --rows 500000 --cols 10
+       python -m benchmarks.bench_common_validations --check missing --cols 150
+"""
+
+import argparse
+import time
+
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from src.common_resource_functions import CommonResourceFunctions
+from tests.mock_classes import MockResource
+
+DIRTY_VALUES = ["tab\tvalue", " leading", "trailing ", "a – b", "new\n", ""]
+
+
+def make_dataframe(rows: int, cols: int, dirty_ratio: float) -> DataFrame:
+    rng = default_rng(0)
+    data = {}
+    for col in range(cols):
+        values = [f"value {col}-{row}" for row in range(rows)]
+        for row in rng.choice(rows, int(rows * dirty_ratio), replace=False):
+            values[row] = DIRTY_VALUES[row % len(DIRTY_VALUES)]
+        data[f"col_{col}"] = values
+    return DataFrame(data, dtype="object")
+
+
+def per_cell_validation(validator: CommonResourceFunctions) -> list[str]:
+    errors: list[str] = []
+    for label, content in validator.attached_resource.input_data.items():
+        for index, value in content.items():
+            cell_problems = validator.validate_cell_characters(label, index, value)
+            if cell_problems:
+                errors.append(cell_problems)
+    return errors
+
+
+def column_validation(validator: CommonResourceFunctions) -> list[str]:
+    validator.check_all_cells_characters()
+    return validator.errors
+
+
+def per_row_missing_values(validator: CommonResourceFunctions) -> list[str]:
+    # Previous row by row implementation (only reports the empty strings)
+    input_data = validator.attached_resource.input_data
+    missing_data: dict[str, list[str]] = {}
+    for field_label in input_data.columns:
+        for idx, value in input_data[field_label].items():
+            if value != "" or not isinstance(value, str) and value is not None:
+                continue
+            missing_data.setdefault(field_label, []).append(f"Row {int(idx) + 2}")
+    if not missing_data:
+        return []
+    msg = "Missing data in mandatory fields:\n"
+    for label, rows in missing_data.items():
+        msg += f"  - Column '{label}':\n"
+        for err in rows:
+            msg += f"    - {err}\n"
+    return [msg]
+
+
+def vectorized_missing_values(validator: CommonResourceFunctions) -> list[str]:
+    input_data = validator.attached_resource.input_data
+    validator.check_missing_values_in_required_fields(list(input_data.columns))
+    return validator.errors
+
+
+CHECKS = {
+    "characters": (per_cell_validation, column_validation),
+    "missing": (per_row_missing_values, vectorized_missing_values),
+}
+
+
+def run(data: DataFrame, check) -> tuple[float, list[str]]:
+    resource = MockResource("bench")
+    resource.input_data = data
+    # Uncapped, so both paths report every problem
+    validator = CommonResourceFunctions(resource, max_errors=None)
+    start = time.perf_counter()
+    errors = check(validator)
+    return time.perf_counter() - start, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--dirty-ratio", type=float, default=0.01)
+    parser.add_argument("--check", choices=list(CHECKS), default="characters")
+    args = parser.parse_args()
+
+    data = make_dataframe(args.rows, args.cols, args.dirty_ratio)
+    per_cell_check, vectorized_check = CHECKS[args.check]
+    per_cell_time, per_cell_errors = run(data, per_cell_check)
+    vectorized_time, vectorized_errors = run(data, vectorized_check)
+    assert per_cell_errors == vectorized_errors, "Both paths must report the same"
+
+    speedup = per_cell_time / vectorized_time
+    print(f"'{args.check}' check on {args.rows} rows x {args.cols} cols")
+    print(f"per-cell:   {per_cell_time:.3f}s")
+    print(f"vectorized: {vectorized_time:.3f}s ({speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare importing the same synthetic resource from xlsx and from CSV.
+
+Usage: python -m benchmarks.bench_csv_import --rows 50000 --cols 20
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import (
+    DTYPE_MIXES,
+    SECTION,
+    column_types,
+    make_dataframe,
+    write_workbook,
+)
+from src.csv_importer import CsvImporter
+from src.xlsx_importer import XlsxImporter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--dtype-mix", choices=DTYPE_MIXES, default="mixed")
+    args = parser.parse_args()
+
+    data = make_dataframe(args.rows, args.cols, dtype_mix=args.dtype_mix)
+    types = column_types(args.cols, args.dtype_mix)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xlsx_file = str(Path(tmp_dir) / "bench.xlsx")
+        csv_file = str(Path(tmp_dir) / "bench.csv")
+        write_workbook(xlsx_file, data)
+        data.to_csv(csv_file, index=False)
+
+        cases = {
+            "xlsx": lambda: XlsxImporter().load_data(xlsx_file, SECTION, types),
+            "csv": lambda: CsvImporter().load_data(csv_file, SECTION, types),
+            "csv chunks": lambda: sum(
+                len(chunk)
+                for chunk in CsvImporter().iter_chunks(csv_file, None, 10_000, types)
+            ),
+        }
+        timings = {}
+        for name, load in cases.items():
+            start = time.perf_counter()
+            load()
+            timings[name] = time.perf_counter() - start
+
+    print(f"{args.rows} rows x {args.cols} cols ({args.dtype_mix})")
+    for name, seconds in timings.items():
+        speedup = timings["xlsx"] / seconds
+        print(f"{name + ':':<12} {seconds:.3f}s ({speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare a new DB connection per resource run with a connection pool.
+
+Each thread runs many small resources (connect, insert and load a few rows,
+then close) against the same SQLite file database.
+
+Usage: python -m benchmarks.bench_db_pool --threads 8 --runs 200 --rows 20
+"""
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from pandas import DataFrame
+
+from src.protocols import DataBaseHandler
+from src.sqlite_handler import SQLiteDataBaseHandler
+from src.sqlite_pool import SQLiteConnectionPool
+
+
+def resource_run(db_handler: DataBaseHandler, name: str, data: DataFrame) -> None:
+    db_handler.connect_with_db()
+    try:
+        db_handler.bulk_insert_resource_data(name, data)
+        db_handler.load_resource_data(name, data[["key"]])
+    except BaseException:
+        db_handler.close_db_connection(rollback=True)
+        raise
+    db_handler.close_db_connection()
+
+
+def run_threads(
+    new_handler: Callable[[], DataBaseHandler], threads: int, runs: int, rows: int
+) -> float:
+    def worker(thread: int) -> None:
+        name = f"resource_{thread}"
+        for run in range(runs):
+            keys = range(run * rows, (run + 1) * rows)
+            data = DataFrame({"key": keys, "value": [f"value {key}" for key in keys]})
+            resource_run(new_handler(), name, data)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, range(threads)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--pool-size", type=int, default=None)
+    args = parser.parse_args()
+    total_runs = args.threads * args.runs
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database = str(Path(tmp_dir) / "bench.db")
+
+        def new_connection_handler() -> DataBaseHandler:
+            db_handler = SQLiteDataBaseHandler()
+            db_handler.set_credentials(database=database)
+            return db_handler
+
+        pool_size = args.pool_size or args.threads
+        pool = SQLiteConnectionPool(min_size=pool_size, max_size=pool_size)
+        pool.set_credentials(database=database)
+        pool.open_pool()
+        try:
+            # Same WAL journal for both, only the connection reuse differs
+            pooled_time = run_threads(pool.handler, args.threads, args.runs, args.rows)
+            single_time = run_threads(
+                new_connection_handler, args.threads, args.runs, args.rows
+            )
+        finally:
+            pool.close_pool()
+
+    print(f"{total_runs} resource runs in {args.threads} threads")
+    print(f"new connection: {single_time:.3f}s ({total_runs / single_time:.0f} runs/s)")
+    print(
+        f"pooled:         {pooled_time:.3f}s ({total_runs / pooled_time:.0f} runs/s, "
+        f"{single_time / pooled_time:.1f}x, {pool.created_count} connections)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure the cold import time of the load-transmuter modules.
+
+Each module is imported in a fresh interpreter with `-X importtime`, so the
+results don't depend on what was already imported. With `--max-ms` the run
+fails when a module goes over its budget, to catch import time regressions.
+
+Usage: python -m benchmarks.bench_import_time --repeat 5
+       python -m benchmarks.bench_import_time --max-ms src.protocols=50
+"""
+
+import argparse
+import subprocess
+import sys
+
+MODULES = (
+    "src.protocols",
+    "src.importers",
+    "src.cached_importer",
+    "src.async_importer",
+    "src.xlsx_importer",
+    "src.common_resource_functions",
+)
+
+
+def import_time_ms(module: str) -> float:
+    """Cumulative import time of the module, as reported by `-X importtime`."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # Lines look like "import time:    self [us] | cumulative | imported package"
+    for line in reversed(process.stderr.splitlines()):
+        _, found, fields = line.partition("import time:")
+        if not found:
+            continue
+        _, cumulative, name = (field.strip() for field in fields.split("|"))
+        if name == module:
+            return int(cumulative) / 1000
+    raise ValueError(f"'{module}' not found in the -X importtime output")
+
+
+def parse_budgets(values: list[str]) -> dict[str, float]:
+    budgets = {}
+    for value in values:
+        module, _, max_ms = value.partition("=")
+        budgets[module] = float(max_ms)
+    return budgets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--max-ms",
+        nargs="*",
+        default=[],
+        metavar="MODULE=MS",
+        help="Fail if the best import time of MODULE is over MS milliseconds",
+    )
+    args = parser.parse_args()
+    budgets = parse_budgets(args.max_ms)
+
+    over_budget = []
+    for module in dict.fromkeys([*args.modules, *budgets]):
+        best = min(import_time_ms(module) for _ in range(args.repeat))
+        max_ms = budgets.get(module)
+        status = ""
+        if max_ms is not None:
+            status = f" (budget {max_ms:.0f}ms)"
+            if best > max_ms:
+                status += " OVER BUDGET"
+                over_budget.append(module)
+        print(f"{module}: {best:.1f}ms{status}")
+
+    if over_budget:
+        sys.exit(f"Import time over budget: {', '.join(over_budget)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare a full table read filtered in pandas with the keyed `load_resource_data`.
+
+Usage: python -m benchmarks.bench_keyed_load --rows 1000000 --keys 100000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pandas import DataFrame, MultiIndex, read_sql_query
+
+from src.sqlite_handler import SQLiteDataBaseHandler
+
+
+def full_read(db_handler: SQLiteDataBaseHandler, keys: DataFrame) -> DataFrame:
+    # Previous implementation: the whole table is loaded and then filtered
+    db_data = read_sql_query('SELECT * FROM "bench"', db_handler.connection)
+    db_keys = MultiIndex.from_frame(db_data[["key"]].astype(object))
+    selection = MultiIndex.from_frame(keys.astype(object))
+    return db_data[db_keys.isin(selection)].reset_index(drop=True)
+
+
+def keyed_load(db_handler: SQLiteDataBaseHandler, keys: DataFrame) -> DataFrame:
+    return db_handler.load_resource_data("bench", keys, ["key"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--keys", type=int, default=100_000)
+    args = parser.parse_args()
+
+    data = DataFrame(
+        {
+            "key": range(args.rows),
+            "value": [f"value {row}" for row in range(args.rows)],
+            "amount": [row * 0.5 for row in range(args.rows)],
+        }
+    )
+    keys = data[["key"]].sample(args.keys, random_state=0)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_handler = SQLiteDataBaseHandler()
+        db_handler.set_credentials(database=str(Path(tmp_dir) / "bench.db"))
+        db_handler.connect_with_db()
+        db_handler.bulk_insert_resource_data("bench", data)
+        db_handler.connection.commit()
+        db_handler.create_key_index("bench", ["key"])
+        db_handler.connection.commit()
+
+        timings = {}
+        for name, load in (("full read", full_read), ("keyed", keyed_load)):
+            start = time.perf_counter()
+            loaded = load(db_handler, keys)
+            timings[name] = time.perf_counter() - start
+            assert len(loaded) == args.keys, f"{name} loaded {len(loaded)} rows"
+        db_handler.close_db_connection()
+
+    print(f"{args.keys} keys from a {args.rows} rows table")
+    print(f"full read: {timings['full read']:.3f}s")
+    speedup = timings["full read"] / timings["keyed"]
+    print(f"keyed:     {timings['keyed']:.3f}s ({speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Scaling of the sharded common validations by number of workers.
+
+Usage: python -m benchmarks.bench_sharded_validation --rows 300000 --cols 150
+       python -m benchmarks.bench_sharded_validation --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+
+from pandas import DataFrame
+
+from benchmarks.bench_common_validations import make_dataframe
+from src.common_resource_functions import CommonResourceFunctions
+from tests.mock_classes import MockResource
+
+
+def run(data: DataFrame, workers: int, rows_per_shard: int | None) -> tuple[float, str]:
+    resource = MockResource("bench")
+    resource.required_fields = list(data.columns)
+    resource.input_data = data
+    validator = CommonResourceFunctions(
+        resource, max_errors=None, workers=workers, rows_per_shard=rows_per_shard
+    )
+    start = time.perf_counter()
+    try:
+        validator.run_common_validations()
+        report = ""
+    except ValueError as err:
+        report = err.args[0]
+    return time.perf_counter() - start, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--cols", type=int, default=50)
+    parser.add_argument("--dirty-ratio", type=float, default=0.01)
+    parser.add_argument("--rows-per-shard", type=int, default=None)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1]
+    )
+    args = parser.parse_args()
+
+    data = make_dataframe(args.rows, args.cols, args.dirty_ratio)
+    serial_time, serial_report = run(data, 1, None)
+    print(f"Sharded validation on {args.rows} rows x {args.cols} cols")
+    print(f"{os.cpu_count()} CPU(s) available")
+    print(f"workers  1: {serial_time:.3f}s (serial)")
+    for workers in sorted(set(args.workers) - {1}):
+        elapsed, report = run(data, workers, args.rows_per_shard)
+        assert report == serial_report, "Both paths must report the same"
+        print(f"workers {workers:>2}: {elapsed:.3f}s ({serial_time / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare a naive row-by-row insert with `bulk_insert_resource_data`.
+
+Usage: python -m benchmarks.bench_sqlite_insert --rows 200000 --batch-size 10000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pandas import DataFrame
+
+from src.common_db_functions import quote_identifier
+from src.sqlite_handler import SQLiteDataBaseHandler
+
+
+def make_dataframe(rows: int, cols: int) -> DataFrame:
+    data = {}
+    for col in range(cols):
+        if col % 2:
+            data[f"col_{col}"] = [f"value {col}-{row}" for row in range(rows)]
+        else:
+            data[f"col_{col}"] = list(range(rows))
+    return DataFrame(data, dtype="object")
+
+
+def naive_insert(db: SQLiteDataBaseHandler, name: str, data: DataFrame, _) -> None:
+    db._create_table_if_not_exists(name, data)
+    columns = ", ".join(quote_identifier(label) for label in data.columns)
+    placeholders = ", ".join("?" * len(data.columns))
+    query = f"INSERT INTO {quote_identifier(name)} ({columns}) VALUES ({placeholders})"
+    for row in data.itertuples(index=False):
+        db.connection.execute(query, tuple(row))
+
+
+def bulk_insert(
+    db: SQLiteDataBaseHandler, name: str, data: DataFrame, batch_size: int
+) -> None:
+    db.bulk_insert_resource_data(name, data, batch_size=batch_size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    data = make_dataframe(args.rows, args.cols)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        timings = {}
+        for insert in (naive_insert, bulk_insert):
+            db = SQLiteDataBaseHandler()
+            db.set_credentials(database=str(Path(tmp_dir) / f"{insert.__name__}.db"))
+            db.connect_with_db()
+            start = time.perf_counter()
+            insert(db, "bench", data, args.batch_size)
+            db.close_db_connection()
+            timings[insert.__name__] = time.perf_counter() - start
+
+    print(f"{args.rows} rows x {args.cols} cols")
+    print(f"naive: {timings['naive_insert']:.3f}s")
+    speedup = timings["naive_insert"] / timings["bulk_insert"]
+    print(f"bulk:  {timings['bulk_insert']:.3f}s ({speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare the memory of a sheet loaded as object dtype and with expected types.
+
+Usage: python -m benchmarks.bench_typed_import --rows 50000
+"""
+
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from src.xlsx_importer import XlsxImporter
+
+SECTION = "bench"
+TYPES = {
+    "id": int,
+    "amount": float,
+    "created": datetime,
+    "status": "category",
+    "comment": str,
+}
+
+
+def make_workbook(filename: str, rows: int) -> None:
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(SECTION)
+    worksheet.append(list(TYPES))
+    start = datetime(2024, 1, 1)
+    for row in range(rows):
+        status = ("open", "closed", "pending")[row % 3]
+        created = start + timedelta(minutes=row)
+        worksheet.append([row, row * 0.5, created, status, f"comment {row}"])
+    workbook.save(filename)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    importer = XlsxImporter()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = str(Path(tmp_dir) / "bench.xlsx")
+        make_workbook(filename, args.rows)
+        untyped = importer.load_data(filename, SECTION)
+        typed = importer.load_data(filename, SECTION, TYPES)
+
+    untyped_size = untyped.memory_usage(deep=True).sum()
+    typed_size = typed.memory_usage(deep=True).sum()
+    print(f"{args.rows} rows")
+    print(f"object dtype: {untyped_size / 1024**2:.1f} MiB")
+    print(f"typed:        {typed_size / 1024**2:.1f} MiB")
+    print(f"saving:       {1 - typed_size / untyped_size:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare the peak RSS of `XlsxImporter.load_data` and `iter_chunks`.
+
+Each mode runs in a fresh process so the measurements don't mix.
+
+Usage: python -m benchmarks.bench_xlsx_chunks --rows 1000000 --chunksize 10000
+"""
+
+import argparse
+import multiprocessing
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from src.xlsx_importer import XlsxImporter
+
+SECTION = "bench"
+
+
+def make_workbook(filename: str, rows: int, cols: int) -> None:
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(SECTION)
+    worksheet.append([f"col_{col}" for col in range(cols)])
+    for row in range(rows):
+        worksheet.append([f"value {row}" if col % 2 else row for col in range(cols)])
+    workbook.save(filename)
+
+
+def load_data(filename: str, chunksize: int) -> int:
+    return len(XlsxImporter().load_data(filename, SECTION))
+
+
+def iter_chunks(filename: str, chunksize: int) -> int:
+    chunks = XlsxImporter().iter_chunks(filename, SECTION, chunksize)
+    return sum(len(chunk) for chunk in chunks)
+
+
+def measure(mode, filename: str, chunksize: int) -> tuple[int, float, int]:
+    start = time.perf_counter()
+    rows = mode(filename, chunksize)
+    elapsed = time.perf_counter() - start
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rows, elapsed, peak_rss_kb
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--chunksize", type=int, default=10_000)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = str(Path(tmp_dir) / "bench.xlsx")
+        make_workbook(filename, args.rows, args.cols)
+        for mode in (load_data, iter_chunks):
+            with context.Pool(1) as pool:
+                rows, elapsed, peak = pool.apply(
+                    measure, (mode, filename, args.chunksize)
+                )
+            print(
+                f"{mode.__name__:<11} {rows} rows {elapsed:.2f}s "
+                f"peak RSS {peak / 1024:.0f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare a sequential `load_data` loop with `XlsxImporter.load_many`.
+
+Usage: python -m benchmarks.bench_xlsx_load_many --sheets 30 --rows 5000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from src.xlsx_importer import XlsxImporter
+
+
+def make_workbook(filename: str, sheets: int, rows: int, cols: int) -> list[str]:
+    workbook = Workbook(write_only=True)
+    names = [f"sheet_{sheet}" for sheet in range(sheets)]
+    for name in names:
+        worksheet = workbook.create_sheet(name)
+        worksheet.append([f"col_{col}" for col in range(cols)])
+        for row in range(rows):
+            worksheet.append([f"value {row}" if col % 2 else row for col in range(cols)])
+    workbook.save(filename)
+    return names
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sheets", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--max-workers", type=int, default=None)
+    args = parser.parse_args()
+
+    importer = XlsxImporter()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = str(Path(tmp_dir) / "bench.xlsx")
+        sections = make_workbook(filename, args.sheets, args.rows, args.cols)
+
+        start = time.perf_counter()
+        for section in sections:
+            importer.load_data(filename, section)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        importer.load_many(filename, sections, args.max_workers)
+        parallel = time.perf_counter() - start
+
+    print(f"{args.sheets} sheets x {args.rows} rows x {args.cols} cols")
+    print(f"sequential: {sequential:.2f}s")
+    print(f"load_many:  {parallel:.2f}s ({sequential / parallel:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
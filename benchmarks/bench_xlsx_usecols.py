@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare loading every column of a wide sheet with loading only the used ones.
+
+The synthetic workbooks are written in write-only mode, without the
+<dimension> element that Excel writes, so openpyxl scans each sheet once just
+to open the file. That time is included in every case, the header probe too.
+
+Usage: python -m benchmarks.bench_xlsx_usecols --rows 5000 --cols 200 --used 12
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import DTYPE_MIXES, SECTION, make_dataframe, write_workbook
+from src.xlsx_importer import XlsxImporter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--cols", type=int, default=200)
+    parser.add_argument("--used", type=int, default=12)
+    parser.add_argument("--dtype-mix", choices=DTYPE_MIXES, default="mixed")
+    args = parser.parse_args()
+
+    data = make_dataframe(args.rows, args.cols, dtype_mix=args.dtype_mix)
+    step = max(args.cols // args.used, 1)
+    usecols = [str(label) for label in data.columns[::step][: args.used]]
+    importer = XlsxImporter()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = str(Path(tmp_dir) / "wide.xlsx")
+        write_workbook(filename, data)
+
+        cases = {
+            "header probe": lambda: importer.read_header(filename, SECTION),
+            "all columns": lambda: importer.load_data(filename, SECTION)[usecols],
+            "usecols": lambda: importer.load_data(filename, SECTION, usecols=usecols),
+        }
+        timings = {}
+        for name, load in cases.items():
+            start = time.perf_counter()
+            load()
+            timings[name] = time.perf_counter() - start
+
+    print(f"{args.used} of {args.cols} columns, {args.rows} rows ({args.dtype_mix})")
+    for name, seconds in timings.items():
+        speedup = timings["all columns"] / seconds
+        print(f"{name + ':':<14} {seconds:.3f}s ({speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Time the main load-transmuter stages on synthetic data and save the results.
+
+Every case is timed `--repeat` times, then run once more under tracemalloc
+to record its peak memory, so tracing doesn't skew the timings. The JSON
+results can be compared with the ones of another commit with `--compare`.
+
+Usage: python -m benchmarks.suite --rows 50000 --cols 20 --output results.json
+       python -m benchmarks.suite --compare .benchmarks/1a2b3c4d.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from pandas import DataFrame
+
+from benchmarks.synthetic import (
+    DTYPE_MIXES,
+    SECTION,
+    column_types,
+    make_dataframe,
+    write_workbook,
+)
+from src.common_resource_functions import CommonResourceFunctions
+from src.sqlite_handler import SQLiteDataBaseHandler
+from src.xlsx_importer import XlsxImporter
+from tests.mock_classes import MockResource
+
+
+def xlsx_load_data(filename: str, data: DataFrame) -> Callable[[], object]:
+    return lambda: XlsxImporter().load_data(filename, SECTION)
+
+
+def common_validations(filename: str, data: DataFrame) -> Callable[[], object]:
+    resource = MockResource("bench")
+    resource.required_fields = list(data.columns)
+    resource.input_data = data
+
+    def run() -> None:
+        try:
+            CommonResourceFunctions(resource).run_common_validations()
+        except ValueError:
+            pass  # the dirty cells are expected to be reported
+
+    return run
+
+
+def sqlite_round_trip(filename: str, data: DataFrame) -> Callable[[], object]:
+    def run() -> DataFrame:
+        db_handler = SQLiteDataBaseHandler()
+        db_handler.connect_with_db()
+        try:
+            db_handler.bulk_insert_resource_data("bench", data)
+            return db_handler.load_resource_data("bench", DataFrame())
+        finally:
+            db_handler.close_db_connection()
+
+    return run
+
+
+CASES: dict[str, Callable[[str, DataFrame], Callable[[], object]]] = {
+    "xlsx_load_data": xlsx_load_data,
+    "common_validations": common_validations,
+    "sqlite_round_trip": sqlite_round_trip,
+}
+
+
+def measure(case: Callable[[], object], repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        case()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "best_seconds": min(timings),
+        "mean_seconds": sum(timings) / len(timings),
+        "timings": timings,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def current_commit() -> str | None:
+    try:
+        command = ["git", "rev-parse", "HEAD"]
+        process = subprocess.run(command, capture_output=True, check=True, text=True)
+        return process.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict) -> None:
+    print(f"\nCompared with {baseline.get('commit') or 'the baseline'}:")
+    for name, result in results["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        speedup = base["best_seconds"] / result["best_seconds"]
+        memory = result["peak_memory_bytes"] / max(base["peak_memory_bytes"], 1)
+        print(f"{name:<20} {speedup:5.2f}x speed, {memory:5.2f}x peak memory")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--dirty-ratio", type=float, default=0.01)
+    parser.add_argument("--dtype-mix", choices=list(DTYPE_MIXES), default="mixed")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--cases", nargs="+", choices=list(CASES), default=list(CASES)
+    )
+    parser.add_argument("--output", type=Path, help="Save the results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results of a baseline")
+    args = parser.parse_args()
+
+    data = make_dataframe(args.rows, args.cols, args.dirty_ratio, args.dtype_mix)
+    types = column_types(args.cols, args.dtype_mix)
+    results = {
+        "commit": current_commit(),
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "parameters": {
+            "rows": args.rows,
+            "cols": args.cols,
+            "dirty_ratio": args.dirty_ratio,
+            "dtype_mix": args.dtype_mix,
+            "column_types": {label: kind.__name__ for label, kind in types.items()},
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+
+    print(f"{args.rows} rows x {args.cols} cols ({args.dtype_mix})")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = str(Path(tmp_dir) / "bench.xlsx")
+        write_workbook(filename, data)
+        for name in args.cases:
+            result = measure(CASES[name](filename, data), args.repeat)
+            results["results"][name] = result
+            peak_mib = result["peak_memory_bytes"] / 2**20
+            seconds = result["best_seconds"]
+            print(f"{name:<20} {seconds:8.3f}s {peak_mib:9.1f} MiB peak")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results saved in '{args.output}'")
+    if args.compare:
+        compare(results, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
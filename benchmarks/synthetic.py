@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Synthetic resources for the benchmarks.
+
+The columns cycle through the types of the dtype mix and a ratio of the
+cells is replaced with dirty values: invalid characters or blanks for the
+text columns, and blanks or text for the typed ones.
+"""
+
+from datetime import datetime, timedelta
+
+from numpy.random import default_rng
+from openpyxl import Workbook
+from pandas import DataFrame
+
+DTYPE_MIXES: dict[str, tuple[type, ...]] = {
+    "str": (str,),
+    "numeric": (int, float),
+    "mixed": (str, int, float, datetime),
+}
+DIRTY_TEXT = ["tab\tvalue", " leading", "trailing ", "a – b", "new\n", ""]
+DIRTY_TYPED = ["", "n/a"]
+SECTION = "bench"
+
+
+def column_types(cols: int, dtype_mix: str = "mixed") -> dict[str, type]:
+    types = DTYPE_MIXES[dtype_mix]
+    return {f"col_{col}": types[col % len(types)] for col in range(cols)}
+
+
+def make_dataframe(
+    rows: int,
+    cols: int,
+    dirty_ratio: float = 0.0,
+    dtype_mix: str = "mixed",
+    seed: int = 0,
+) -> DataFrame:
+    rng = default_rng(seed)
+    start_date = datetime(2024, 1, 1)
+    data = {}
+    for label, expected_type in column_types(cols, dtype_mix).items():
+        if expected_type is str:
+            values = [f"value {label}-{row}" for row in range(rows)]
+            dirty_values = DIRTY_TEXT
+        elif expected_type is int:
+            values = rng.integers(0, 1_000_000, rows).tolist()
+            dirty_values = DIRTY_TYPED
+        elif expected_type is float:
+            values = rng.random(rows).round(4).tolist()
+            dirty_values = DIRTY_TYPED
+        else:
+            values = [start_date + timedelta(hours=row) for row in range(rows)]
+            dirty_values = DIRTY_TYPED
+
+        for row in rng.choice(rows, int(rows * dirty_ratio), replace=False):
+            values[row] = dirty_values[row % len(dirty_values)]
+        data[label] = values
+    return DataFrame(data, dtype="object")
+
+
+def write_workbook(filename: str, data: DataFrame, section: str = SECTION) -> None:
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(section)
+    worksheet.append([str(label) for label in data.columns])
+    for row in data.itertuples(index=False):
+        worksheet.append(list(row))
+    workbook.save(filename)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Iterable
+
+from src.protocols import ImporterHandler
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+class AsyncImporter:
+    """Async variant of an `ImporterHandler`, e.g., `XlsxImporter` or
+    `GoogleSheetsImporter`.
+
+    The blocking `load_data` calls run in an executor (a bounded thread pool
+    by default) and at most `max_concurrency` of them run at the same time.
+    Threads suit remote fetches. For CPU bound parsing of local files a
+    `ProcessPoolExecutor` can be given instead, as long as the wrapped
+    importer can be pickled.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        importer: ImporterHandler,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        executor: Executor | None = None,
+    ):
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be a positive integer, got {max_concurrency}"
+            raise ValueError(msg)
+
+        self.importer = importer
+        self.max_concurrency = max_concurrency
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_concurrency)
+        # By event loop, a semaphore can only be used by the loop it bound to
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    async def __aenter__(self) -> "AsyncImporter":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    async def load_data(
+        self,
+        source: str | bytes,
+        section: int | str | None = None,
+        types: Dict | None = None,
+    ) -> DataFrame:
+        load = partial(self.importer.load_data, source, section, types)
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        async with semaphore:
+            return await loop.run_in_executor(self.executor, load)
+
+    async def load_all(
+        self,
+        jobs: Iterable[tuple[str | bytes, int | str | None]],
+        types: Dict | None = None,
+    ) -> list[DataFrame]:
+        """Load every (source, section) job concurrently.
+
+        :return: The DataFrames in the same order as the jobs.
+        """
+        loads = [self.load_data(source, section, types) for source, section in jobs]
+        return list(await asyncio.gather(*loads))
+
+    def shutdown(self) -> None:
+        """Release the executor if it was created by this importer."""
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Literal
+
+from src.protocols import ImporterHandler
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+def content_hash(source: str | bytes) -> str:
+    """SHA-256 of the source content, read in blocks when it is a file."""
+    if isinstance(source, bytes):
+        return hashlib.sha256(source).hexdigest()
+    digest = hashlib.sha256()
+    with open(source, "rb") as stream:
+        for block in iter(lambda: stream.read(1024**2), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CachedImporter:
+    """Wrap an `ImporterHandler` to keep the parsed DataFrames on disk.
+
+    Entries are keyed on the source fingerprint (content hash, or path, mtime
+    and size), the section, the types and the wrapped importer. The least
+    recently used entries are evicted when the cache grows over `max_size`
+    bytes. Sources that can't be fingerprinted (e.g. a Google Sheet title)
+    are always loaded by the wrapped importer.
+    """
+
+    DEFAULT_CACHE_DIR = Path(".cache/parsed_inputs")
+    DEFAULT_MAX_SIZE = 1024**3  # 1 GiB
+    ENTRY_SUFFIX = ".pickle"
+
+    def __init__(
+        self,
+        importer: ImporterHandler,
+        cache_dir: str | Path | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        key_by: Literal["content", "mtime"] = "content",
+    ):
+        if key_by not in ("content", "mtime"):
+            raise ValueError(f"Unknown cache key_by: '{key_by}'")
+
+        self.importer = importer
+        self.cache_dir = Path(cache_dir or self.DEFAULT_CACHE_DIR)
+        self.max_size = max_size
+        self.key_by = key_by
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def load_data(
+        self,
+        source: str | bytes,
+        section: int | str | None = None,
+        types: Dict | None = None,
+    ) -> DataFrame:
+        fingerprint = self._fingerprint(source)
+        if fingerprint is None:
+            return self.importer.load_data(source, section, types)
+
+        cache_key = self._cache_key(fingerprint, section, types)
+        entry = self.cache_dir / f"{cache_key}{self.ENTRY_SUFFIX}"
+        try:
+            data = self._read_entry(entry)
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+            pass
+        else:
+            self.hits += 1
+            self._touch(entry)
+            return data
+
+        self.misses += 1
+        data = self.importer.load_data(source, section, types)
+        return self._store(entry, data)
+
+    def clear(self) -> None:
+        for entry in self.cache_dir.glob(f"*{self.ENTRY_SUFFIX}"):
+            entry.unlink(missing_ok=True)
+
+    def _fingerprint(self, source: str | bytes) -> str | None:
+        if isinstance(source, bytes):
+            return content_hash(source)
+        if not os.path.isfile(source):
+            return None
+
+        if self.key_by == "mtime":
+            stat = os.stat(source)
+            return f"{os.path.abspath(source)}:{stat.st_mtime_ns}:{stat.st_size}"
+        return content_hash(source)
+
+    def _cache_key(
+        self, fingerprint: str, section: int | str | None, types: Dict | None
+    ) -> str:
+        importer_name = type(self.importer).__qualname__
+        key = repr((importer_name, fingerprint, section, types))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _store(self, entry: Path, data: DataFrame) -> DataFrame:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # A new temporary file by write, so concurrent writers of the same
+        # entry (threads or processes) never write into the same file
+        with tempfile.NamedTemporaryFile(
+            dir=self.cache_dir, prefix=f"{entry.stem}.", suffix=".tmp", delete=False
+        ) as stream:
+            tmp_entry = Path(stream.name)
+        try:
+            self._write_entry(tmp_entry, data)
+            os.replace(tmp_entry, entry)
+        except BaseException:
+            tmp_entry.unlink(missing_ok=True)
+            raise
+        self._touch(entry)
+        self._evict()
+        return data
+
+    def _read_entry(self, entry: Path) -> DataFrame:
+        with open(entry, "rb") as stream:
+            return pickle.load(stream)
+
+    def _write_entry(self, entry: Path, data: DataFrame) -> None:
+        with open(entry, "wb") as stream:
+            pickle.dump(data, stream, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _touch(self, entry: Path) -> None:
+        # The mtime is the LRU clock. Set explicitly, since the filesystem
+        # timestamps could be too coarse to order close accesses.
+        now = time.time_ns()
+        try:
+            os.utime(entry, ns=(now, now))
+        except FileNotFoundError:  # Evicted meanwhile by another writer
+            pass
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in self.cache_dir.glob(f"*{self.ENTRY_SUFFIX}"):
+            try:
+                entries.append((entry, entry.stat()))
+            except FileNotFoundError:  # Evicted meanwhile by another writer
+                continue
+        entries.sort(key=lambda item: item[1].st_mtime_ns)
+        total_size = sum(stat.st_size for _, stat in entries)
+        for entry, stat in entries:
+            if total_size <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= stat.st_size
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+from typing import NamedTuple, Sequence
+
+from numpy import (
+    array,
+    cumsum,
+    empty,
+    flatnonzero,
+    fromiter,
+    ndarray,
+    searchsorted,
+    unique,
+    zeros,
+)
+from pandas import DataFrame, Series, StringDtype
+from pandas.api.types import infer_dtype
+
+from src.validation_errors import (
+    INVALID_CHARACTER,
+    INVALID_FIRST_CHAR,
+    INVALID_LAST_CHAR,
+)
+
+INVALID_CHARACTERS: tuple[str, ...] = ("\t", "−", "–")
+INVALID_FIRST_AND_LAST_CHARACTERS: tuple[str, ...] = (" ", "\n")
+
+# The cells of a column are joined with this separator (not allowed in xlsx
+# cells) so the first/last characters rules become matches next to it.
+_CELL_SEPARATOR = "\0"
+_INVALID_CHARACTERS = "".join(map(re.escape, INVALID_CHARACTERS))
+_INVALID_EDGES = "".join(map(re.escape, INVALID_FIRST_AND_LAST_CHARACTERS))
+# Starting with a plain character class lets `re` skip ahead to the candidates
+INVALID_CELL_PATTERN = re.compile(
+    f"[{_INVALID_CHARACTERS}{_INVALID_EDGES}]"
+    f"(?:(?<=[{_INVALID_CHARACTERS}])"
+    f"|(?<={_CELL_SEPARATOR}[{_INVALID_EDGES}])"
+    f"|(?={_CELL_SEPARATOR}))"
+)
+
+BLANK_CELL_PATTERN = re.compile(f"{_CELL_SEPARATOR}(?=\\s*{_CELL_SEPARATOR})")
+
+
+def classify_cell_characters(value: str) -> str | None:
+    """Code of the first character rule broken by the value, if any."""
+    if not value:
+        return None
+    if any(element in value for element in INVALID_CHARACTERS):
+        return INVALID_CHARACTER
+    if value[0] in INVALID_FIRST_AND_LAST_CHARACTERS:
+        return INVALID_FIRST_CHAR
+    if value[-1] in INVALID_FIRST_AND_LAST_CHARACTERS:
+        return INVALID_LAST_CHAR
+    return None
+
+
+class StringCells(NamedTuple):
+    """The str cells of a column, joined once for the buffer scans.
+
+    :param positions: Positions of the str cells in the column, or None if
+        every cell is a str.
+    """
+
+    positions: ndarray | None
+    strings: list[str]
+    buffer: str
+
+
+def string_cells(content: Series) -> StringCells | None:
+    """The str cells of the column, None for numeric and datetime columns."""
+    if content.dtype.kind in "biufcmM":
+        return None
+
+    values = content.to_numpy(dtype="object")
+    if isinstance(content.dtype, StringDtype):
+        is_str = content.notna().to_numpy(dtype=bool)
+    else:
+        is_str = string_cells_mask(values)
+    if is_str is None or is_str.all():
+        strings = values.tolist()
+        return StringCells(None, strings, join_cells(strings))
+    strings = values[is_str].tolist()
+    return StringCells(flatnonzero(is_str), strings, join_cells(strings))
+
+
+def join_cells(strings: Sequence[str]) -> str:
+    """Buffer with every cell between separators, for the `*_PATTERN` scans."""
+    if len(strings) == 0:
+        return ""
+    return _CELL_SEPARATOR + _CELL_SEPARATOR.join(strings) + _CELL_SEPARATOR
+
+
+def split_cells(buffer: str) -> list[str]:
+    """The cells of a `join_cells` buffer."""
+    if not buffer:
+        return []
+    return buffer[1:-1].split(_CELL_SEPARATOR)
+
+
+def find_invalid_cells(strings: list[str], buffer: str | None = None) -> ndarray:
+    """Positions of the strings breaking any of the character rules.
+
+    The strings are joined into one buffer and scanned once with
+    `INVALID_CELL_PATTERN`, instead of checking every cell in Python.
+
+    :param buffer: The strings already joined by `join_cells`.
+    """
+    if buffer is None:
+        buffer = join_cells(strings)
+    matches = [match.start() for match in INVALID_CELL_PATTERN.finditer(buffer)]
+    if not matches:
+        return empty(0, dtype=int)
+
+    # Every match is a single character inside the cell it belongs to
+    lengths = fromiter(map(len, strings), int, len(strings))
+    cell_ends = cumsum(lengths + 1)
+    return unique(searchsorted(cell_ends, matches))
+
+
+def find_blank_cells(buffer: str) -> ndarray:
+    """Positions of the empty or whitespace-only cells of a `join_cells` buffer.
+
+    Like `find_invalid_cells`, the buffer is scanned once with a pattern, here
+    matching the separators followed only by whitespace up to the next one.
+    """
+    positions = []
+    cell, scanned = 0, 0
+    for match in BLANK_CELL_PATTERN.finditer(buffer):
+        # The cell of a match is the number of separators before it
+        cell += buffer.count(_CELL_SEPARATOR, scanned, match.start())
+        scanned = match.start()
+        positions.append(cell)
+    return array(positions, dtype=int)
+
+
+def string_cells_mask(values: ndarray) -> ndarray | None:
+    """Mask of the str values, or None if every value is a str."""
+    if infer_dtype(values, skipna=False) == "string":
+        return None
+    return fromiter((isinstance(value, str) for value in values), bool, len(values))
+
+
+def missing_values_mask(
+    data: DataFrame, cells: list[StringCells | None] | None = None
+) -> DataFrame:
+    """Mask the cells with None, NaN, NA or empty/whitespace-only strings.
+
+    :param cells: The `string_cells` of each column, if already built.
+    """
+    mask = empty((len(data), data.shape[1]), dtype=bool)
+    for position in range(data.shape[1]):
+        column_cells = None if cells is None else cells[position]
+        mask[:, position] = missing_values(data.iloc[:, position], column_cells)
+    return DataFrame(mask, index=data.index, columns=data.columns)
+
+
+def missing_values(content: Series, cells: StringCells | None = None) -> ndarray:
+    """Column version of `missing_values_mask`.
+
+    With the `string_cells` of the column, the blank cells are found in its
+    joined buffer. Otherwise the str cells are checked directly, since joining
+    them costs about as much as checking them.
+    """
+    if content.dtype.kind in "biufcmM":  # no strings to check
+        return content.isna().to_numpy(dtype=bool)
+
+    if cells is not None:
+        blank_cells = find_blank_cells(cells.buffer)
+        if cells.positions is None:
+            # Only str values, so there are no null values to look for
+            missing = zeros(len(content), dtype=bool)
+            missing[blank_cells] = True
+        else:
+            missing = content.isna().to_numpy(dtype=bool)
+            missing[cells.positions[blank_cells]] = True
+        return missing
+
+    values = content.to_numpy(dtype="object")
+    if isinstance(content.dtype, StringDtype):
+        is_str = content.notna().to_numpy(dtype=bool)
+    else:
+        is_str = string_cells_mask(values)
+    strings = values if is_str is None else values[is_str]
+    blank = strings == ""
+    blank[~blank] = fromiter(map(str.isspace, strings[~blank]), bool)
+    if is_str is None:
+        # Only str values, so there are no null values to look for
+        return blank
+    missing = content.isna().to_numpy(dtype=bool)
+    missing[is_str] |= blank
+    return missing
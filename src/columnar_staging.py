@@ -0,0 +1,776 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""On-disk columnar staging of the imported DataFrames.
+
+A staging file holds each column as contiguous buffers, so it can be opened
+again (e.g. after a crash, or from another process) without re-parsing the
+source, and its buffers are memory-mapped instead of read: every process
+opening the file shares the same pages.
+
+With the optional `pyarrow` (see requirements-parquet.txt) the files are
+uncompressed Arrow IPC (Feather v2) files. Without it they fall back to a
+layout of the same buffers: the magic, the column buffers aligned to 64
+bytes, a JSON footer describing them, the footer length (uint64) and the
+magic again. `read_columnar` opens both. Nothing is pickled, so opening a
+staging file never runs code from the cache dir.
+
+The object columns mixing cell types, like the raw cells of a sheet, are
+stored as the type code of each cell and a typed array of the cells of each
+type, see `_split_cells`.
+
+Only the numpy dtype columns (and `string[pyarrow]` from a Feather file) are
+read as views of the mapped buffers. The other columns are rebuilt in memory
+from them, the object and `string[python]` ones cell by cell.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import math
+import struct
+import warnings
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+from pandas import (
+    BooleanDtype,
+    Categorical,
+    CategoricalDtype,
+    DataFrame,
+    DatetimeIndex,
+    DatetimeTZDtype,
+    Index,
+    MultiIndex,
+    RangeIndex,
+    Series,
+    StringDtype,
+    Timestamp,
+    array,
+)
+from pandas.api.extensions import ExtensionDtype
+from pandas.api.types import infer_dtype, pandas_dtype
+from pandas.arrays import BooleanArray, FloatingArray, IntegerArray
+from pandas.errors import OutOfBoundsDatetime
+
+from src.cached_importer import CachedImporter
+
+MAGIC = b"LTCOLS2\0"
+ARROW_MAGIC = b"ARROW1"
+_ARROW_METADATA = b"load_transmuter"
+_ALIGNMENT = 64
+_FOOTER_LENGTH = struct.Struct("<Q")
+_ARRAY_KINDS = "biufcmM"
+# Null codes of the string cells, the kind of null is kept on object columns
+_NOT_NULL, _NONE, _NAN = 0, 1, 2
+_CELL_SEPARATOR = "\0"
+# Type codes of the mixed cells, by exact type (e.g. a bool isn't an int). The
+# cells of each type are stored together in a typed array, see `_split_cells`
+_CELL_STR, _CELL_INT, _CELL_FLOAT, _CELL_BOOL, _CELL_NONE = 0, 1, 2, 3, 4
+_CELL_DATETIME, _CELL_DATE, _CELL_TEXT = 5, 6, 7
+_CELL_CODES = {
+    str: _CELL_STR,
+    int: _CELL_INT,
+    float: _CELL_FLOAT,
+    bool: _CELL_BOOL,
+    type(None): _CELL_NONE,
+    datetime.datetime: _CELL_DATETIME,
+    datetime.date: _CELL_DATE,
+    Timestamp: _CELL_TEXT,
+    datetime.time: _CELL_TEXT,
+}
+_CELL_DTYPES = {
+    _CELL_FLOAT: "float64",
+    _CELL_BOOL: "bool",
+    _CELL_DATETIME: "datetime64[us]",
+    _CELL_DATE: "datetime64[D]",
+}
+_ZONED_CELL_TYPES = {datetime.datetime, Timestamp, datetime.time}
+_TEXT_CELL_TYPES = {"i": int, "T": Timestamp, "t": datetime.time.fromisoformat}
+
+
+def unsupported_columns(data: DataFrame) -> list:
+    """Labels of the columns that can't be staged, see `write_columnar`."""
+    return [label for label, column in data.items() if _column_kind(column) is None]
+
+
+def write_columnar(
+    data: DataFrame, path: str | Path, use_arrow: bool | None = None
+) -> None:
+    """Write the DataFrame as a staging file.
+
+    Supported columns are numpy dtypes, stored as they are, the masked
+    extension dtypes (e.g. `Int64`, `boolean`), stored as their values and
+    mask, strings (object columns of str and the `string` dtypes), stored as
+    their UTF-8 text, categories, datetimes with a timezone, and object
+    columns mixing str, numbers, bools, None and naive dates and times. Any
+    other column (e.g. of dicts) raises a ValueError, see
+    `unsupported_columns`. The labels and attrs must be JSON values.
+
+    :param use_arrow: Write a Feather file, or the fallback layout if False.
+        Defaults to Feather when pyarrow is installed.
+    """
+    kinds = [_column_kind(column) for _, column in data.items()]
+    unsupported = [label for label, kind in zip(data.columns, kinds) if not kind]
+    if unsupported:
+        raise ValueError(f"Can't stage the column(s) {unsupported} as buffers")
+    if isinstance(data.index, MultiIndex):
+        raise ValueError("Can't stage a MultiIndex as buffers")
+    _check_json_labels([*data.columns, data.index.name])
+    try:
+        attrs = json.loads(json.dumps(data.attrs))
+    except TypeError as err:
+        raise ValueError("Can't stage the DataFrame attrs as JSON", err)
+
+    index = None
+    if not data.index.equals(RangeIndex(len(data))):
+        index = Series(data.index, copy=False)
+        if _column_kind(index) is None:
+            raise ValueError(f"Can't stage the index {data.index.dtype} as buffers")
+
+    if use_arrow is None:
+        use_arrow = find_spec("pyarrow") is not None
+    write = _write_arrow if use_arrow else _write_buffers
+    write(data, path, kinds, index, attrs)
+
+
+def read_columnar(path: str | Path) -> DataFrame:
+    """Open a staging file as a DataFrame.
+
+    The numpy columns without nulls are read-only views of the memory-mapped
+    file, so they are not loaded until used, and so are the `string[pyarrow]`
+    columns of a Feather file. In the fallback layout the values and mask of
+    the masked columns and the category codes are views too. The object,
+    `string[python]` and mixed columns need a Python object by cell, so they
+    are always built on read.
+    """
+    with open(path, "rb") as stream:
+        magic = stream.read(len(MAGIC))
+    if magic.startswith(ARROW_MAGIC):
+        return _read_arrow(path)
+    return _read_buffers(path)
+
+
+def _check_json_labels(labels: list) -> None:
+    for label in labels:
+        if type(label) not in (str, int, float, bool, type(None)):
+            raise ValueError(f"Can't stage the label {label!r}, it isn't a JSON value")
+
+
+def _frame(
+    values: list, footer: dict[str, Any], index_values: Any | None
+) -> DataFrame:
+    """The DataFrame of the staged columns, by position since labels can repeat."""
+    index = None
+    if footer["index"] is not None:
+        dtype = index_values.dtype
+        index = Index(index_values, dtype, name=footer["index"]["name"], copy=False)
+    # With their dtype, or object columns of dates would be parsed as datetimes
+    columns = {
+        position: Series(column, index, column.dtype, copy=False)
+        for position, column in enumerate(values)
+    }
+    output = DataFrame(columns, index=index, copy=False)
+    output.columns = Index([column["name"] for column in footer["columns"]])
+    if not values:
+        output.index = index if index is not None else RangeIndex(footer["rows"])
+    output.attrs = footer["attrs"]
+    return output
+
+
+def _write_arrow(
+    data: DataFrame,
+    path: str | Path,
+    kinds: list[str],
+    index: Series | None,
+    attrs: dict,
+) -> None:
+    import pyarrow
+    from pyarrow import feather
+
+    arrow_arrays = []
+    columns = []
+    try:
+        for (name, values), kind in zip(data.items(), kinds):
+            arrow_array, column = _arrow_column(values, kind)
+            arrow_arrays.append(arrow_array)
+            columns.append({"name": name, **column})
+        index_column = None
+        if index is not None:
+            arrow_array, column = _arrow_column(index, _column_kind(index))
+            arrow_arrays.append(arrow_array)
+            index_column = {"name": data.index.name, **column}
+
+        footer = {
+            "rows": len(data),
+            "index": index_column,
+            "columns": columns,
+            "attrs": attrs,
+        }
+        # Positional names, the labels can repeat or not be str
+        names = [str(position) for position in range(len(arrow_arrays))]
+        metadata = {_ARROW_METADATA: json.dumps(footer)}
+        table = pyarrow.table(arrow_arrays, names=names, metadata=metadata)
+        # Uncompressed and in a single batch, so each column is one mapped buffer
+        feather.write_feather(
+            table, str(path), compression="uncompressed", chunksize=max(len(data), 1)
+        )
+    except pyarrow.ArrowException as err:  # e.g. complex numbers
+        raise ValueError("Can't stage the DataFrame as a Feather file", err)
+
+
+def _read_arrow(path: str | Path) -> DataFrame:
+    try:
+        import pyarrow
+        from pyarrow import feather
+    except ImportError as err:
+        msg = f"'{path}' is a Feather staging file, opening it requires pyarrow"
+        raise ValueError(msg) from err
+
+    try:
+        table = feather.read_table(str(path), memory_map=True)
+        footer = json.loads(table.schema.metadata[_ARROW_METADATA])
+    except (pyarrow.ArrowException, KeyError, TypeError) as err:
+        raise ValueError(f"'{path}' is not a columnar staging file", err)
+
+    arrow_columns = table.columns
+    values = [
+        _read_arrow_column(arrow_columns[position], column)
+        for position, column in enumerate(footer["columns"])
+    ]
+    index_values = None
+    if footer["index"] is not None:
+        index_values = _read_arrow_column(arrow_columns[-1], footer["index"])
+    return _frame(values, footer, index_values)
+
+
+def _write_buffers(
+    data: DataFrame,
+    path: str | Path,
+    kinds: list[str],
+    index: Series | None,
+    attrs: dict,
+) -> None:
+    columns = []
+    with open(path, "wb") as stream:
+        stream.write(MAGIC)
+        for (name, values), kind in zip(data.items(), kinds):
+            columns.append({"name": name, **_write_column(stream, values, kind)})
+        index_column = None
+        if index is not None:
+            column = _write_column(stream, index, _column_kind(index))
+            index_column = {"name": data.index.name, **column}
+
+        footer = {
+            "rows": len(data),
+            "index": index_column,
+            "columns": columns,
+            "attrs": attrs,
+        }
+        footer_bytes = json.dumps(footer).encode()
+        stream.write(footer_bytes)
+        stream.write(_FOOTER_LENGTH.pack(len(footer_bytes)))
+        stream.write(MAGIC)
+
+
+def _read_buffers(path: str | Path) -> DataFrame:
+    mapped = np.memmap(path, dtype=np.uint8, mode="r")
+    tail = len(MAGIC) + _FOOTER_LENGTH.size
+    if len(mapped) < len(MAGIC) + tail or (
+        bytes(mapped[: len(MAGIC)]) != MAGIC or bytes(mapped[-len(MAGIC) :]) != MAGIC
+    ):
+        raise ValueError(f"'{path}' is not a columnar staging file")
+
+    (footer_length,) = _FOOTER_LENGTH.unpack(bytes(mapped[-tail : -len(MAGIC)]))
+    footer_end = len(mapped) - tail
+    footer = json.loads(bytes(mapped[footer_end - footer_length : footer_end]))
+
+    values = [_read_column(mapped, column) for column in footer["columns"]]
+    index_values = None
+    if footer["index"] is not None:
+        index_values = _read_column(mapped, footer["index"])
+    return _frame(values, footer, index_values)
+
+
+def _column_kind(column: Series) -> str | None:
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in _ARRAY_KINDS:
+            return "array"
+        if infer_dtype(column, skipna=True) in ("string", "empty"):
+            return "string"
+        # e.g. the raw cells of a sheet
+        return "mixed" if _are_mixed_cells(column.to_numpy()) else None
+    if isinstance(column.array, (IntegerArray, FloatingArray, BooleanArray)):
+        return "masked"
+    if isinstance(dtype, StringDtype):
+        return "string"
+    if isinstance(dtype, CategoricalDtype):
+        categories = Series(dtype.categories, copy=False)
+        return "category" if _column_kind(categories) is not None else None
+    if isinstance(dtype, DatetimeTZDtype):
+        # e.g. a fixed offset from `to_datetime`, which can be parsed back
+        return "datetimetz" if _round_trips(dtype) else None
+    return None
+
+
+def _is_nan(value: Any) -> bool:
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _are_mixed_cells(values: np.ndarray) -> bool:
+    cell_types = set(map(type, values))
+    if not cell_types <= _CELL_CODES.keys():
+        return False
+    if cell_types.isdisjoint(_ZONED_CELL_TYPES):
+        return True
+    zoned = (value for value in values if type(value) in _ZONED_CELL_TYPES)
+    return all(value.tzinfo is None for value in zoned)
+
+
+def _split_cells(values: np.ndarray) -> tuple[np.ndarray, dict[int, np.ndarray]]:
+    """The type code of each mixed cell and the cells of each code.
+
+    The cells of a code are a typed array (e.g. int64 or datetime64[us]), or
+    an object array of str for the str cells and the cells stored as text,
+    see `_tag_cell`. The None cells only have their code.
+    """
+    cell_codes = map(_CELL_CODES.__getitem__, map(type, values))
+    codes = np.fromiter(cell_codes, np.uint8, len(values))
+    groups = {}
+    ints = codes == _CELL_INT
+    if ints.any():
+        try:
+            groups[_CELL_INT] = np.array(values[ints].tolist(), dtype=np.int64)
+        except OverflowError:  # Python ints beyond int64
+            codes[ints] = _CELL_TEXT
+
+    for code in np.unique(codes).tolist():
+        if code in groups or code == _CELL_NONE:
+            continue
+        cells = values[codes == code]
+        if code == _CELL_TEXT:
+            cells = np.array([_tag_cell(value) for value in cells], dtype=object)
+        elif code in (_CELL_DATETIME, _CELL_DATE):
+            cells = _datetime_cells(cells, _CELL_DTYPES[code])
+        elif code != _CELL_STR:
+            cells = cells.astype(_CELL_DTYPES[code])
+        groups[code] = cells
+    return codes, groups
+
+
+def _datetime_cells(cells: np.ndarray, dtype: str) -> np.ndarray:
+    # Parsed by pandas, about 10x faster than numpy from the objects
+    try:
+        return DatetimeIndex(cells).to_numpy().astype(dtype)
+    except OutOfBoundsDatetime:  # Before 1677 or after 2262 in ns
+        return cells.astype(dtype)
+
+
+def _join_cells(codes: np.ndarray, groups: dict[int, np.ndarray]) -> np.ndarray:
+    """The mixed cells of `_split_cells` back in a single object array."""
+    values = np.full(len(codes), None, dtype=object)
+    for code, cells in groups.items():
+        if code == _CELL_TEXT:
+            values[codes == code] = [_untag_cell(cell) for cell in cells]
+        else:  # As Python objects, e.g. datetime64[D] as dates
+            values[codes == code] = cells.tolist()
+    return values
+
+
+def _tag_cell(value: Any) -> str:
+    """A cell without a typed array as text, prefixed with the tag of its type.
+
+    The timestamps and times are in ISO format, so they are read back as
+    equal values of the same type.
+    """
+    if type(value) is int:
+        return f"i{value}"
+    if type(value) is Timestamp:
+        return f"T{value.isoformat()}"
+    return f"t{value.isoformat()}"
+
+
+def _untag_cell(cell: str) -> Any:
+    return _TEXT_CELL_TYPES[cell[0]](cell[1:])
+
+
+def _round_trips(dtype: ExtensionDtype) -> bool:
+    try:
+        return pandas_dtype(str(dtype)) == dtype
+    except TypeError:
+        return False
+
+
+def _write_column(stream: BinaryIO, column: Series, kind: str) -> dict[str, Any]:
+    if kind == "array":
+        values = np.ascontiguousarray(column.to_numpy())
+        return {"kind": kind, **_write_array(stream, values)}
+
+    dtype = column.dtype
+    if kind == "masked":
+        numpy_dtype = dtype.numpy_dtype  # type: ignore[union-attr]
+        na_value = False if isinstance(dtype, BooleanDtype) else 0
+        return {
+            "kind": kind,
+            "dtype": dtype.name,
+            "values": _write_array(
+                stream, column.to_numpy(dtype=numpy_dtype, na_value=na_value)
+            ),
+            "mask": _write_array(stream, column.isna().to_numpy()),
+        }
+
+    if kind == "string":
+        dtype_name = _string_dtype_name(dtype)
+        # The arrow strings are views of the text and offsets buffers
+        contiguous = dtype_name == "string[pyarrow]"
+        return {
+            "kind": kind,
+            "dtype": dtype_name,
+            **_write_strings(stream, column, contiguous),
+        }
+
+    if kind == "category":
+        categorical = column.array
+        categories = Series(dtype.categories, copy=False)  # type: ignore[union-attr]
+        return {
+            "kind": kind,
+            "ordered": bool(dtype.ordered),  # type: ignore[union-attr]
+            "codes": _write_array(stream, np.asarray(categorical.codes)),
+            "categories": _write_column(stream, categories, _column_kind(categories)),
+        }
+
+    if kind == "datetimetz":
+        utc_values = column.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+        location = _write_array(stream, utc_values)
+        return {"kind": kind, "tz_dtype": str(dtype), **location}
+
+    if kind == "mixed":
+        codes, groups = _split_cells(column.to_numpy())
+        locations = {}
+        for code, cells in groups.items():
+            if cells.dtype == object:
+                strings = Series(cells, dtype=object, copy=False)
+                location = _write_strings(stream, strings, contiguous=False)
+                locations[code] = {"kind": "string", "dtype": "object", **location}
+            else:
+                locations[code] = {"kind": "array", **_write_array(stream, cells)}
+        return {"kind": kind, "codes": _write_array(stream, codes), "groups": locations}
+
+    raise ValueError(f"Can't stage the column {column.name!r} as buffers")
+
+
+def _string_dtype_name(dtype: np.dtype | ExtensionDtype) -> str:
+    if isinstance(dtype, StringDtype):
+        return f"string[{dtype.storage}]"
+    return "object"
+
+
+def _write_strings(
+    stream: BinaryIO, column: Series, contiguous: bool
+) -> dict[str, Any]:
+    """The UTF-8 text, byte offsets and null codes of the string cells.
+
+    Unless `contiguous`, the cells are separated by "\\0" instead, if none of
+    them has it, so they are split in one call on read instead of sliced.
+    """
+    values = column.to_numpy(dtype=object)
+    nulls = np.zeros(len(values), dtype=np.uint8)
+    strings = []
+    for position, value in enumerate(values):
+        if isinstance(value, str):
+            strings.append(value)
+        else:
+            nulls[position] = _NAN if _is_nan(value) else _NONE
+            strings.append("")
+
+    text = "".join(strings)
+    if not contiguous and _CELL_SEPARATOR not in text:
+        return {
+            "nulls": _write_array(stream, nulls),
+            **_write_buffer(stream, _CELL_SEPARATOR.join(strings).encode()),
+        }
+
+    encoded = text.encode()
+    if len(encoded) == len(text):  # ASCII, one byte by character
+        lengths = np.fromiter(map(len, strings), np.int64, len(strings))
+    else:
+        lengths = np.fromiter(
+            (len(value.encode()) for value in strings), np.int64, len(strings)
+        )
+    offsets = np.zeros(len(strings) + 1, dtype="<i8")
+    np.cumsum(lengths, out=offsets[1:])
+    return {
+        "nulls": _write_array(stream, nulls),
+        "offsets": _write_array(stream, offsets),
+        **_write_buffer(stream, encoded),
+    }
+
+
+def _write_array(stream: BinaryIO, values: np.ndarray) -> dict[str, Any]:
+    return {"dtype": values.dtype.str, **_write_buffer(stream, values)}
+
+
+def _write_buffer(stream: BinaryIO, buffer: bytes | np.ndarray) -> dict[str, int]:
+    if isinstance(buffer, np.ndarray):
+        buffer = buffer.view(np.uint8)  # datetimes don't support the buffer protocol
+    padding = -stream.tell() % _ALIGNMENT
+    stream.write(b"\0" * padding)
+    offset = stream.tell()
+    stream.write(buffer)
+    return {"offset": offset, "nbytes": stream.tell() - offset}
+
+
+def _buffer(mapped: np.memmap, location: dict[str, int]) -> np.memmap:
+    start = location["offset"]
+    return mapped[start : start + location["nbytes"]]
+
+
+def _array(mapped: np.memmap, location: dict[str, Any]) -> np.ndarray:
+    return _buffer(mapped, location).view(location["dtype"], np.ndarray)
+
+
+def _read_column(mapped: np.memmap, column: dict[str, Any]) -> Any:
+    kind = column["kind"]
+    if kind == "array":
+        return _array(mapped, column)
+
+    if kind == "masked":
+        array_type = pandas_dtype(column["dtype"]).construct_array_type()
+        values = _array(mapped, column["values"])
+        return array_type(values, _array(mapped, column["mask"]))
+
+    if kind == "string":
+        return _read_strings(mapped, column)
+
+    if kind == "category":
+        categories = Index(_read_column(mapped, column["categories"]), copy=False)
+        dtype = CategoricalDtype(categories, column["ordered"])
+        return Categorical.from_codes(_array(mapped, column["codes"]), dtype=dtype)
+
+    if kind == "datetimetz":
+        dtype = pandas_dtype(column["tz_dtype"])
+        utc_values = DatetimeIndex(_array(mapped, column)).tz_localize("UTC")
+        return utc_values.tz_convert(dtype.tz).array  # type: ignore[attr-defined]
+
+    if kind == "mixed":
+        groups = {
+            int(code): _read_column(mapped, location)
+            for code, location in column["groups"].items()
+        }
+        return _join_cells(_array(mapped, column["codes"]), groups)
+
+    raise ValueError(f"Unknown staged column kind '{kind}'")
+
+
+def _read_strings(mapped: np.memmap, column: dict[str, Any]) -> Any:
+    encoded = _buffer(mapped, column)
+    nulls = _array(mapped, column["nulls"])
+    if "offsets" not in column:  # separated cells, see `_write_strings`
+        text = encoded.tobytes().decode()
+        cells = text.split(_CELL_SEPARATOR) if len(nulls) else []
+    else:
+        offsets = _array(mapped, column["offsets"])
+        if column["dtype"] == "string[pyarrow]" and find_spec("pyarrow"):
+            return _arrow_strings(encoded, offsets, nulls)
+        cells = _slice_cells(encoded, offsets)
+
+    values = np.empty(len(cells), dtype=object)
+    values[:] = cells
+    if column["dtype"] != "object":
+        values[nulls != _NOT_NULL] = None
+        return array(values, dtype=column["dtype"])
+    values[nulls == _NONE] = None
+    values[nulls == _NAN] = np.nan
+    return values
+
+
+def _slice_cells(encoded: np.ndarray, offsets: np.ndarray) -> list[str]:
+    text = encoded.tobytes().decode()
+    bounds = offsets.tolist()
+    if len(text) == len(encoded):  # ASCII, the byte offsets are char offsets
+        return [text[start:end] for start, end in zip(bounds, bounds[1:])]
+    raw = encoded.tobytes()
+    return [raw[start:end].decode() for start, end in zip(bounds, bounds[1:])]
+
+
+def _arrow_strings(encoded: np.ndarray, offsets: np.ndarray, nulls: np.ndarray) -> Any:
+    """`string[pyarrow]` array over the mapped text and offsets buffers."""
+    import pyarrow
+    from pandas.arrays import ArrowStringArray
+
+    valid = nulls == _NOT_NULL
+    validity = pyarrow.py_buffer(np.packbits(valid, bitorder="little"))
+    strings = pyarrow.LargeStringArray.from_buffers(
+        len(nulls),
+        pyarrow.py_buffer(offsets),
+        pyarrow.py_buffer(encoded),
+        validity,
+        int(len(nulls) - valid.sum()),
+    )
+    return ArrowStringArray(pyarrow.chunked_array([strings]))
+
+
+def _arrow_column(column: Series, kind: str) -> tuple[Any, dict[str, Any]]:
+    """The column as an Arrow array and its description for the footer."""
+    import pyarrow
+
+    dtype = column.dtype
+    if kind == "array":
+        # NaN stays a float, it isn't converted to an Arrow null
+        values = np.ascontiguousarray(column.to_numpy())
+        return pyarrow.array(values), {"kind": kind, "dtype": values.dtype.str}
+
+    if kind == "string" and isinstance(dtype, StringDtype):
+        arrow_array = pyarrow.array(column.array, type=pyarrow.large_string())
+        return arrow_array, {"kind": kind, "dtype": _string_dtype_name(dtype)}
+
+    if kind == "string":
+        values = column.to_numpy()
+        null_kinds = {_is_nan(value) for value in values if not isinstance(value, str)}
+        if len(null_kinds) < 2:
+            # Arrow has a single null, so only the columns of a single kind
+            nulls = "nan" if True in null_kinds else "none"
+            strings = pyarrow.array(values, pyarrow.large_string(), from_pandas=True)
+            return strings, {"kind": kind, "dtype": "object", "nulls": nulls}
+        kind = "mixed"
+
+    if kind == "mixed":
+        return _arrow_mixed_cells(column.to_numpy()), {"kind": kind}
+
+    if kind == "masked":
+        return pyarrow.array(column.array), {"kind": kind, "dtype": dtype.name}
+
+    if kind == "category":
+        return pyarrow.array(column.array), {"kind": kind}
+
+    if kind == "datetimetz":
+        return pyarrow.array(column.array), {"kind": kind, "tz_dtype": str(dtype)}
+
+    raise ValueError(f"Can't stage the column {column.name!r} as buffers")
+
+
+def _read_arrow_column(chunked: Any, column: dict[str, Any]) -> Any:
+    kind = column["kind"]
+    if kind == "array":
+        if chunked.num_chunks == 1:  # a view of the mapped buffer if possible
+            values = chunked.chunk(0).to_numpy(zero_copy_only=False)
+        else:
+            values = chunked.to_numpy()
+        return values.astype(column["dtype"], copy=False)
+
+    if kind == "string" and column["dtype"] == "string[pyarrow]":
+        from pandas.arrays import ArrowStringArray
+
+        return ArrowStringArray(chunked)
+
+    if kind == "string" and column["dtype"] != "object":
+        return pandas_dtype(column["dtype"]).__from_arrow__(chunked)
+
+    if kind == "string":
+        values = chunked.to_numpy()
+        if column["nulls"] == "nan":
+            values[chunked.is_null().to_numpy()] = np.nan
+        return values
+
+    if kind == "mixed":
+        return _read_arrow_mixed_cells(chunked)
+
+    if kind == "masked":
+        return pandas_dtype(column["dtype"]).__from_arrow__(chunked)
+
+    if kind == "category":
+        return chunked.to_pandas().array
+
+    if kind == "datetimetz":
+        return pandas_dtype(column["tz_dtype"]).__from_arrow__(chunked)
+
+    raise ValueError(f"Unknown staged column kind '{kind}'")
+
+
+def _arrow_mixed_cells(values: np.ndarray) -> Any:
+    """The mixed cells as an Arrow dense union, with a child by cell type."""
+    import pyarrow
+
+    codes, groups = _split_cells(values)
+    type_codes = np.unique(codes).tolist()
+    children = []
+    offsets = np.empty(len(codes), dtype=np.int32)
+    for code in type_codes:
+        cells = codes == code
+        count = int(cells.sum())
+        offsets[cells] = np.arange(count, dtype=np.int32)
+        if code == _CELL_NONE:
+            children.append(pyarrow.nulls(count))
+        elif code in (_CELL_STR, _CELL_TEXT):
+            children.append(pyarrow.array(groups[code], pyarrow.large_string()))
+        else:
+            children.append(pyarrow.array(groups[code]))
+    return pyarrow.UnionArray.from_dense(
+        pyarrow.array(codes.astype(np.int8)),
+        pyarrow.array(offsets),
+        children,
+        [str(code) for code in type_codes],
+        type_codes,
+    )
+
+
+def _read_arrow_mixed_cells(chunked: Any) -> np.ndarray:
+    import pyarrow
+
+    if chunked.num_chunks == 1:
+        union = chunked.chunk(0)
+    else:
+        union = pyarrow.concat_arrays(chunked.chunks)
+    groups = {
+        code: union.field(position).to_numpy(zero_copy_only=False)
+        for position, code in enumerate(union.type.type_codes)
+        if code != _CELL_NONE
+    }
+    return _join_cells(union.type_codes.to_numpy(), groups)
+
+
+class StagedImporter(CachedImporter):
+    """Wrap an `ImporterHandler` to stage the parsed DataFrames as columnar files.
+
+    Like `CachedImporter`, but the entries are columnar staging files opened
+    as memory-mapped DataFrames (see `read_columnar`). Other processes can
+    open the same entry, found with `staging_file`, to share its pages
+    instead of receiving copies of the data.
+    """
+
+    DEFAULT_CACHE_DIR = Path(".cache/staged_inputs")
+    ENTRY_SUFFIX = ".columns"
+
+    def staging_file(
+        self,
+        source: str | bytes,
+        section: int | str | None = None,
+        types: dict | None = None,
+    ) -> Path | None:
+        """Path of the staged entry of the source, or None if not staged."""
+        fingerprint = self._fingerprint(source)
+        if fingerprint is None:
+            return None
+        cache_key = self._cache_key(fingerprint, section, types)
+        entry = self.cache_dir / f"{cache_key}{self.ENTRY_SUFFIX}"
+        return entry if entry.is_file() else None
+
+    def _read_entry(self, entry: Path) -> DataFrame:
+        return read_columnar(entry)
+
+    def _write_entry(self, entry: Path, data: DataFrame) -> None:
+        write_columnar(data, entry)
+
+    def _store(self, entry: Path, data: DataFrame) -> DataFrame:
+        try:
+            super()._store(entry, data)
+        except ValueError as err:  # e.g. cells of unsupported types
+            msg = f"The imported data can't be staged, it is imported every time: {err}"
+            warnings.warn(msg, RuntimeWarning, stacklevel=3)
+            return data
+        # Hand out the mapped entry, so the parsed copy can be released
+        return read_columnar(entry) if entry.is_file() else data
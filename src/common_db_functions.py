@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from typing import Any, Iterable, Iterator, NamedTuple
+
+import numpy as np
+from pandas import DataFrame, NaT, Series, Timestamp
+from pandas.api.types import infer_dtype
+from pandas.util import hash_pandas_object
+
+
+class ResourceDelta(NamedTuple):
+    """Changes needed to make the DB records match the input data."""
+
+    inserts: DataFrame
+    updates: DataFrame
+    deletes: DataFrame
+
+    @property
+    def changed_rows(self) -> int:
+        return len(self.inserts) + len(self.updates) + len(self.deletes)
+
+
+def quote_identifier(name: str) -> str:
+    escaped_name = str(name).replace('"', '""')
+    return f'"{escaped_name}"'
+
+
+def iter_parameter_batches(
+    data: DataFrame, batch_size: int
+) -> Iterator[Iterable[tuple]]:
+    """Yield the DataFrame rows as executemany parameters, `batch_size` at a time.
+
+    Each column slice is converted to native Python values at once (see
+    `to_parameter_values`) and the rows are zipped lazily, so the driver
+    consumes them without a list of per-row tuples being built for the whole
+    DataFrame.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+
+    for start in range(0, len(data), batch_size):
+        batch = data.iloc[start : start + batch_size]
+        columns = [to_parameter_values(batch[label]) for label in batch.columns]
+        yield zip(*columns)
+
+
+def to_parameter_values(column: Series) -> list:
+    """Values of the column as native Python objects accepted by the DB drivers.
+
+    Missing values (NaN, NA, NaT) are sent as None and timestamps as ISO
+    strings, the same text the sqlite3 datetime adapter writes.
+    """
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "iub":
+        # numpy ints and bools can't have missing values
+        return column.tolist()
+
+    values = column.to_numpy(dtype=object, na_value=None)
+    if infer_dtype(values, skipna=True) not in _NATIVE_INFERRED_TYPES:
+        return [_to_parameter(value) for value in values]
+    return values.tolist()
+
+
+def compute_resource_delta(
+    input_data: DataFrame, db_data: DataFrame, key_columns: list[str]
+) -> ResourceDelta:
+    """Work out the inserts, updates and deletes from db_data to input_data.
+
+    Rows are matched by the hash of their key columns and compared by the
+    hash of the remaining shared columns, so the whole diff is done with
+    vectorized hashing and merges. Both sides are hashed as the values sent
+    to the DB (see `to_parameter_values`) with the numbers as floats, so e.g.
+    `2` from an Int64 input column matches the `2.0` read back from the DB.
+
+    :return: The input rows to insert and update, and the DB keys to delete.
+    """
+    available_columns = set(input_data.columns) & set(db_data.columns)
+    missing_keys = set(key_columns) - available_columns
+    if missing_keys or not key_columns:
+        raise ValueError(f"Missing key column(s) for the delta: {missing_keys}")
+
+    value_columns = [
+        label
+        for label in input_data.columns
+        if label not in key_columns and label in available_columns
+    ]
+    input_hashes = DataFrame(
+        {
+            "key": _hash_rows(input_data, key_columns),
+            "value": _hash_rows(input_data, value_columns),
+            "position": range(len(input_data)),
+        }
+    )
+    db_hashes = DataFrame(
+        {
+            "key": _hash_rows(db_data, key_columns),
+            "value": _hash_rows(db_data, value_columns),
+            "position": range(len(db_data)),
+        }
+    )
+    matched = input_hashes.merge(db_hashes, on="key", suffixes=("", "_db"))
+    changed = matched.loc[matched["value"] != matched["value_db"], "position"]
+    inserted = ~input_hashes["key"].isin(db_hashes["key"])
+    deleted = ~db_hashes["key"].isin(input_hashes["key"])
+
+    inserts = input_data.iloc[input_hashes.loc[inserted, "position"]]
+    updates = input_data.iloc[changed]
+    deletes = db_data.iloc[db_hashes.loc[deleted, "position"]]
+    return ResourceDelta(inserts, updates, deletes[key_columns])
+
+
+def _hash_rows(data: DataFrame, columns: list[str]) -> Series:
+    if not columns:
+        return Series(0, index=range(len(data)), dtype="uint64")
+    normalized = DataFrame(
+        {
+            position: _hash_values(data[label])
+            for position, label in enumerate(columns)
+        }
+    )
+    return hash_pandas_object(normalized, index=False)
+
+
+def _hash_values(column: Series) -> np.ndarray:
+    """Values of the column as stored in the DB, comparable between dtypes.
+
+    Numbers are compared as float64 and the rest as their DB parameters,
+    with every missing value as the same sentinel.
+    """
+    if column.dtype.kind in "iufb":
+        return column.to_numpy(dtype="float64", na_value=np.nan)
+
+    values = np.empty(len(column), dtype=object)
+    values[:] = to_parameter_values(column)
+    missing = np.equal(values, None)
+    inferred_type = infer_dtype(values, skipna=True)
+    if inferred_type in _NUMERIC_INFERRED_TYPES:
+        numbers = np.full(len(values), np.nan)
+        numbers[~missing] = values[~missing].astype("float64")
+        return numbers
+    if inferred_type not in _NATIVE_INFERRED_TYPES:
+        values = np.array([_hash_value(value) for value in values], dtype=object)
+    values[missing] = _MISSING_HASH_VALUE
+    return values
+
+
+# Values of these inferred types are taken as-is by the DB drivers
+_NATIVE_INFERRED_TYPES = {"empty", "string", "bytes", "floating", "integer", "boolean"}
+
+
+def _to_parameter(value: Any) -> Any:
+    if value is NaT:
+        return None
+    if isinstance(value, Timestamp):
+        return value.isoformat(" ")
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+# Every missing value (None, NaN, NA, NaT) is hashed as this one, or as NaN
+# in the numeric columns
+_MISSING_HASH_VALUE = "\0<NA>"
+_NUMERIC_INFERRED_TYPES = {
+    "empty",
+    "integer",
+    "floating",
+    "mixed-integer-float",
+    "boolean",
+}
+
+
+def _hash_value(value: Any) -> Any:
+    if isinstance(value, (bool, int, float)):
+        return float(value)
+    return value
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import datetime
+from importlib.util import find_spec
+from typing import Any, Dict
+
+from pandas import DataFrame, Series, to_datetime, to_numeric
+
+# Arrow backed strings are much more compact than python str objects
+STRING_DTYPE = "string[pyarrow]" if find_spec("pyarrow") else "string"
+TYPE_ERRORS_ATTR = "type_errors"
+
+
+def coerce_types(data: DataFrame, types: Dict[str, Any]) -> DataFrame:
+    """Convert the columns to the compact dtypes matching the expected types.
+
+    Supported types are `int`, `float`, `bool`, `str`, `datetime.datetime`,
+    `datetime.date` and `"category"`. Anything else is passed to `astype`.
+    Empty cells become missing values, except on `str` columns where they are
+    kept as "". Values that can't be converted are also set as missing and
+    their index labels are stored by column in `data.attrs["type_errors"]`, to
+    be reported in bulk by the validations.
+    """
+    data = data.copy()
+    type_errors: dict[str, list] = {}
+    for label, expected_type in types.items():
+        if label not in data.columns:
+            continue
+        converted, failed = coerce_column(data[label], expected_type)
+        data[label] = converted
+        if failed.any():
+            type_errors[str(label)] = data.index[failed.to_numpy()].tolist()
+
+    data.attrs[TYPE_ERRORS_ATTR] = type_errors
+    return data
+
+
+def coerce_column(content: Series, expected_type: Any) -> tuple[Series, Series]:
+    """Convert a column to the compact dtype of the given type.
+
+    :return: The converted column and the mask of values that failed.
+    """
+    present = ~(content.isna() | content.eq(""))
+    no_failures = Series(False, index=content.index)
+
+    if expected_type is str:
+        return content.astype(STRING_DTYPE), no_failures
+    if expected_type == "category":
+        return content.where(present).astype("category"), no_failures
+
+    if expected_type in (int, float):
+        converted = to_numeric(content.where(present), errors="coerce")
+        failed = present & converted.isna()
+        if expected_type is int:
+            failed |= converted.notna() & converted.mod(1).ne(0)
+            return converted.where(~failed).astype("Int64"), failed
+        return converted.astype("float64"), failed
+
+    if expected_type is bool:
+        lowered = content.where(present).astype(STRING_DTYPE).str.strip().str.lower()
+        converted = lowered.map(_BOOLEAN_VALUES, na_action="ignore").astype("boolean")
+        return converted, present & converted.isna()
+
+    if expected_type in (datetime.datetime, datetime.date):
+        as_text = content.where(present).astype(STRING_DTYPE)
+        converted = to_datetime(as_text, errors="coerce", format="mixed")
+        return converted, present & converted.isna()
+
+    return content.astype(expected_type), no_failures
+
+
+_BOOLEAN_VALUES = {
+    "true": True,
+    "false": False,
+    "1": True,
+    "0": False,
+    "1.0": True,
+    "0.0": False,
+    "yes": True,
+    "no": False,
+}
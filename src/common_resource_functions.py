@@ -1,43 +1,258 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from __future__ import annotations
+
 import sys
+from typing import TYPE_CHECKING
 
-from pandas import DataFrame, isna, option_context
+from numpy import ndarray, sort
+from pandas import DataFrame, Series, isna, option_context
 
+from src.cell_validators import (
+    INVALID_CHARACTERS,
+    INVALID_FIRST_AND_LAST_CHARACTERS,
+    StringCells,
+    classify_cell_characters,
+    find_invalid_cells,
+    missing_values_mask,
+    string_cells,
+)
+from src.common_importer_functions import TYPE_ERRORS_ATTR
 from src.protocols import ResourceHandler
+from src.validation_errors import (
+    CUSTOM_ERROR,
+    INVALID_TYPE,
+    MISSING_FIELD,
+    MISSING_VALUE,
+    ErrorMessages,
+    ErrorRecord,
+    ErrorStore,
+)
+
+if TYPE_CHECKING:
+    from src.common_db_functions import ResourceDelta
+
+SHOW_MODES = ("head", "tail", "sample", "all")
 
 
 class CommonResourceFunctions:
     attached_resource: ResourceHandler
 
-    def __init__(self, resource: ResourceHandler):
+    DEFAULT_MAX_ERRORS = 10_000
+    DEFAULT_SHOW_ROWS = 50
+    SHOW_PAGE_SIZE = 1_000
+
+    def __init__(
+        self,
+        resource: ResourceHandler,
+        max_errors: int | None = DEFAULT_MAX_ERRORS,
+        fail_fast_threshold: int | None = None,
+        workers: int | None = None,
+        rows_per_shard: int | None = None,
+    ):
+        """Constructor method
+
+        :param resource: The resource to validate.
+        :param max_errors: Number of problems kept with their details. The
+            problem counts stay exact past it. None to keep them all.
+        :param fail_fast_threshold: Stop the validations and raise as soon as
+            this number of problems is detected. None to run every check.
+        :param workers: Number of processes for the missing values and cells
+            characters checks, see `check_in_shards`. None or 1 to run them
+            in this process.
+        :param rows_per_shard: Also split the columns into row ranges of this
+            size when running in parallel. Useful for very tall sheets.
+        """
         self.attached_resource = resource
-        self.errors: list[str] = []
-        self.errors_count: int = 0
+        self.error_store = ErrorStore(max_errors)
+        # Set by the code assigning errors_count, see the errors_count setter
+        self._errors_count_offset = 0
+        self.fail_fast_threshold = fail_fast_threshold
+        self.workers = workers
+        self.rows_per_shard = rows_per_shard
+        self._shared_string_cells: dict[str, StringCells | None] | None = None
+
+    @property
+    def errors(self) -> list[str]:
+        """The human messages of the detected problems, rendered on access.
+
+        Use `add_error` to report a problem. As when `errors` and
+        `errors_count` were plain attributes, the changes made to this list
+        (or the list assigned to it) are shown but not counted.
+        """
+        return ErrorMessages(
+            self.error_store.render(),
+            self._add_uncounted_error,
+            self._set_uncounted_errors,
+        )
+
+    @errors.setter
+    def errors(self, messages: list[str]) -> None:
+        self._set_uncounted_errors(messages)
+
+    @property
+    def errors_count(self) -> int:
+        return self.error_store.problems_count + self._errors_count_offset
+
+    @errors_count.setter
+    def errors_count(self, errors_count: int) -> None:
+        self._errors_count_offset = errors_count - self.error_store.problems_count
+
+    def add_error(self, message: str) -> None:
+        """Report a problem found by a custom check, with its human message."""
+        self.error_store.add(CUSTOM_ERROR, value=message)
+
+    def _add_uncounted_error(self, message: str) -> None:
+        self.error_store.add(CUSTOM_ERROR, value=message)
+        self._errors_count_offset -= 1
+
+    def _set_uncounted_errors(self, messages: list[str]) -> None:
+        messages = list(messages)
+        if messages == self.error_store.render():  # e.g. `errors += [...]`
+            return
+        errors_count = self.errors_count
+        self.error_store = ErrorStore(self.error_store.max_errors)
+        # Already rendered, so all of them are kept even past the cap
+        self.error_store.records.extend(
+            ErrorRecord(CUSTOM_ERROR, value=message) for message in messages
+        )
+        self.error_store.counts[(CUSTOM_ERROR, None)] += len(messages)
+        self.errors_count = errors_count
+
+    def _base_show_data(
+        self,
+        data: DataFrame,
+        mode: str = "head",
+        rows: int = DEFAULT_SHOW_ROWS,
+        columns: list[str] | None = None,
+    ) -> DataFrame | None:
+        """Show a window of the data without rendering the whole DataFrame.
+
+        :param mode: "head", "tail", "sample" (random rows, in order) or "all".
+        :param rows: Number of rows shown by the head, tail and sample modes.
+        :param columns: Only show these columns.
+        :return: The selected window in Jupyter, or None after writing it to
+            stdout in pages of `SHOW_PAGE_SIZE` rows, so only one page is
+            rendered to text at a time.
+        """
+        positions = self._show_positions(len(data), mode, rows)
+        column_positions = self._show_column_positions(data, columns)
 
-    def _base_show_data(self, data: DataFrame) -> DataFrame | None:
         running_in_jupyter = "ipykernel" in sys.modules
         if running_in_jupyter:
-            return self.attached_resource.input_data
+            return data.iloc[positions, column_positions]
+
+        page_size = self.SHOW_PAGE_SIZE
+        with option_context("display.max_columns", None, "display.width", None):
+            if len(positions) == 0:
+                print(data.iloc[0:0, column_positions].to_string())
+            for start in range(0, len(positions), page_size):
+                page = data.iloc[positions[start : start + page_size], column_positions]
+                print(page.to_string())
+
+    def _show_positions(self, length: int, mode: str, rows: int) -> range | ndarray:
+        if mode == "all":
+            return range(length)
+        if rows < 0:
+            raise ValueError(f"rows must be a positive integer, got {rows}")
+        rows = min(rows, length)
+        if mode == "head":
+            return range(rows)
+        if mode == "tail":
+            return range(length - rows, length)
+        if mode == "sample":
+            from numpy.random import default_rng
+
+            return sort(default_rng().choice(length, rows, replace=False))
+        raise ValueError(f"Unknown show mode '{mode}'. Expected one of {SHOW_MODES}")
+
+    def _show_column_positions(
+        self, data: DataFrame, columns: list[str] | None
+    ) -> slice | ndarray:
+        if columns is None:
+            return slice(None)
+        column_positions = data.columns.get_indexer(columns)
+        unknown = [label for label, pos in zip(columns, column_positions) if pos < 0]
+        if unknown:
+            raise ValueError(f"Unknown column(s) to show: {unknown}")
+        return column_positions
 
-        opts = ["display.max_columns", None]
-        with option_context(*opts):
-            print(data.to_string())
+    def show_input_data(
+        self,
+        mode: str = "head",
+        rows: int = DEFAULT_SHOW_ROWS,
+        columns: list[str] | None = None,
+    ) -> DataFrame | None:
+        return self._base_show_data(
+            self.attached_resource.input_data, mode, rows, columns
+        )
 
-    def show_input_data(self) -> DataFrame | None:
-        return self._base_show_data(self.attached_resource.input_data)
+    def show_db_data(
+        self,
+        mode: str = "head",
+        rows: int = DEFAULT_SHOW_ROWS,
+        columns: list[str] | None = None,
+    ) -> DataFrame | None:
+        return self._base_show_data(self.attached_resource.db_data, mode, rows, columns)
 
-    def show_db_data(self) -> DataFrame | None:
-        return self._base_show_data(self.attached_resource.db_data)
+    def sync_input_data(
+        self, key_columns: list[str], delete_missing: bool = False
+    ) -> ResourceDelta:
+        """Write only the differences between the input data and the DB.
+
+        Alternative to a full `insert_data`. The stored records are loaded
+        with `load_resource_data`, diffed by `key_columns` and only the new,
+        changed (and with `delete_missing`, removed) rows are sent to the DB.
+
+        :return: The applied changes.
+        """
+        # Imported on first use, like the other optional steps
+        from src.common_db_functions import compute_resource_delta
+
+        resource = self.attached_resource
+        db_handler = resource.db_handler
+        input_data = resource.input_data
+        # An empty selection loads every record, needed to find the deletes
+        selection = input_data.iloc[:0] if delete_missing else input_data
+        db_data = db_handler.load_resource_data(
+            resource.resource_name, selection[key_columns], key_columns
+        )
+
+        delta = compute_resource_delta(input_data, db_data, key_columns)
+        if not delete_missing:
+            delta = delta._replace(deletes=delta.deletes.iloc[:0])
+
+        if not delta.deletes.empty:
+            db_handler.delete_resource_data(
+                resource.resource_name, delta.deletes, key_columns
+            )
+        if not delta.updates.empty:
+            db_handler.update_resource_data(
+                resource.resource_name, delta.updates, key_columns
+            )
+        if not delta.inserts.empty:
+            db_handler.bulk_insert_resource_data(resource.resource_name, delta.inserts)
+        return delta
 
     def run_common_validations(self) -> list[str] | None:
         self.check_attached_resource_input_data()
         self.check_empty_input_data(self.attached_resource.input_data)
         required_fields = self.attached_resource.required_fields
         self.check_missing_required_fields(required_fields)
-        self.check_missing_values_in_required_fields(required_fields)
-        self.check_all_cells_characters()
+        if self.workers is not None and self.workers > 1:
+            self.check_in_shards(required_fields)
+        else:
+            # The str cells of the required fields are joined once, for both
+            # the missing values and the cells characters checks
+            self._shared_string_cells = {}
+            try:
+                self.check_missing_values_in_required_fields(required_fields)
+                self.check_input_data_types()
+                self.check_all_cells_characters()
+            finally:
+                self._shared_string_cells = None
+        self.check_validation_rules()
 
         if self.errors_count > 0:
             self.raise_validation_errors()
@@ -47,16 +262,49 @@ class CommonResourceFunctions:
             msg = "- " + "\n- ".join(self.errors)
             raise ValueError(f"Detected {self.errors_count} problem(s):\n{msg}")
 
+    def _check_fail_fast(self) -> None:
+        threshold = self.fail_fast_threshold
+        if threshold is not None and self.errors_count >= threshold:
+            self.raise_validation_errors()
+
     def check_missing_required_fields(self, required_fields: list[str]) -> list | None:
         current_fields = [str(fld) for fld in self.attached_resource.input_data.columns]
-        missing_required_fields = set(required_fields) - set(current_fields)
-        if missing_required_fields:
-            msg = "Missing required field(s):\n"
-            for missing_field in missing_required_fields:
-                self._remove_missing_field_to_continue_validations(missing_field)
-                self.errors_count += 1
-                msg += f"   - {missing_field}\n"
-            self.errors.append(msg)
+        missing_required_fields = [
+            field
+            for field in dict.fromkeys(required_fields)
+            if field not in current_fields
+        ]
+        for missing_field in missing_required_fields:
+            self._remove_missing_field_to_continue_validations(missing_field)
+            self.error_store.add(MISSING_FIELD, missing_field)
+        self._check_fail_fast()
+
+    def check_source_header(self, source: str | bytes) -> list[str]:
+        """Fail fast on missing required fields, reading only the source header.
+
+        Run it before `load_input_data`, so a file missing required fields is
+        reported without parsing it. Needs an importer with `read_header`,
+        e.g. `XlsxImporter`.
+
+        :return: The header labels declared by the resource (required fields,
+            expected types and validation rules), e.g. for `usecols`.
+        """
+        resource = self.attached_resource
+        header_row = resource.data_importer.read_header(source, resource.section)
+        header = [str(label) for label in header_row]
+        required_fields = dict.fromkeys(resource.required_fields)
+        missing_fields = [field for field in required_fields if field not in header]
+        for missing_field in missing_fields:
+            self.error_store.add(MISSING_FIELD, missing_field)
+        if missing_fields:
+            self.raise_validation_errors()
+
+        declared_fields = {
+            *resource.required_fields,
+            *(resource.expected_input_data_format or {}),
+            *getattr(resource, "validation_rules", {}),
+        }
+        return [label for label in header if label in declared_fields]
 
     def _remove_missing_field_to_continue_validations(self, missing_field: str) -> None:
         self.attached_resource.required_fields.remove(missing_field)
@@ -64,36 +312,137 @@ class CommonResourceFunctions:
     def check_missing_values_in_required_fields(
         self, required_fields: list[str]
     ) -> list[str] | None:
-        missing_data: dict[str, list[str]] = {}
-        for field_label in required_fields:
-            for idx, value in self.attached_resource.input_data[field_label].items():
-                if value != "" or not isinstance(value, str) and value is not None:
-                    continue
-
-                human_idx = int(str(idx)) + 2  # +2: +1 for 0-idx +1 for headers row
-                error = f"Row {human_idx}"
-                if field_label not in missing_data:
-                    missing_data[field_label] = []
-                missing_data[field_label].append(error)
-
-        if not missing_data:
+        """Report the empty cells of the required fields.
+
+        Empty strings, whitespace-only strings, None and NaN are all missing
+        values. The check builds a single mask over the required columns and
+        only records the rows that are actually missing.
+        """
+        input_data = self.attached_resource.input_data
+        required_data = input_data[required_fields]
+        cells = None
+        if self._shared_string_cells is not None:
+            cells = [
+                self._string_cells(label, content, keep=True)
+                for label, content in required_data.items()
+            ]
+        missing_mask = missing_values_mask(required_data, cells)
+        if not missing_mask.to_numpy().any():
             return
 
-        msg = "Missing data in mandatory fields:\n"
-        for idx, value in missing_data.items():
-            self.errors_count += 1
-            msg += f"  - Column '{idx}':\n"
-            for err in value:
-                msg += f"    - {err}\n"
-        self.errors.append(msg)
+        human_rows = input_data.index.to_numpy().astype(int) + 2  # +1 0-idx +1 header
+        for position, field_label in enumerate(required_fields):
+            missing_rows = human_rows[missing_mask.iloc[:, position].to_numpy()]
+            if len(missing_rows) > 0:
+                self.error_store.add_rows(MISSING_VALUE, field_label, missing_rows)
+        self._check_fail_fast()
+
+    def check_in_shards(self, required_fields: list[str]) -> None:
+        """Parallel equivalent of the missing values, data types and cells
+        characters checks, reporting the same problems in the same order.
+
+        See `sharded_validation.validate_in_shards`.
+        """
+        from src.sharded_validation import validate_in_shards
+
+        missing_rows, character_records = validate_in_shards(
+            self.attached_resource.input_data,
+            required_fields,
+            self.workers,
+            self.rows_per_shard,
+        )
+        for field_label, rows in missing_rows.items():
+            self.error_store.add_rows(MISSING_VALUE, field_label, rows)
+        self._check_fail_fast()
+        self.check_input_data_types()
+        for record in character_records:
+            self.error_store.add(*record)
+        self._check_fail_fast()
+
+    def check_input_data_types(self) -> list[str] | None:
+        """Report the values the importer couldn't convert to the expected types.
+
+        See `common_importer_functions.coerce_types`.
+        """
+        input_data = self.attached_resource.input_data
+        type_errors = input_data.attrs.get(TYPE_ERRORS_ATTR)
+        if not type_errors:
+            return
+
+        expected_types = self.attached_resource.expected_input_data_format
+        for label, indexes in type_errors.items():
+            expected_type = expected_types.get(label)
+            type_name = getattr(expected_type, "__name__", str(expected_type))
+            # +2: +1 for 0-idx +1 for headers row
+            human_rows = [int(str(idx)) + 2 for idx in indexes]
+            self.error_store.add_rows(INVALID_TYPE, label, human_rows, type_name)
+        self._check_fail_fast()
 
     def check_all_cells_characters(self) -> list[str]:
         for label, content in self.attached_resource.input_data.items():
-            for index, value in content.items():
-                cell_problems = self.validate_cell_characters(label, index, value)
-                if cell_problems:
-                    self.errors_count += 1
-                    self.errors.append(cell_problems)
+            for record in self.validate_column_characters(label, content):
+                self.error_store.add(*record)
+            self._check_fail_fast()
+
+    def validate_column_characters(
+        self, label: str, content: Series
+    ) -> list[ErrorRecord]:
+        """Column-at-a-time equivalent of `validate_cell_characters`.
+
+        All the string cells are scanned at once with `find_invalid_cells`.
+        Only the matched cells are classified, with the same precedence as
+        the per-cell validators.
+        """
+        cells = self._string_cells(label, content)
+        if cells is None or len(cells.strings) == 0:  # no strings
+            return []
+
+        index = content.index
+        if cells.positions is not None:
+            index = index[cells.positions]
+        strings = cells.strings
+        offending_cells = find_invalid_cells(strings, cells.buffer)
+
+        problems: list[ErrorRecord] = []
+        for cell in offending_cells:
+            value = strings[cell]
+            code = classify_cell_characters(value)
+            if code:
+                human_row = int(index[cell]) + 2  # + 1 for 0-idx and + 1 for header
+                problems.append(ErrorRecord(code, label, human_row, value))
+        return problems
+
+    def _string_cells(
+        self, label: str, content: Series, keep: bool = False
+    ) -> StringCells | None:
+        """The `string_cells` of the column, shared between the checks of a
+        `run_common_validations` call. Each entry is used at most twice, so it
+        is kept by the first check (`keep`) and released by the second."""
+        shared = self._shared_string_cells
+        if shared is None or not self.attached_resource.input_data.columns.is_unique:
+            return string_cells(content)
+        if label in shared:
+            return shared[label] if keep else shared.pop(label)
+        cells = string_cells(content)
+        if keep:
+            shared[label] = cells
+        return cells
+
+    def check_validation_rules(self) -> None:
+        """Evaluate the `validation_rules` declared on the resource class.
+
+        See `validation_rules.compile_resource_rules`.
+        """
+        from src.validation_rules import compile_resource_rules
+
+        input_data = self.attached_resource.input_data
+        compiled_rules = compile_resource_rules(type(self.attached_resource))
+        for label, column_rules in compiled_rules.items():
+            if label not in input_data.columns:  # reported as a missing field
+                continue
+            for record in column_rules.evaluate(input_data[label]):
+                self.error_store.add(*record)
+        self._check_fail_fast()
 
     def check_attached_resource_input_data(self) -> None:
         if (
@@ -126,24 +475,21 @@ class CommonResourceFunctions:
     def search_invalid_characters(
         self, label: str, index: int, value: str
     ) -> str | None:
-        invalid_chars: list[str] = ["\t", "−", "–", "–"]
-        if any(element in value for element in invalid_chars):
+        if any(element in value for element in INVALID_CHARACTERS):
             human_row = int(index) + 2  # + 1 for 0-idx and + 1 for header row
             return f"Invalid character in column '{label}' row '{human_row}'."
 
     def validate_first_and_last_characters(
         self, label: str, index: int, value: str
     ) -> str | None:
-        invalid_first_and_last_chars = [" ", "\n"]
-
         first_char: str = value[0]
         last_char: str = value[-1]
-        if first_char in invalid_first_and_last_chars:
+        if first_char in INVALID_FIRST_AND_LAST_CHARACTERS:
             human_row = int(index) + 2  # + 1 for 0-idx and + 1 for header row
             return (
                 f"Invalid first char: '{value}' in column '{label}' row '{human_row}'."
             )
-        if last_char in invalid_first_and_last_chars:
+        if last_char in INVALID_FIRST_AND_LAST_CHARACTERS:
             human_row = int(index) + 2  # + 1 for 0-idx and + 1 for header row
             return (
                 f"Invalid last char: '{value}' in column '{label}' row '{human_row}'."
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import os
+from io import BytesIO
+from typing import IO, Callable, Dict, Iterator
+
+from pandas import DataFrame, read_csv
+
+from src.common_importer_functions import coerce_types
+
+
+class CsvImporter:
+    """Import delimited text files with the pandas native (C) parser.
+
+    Cells are read as text, like `XlsxImporter` does, and converted to the
+    expected types by `coerce_types`. With a types dict only its columns are
+    parsed. CSV files have a single section, so `section` is ignored.
+    """
+
+    DEFAULT_SEPARATOR = ","
+
+    def __init__(self, separator: str | None = None, encoding: str = "utf-8"):
+        self.separator = separator or self.DEFAULT_SEPARATOR
+        self.encoding = encoding
+
+    def load_data(
+        self,
+        source: str | bytes,
+        section: int | str | None = None,
+        types: Dict | None = None,
+    ) -> DataFrame:
+        stream = self._stream(source)
+        try:
+            data: DataFrame = read_csv(stream, **self._options(types))
+        except Exception as err:
+            raise Exception("Error loading the csv file", err)
+
+        if data.empty:
+            msg = f"The generated DataFrame is empty after reading the file {source}."
+            raise Exception(msg)
+
+        if isinstance(types, dict):
+            data = coerce_types(data, types)
+        return data
+
+    def iter_chunks(
+        self,
+        source: str | bytes,
+        section: int | str | None,
+        chunksize: int,
+        types: Dict | None = None,
+    ) -> Iterator[DataFrame]:
+        """Stream the file as DataFrames of up to `chunksize` rows.
+
+        Each chunk keeps the index it would have in `load_data`.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+
+        stream = self._stream(source)
+        rows = 0
+        try:
+            reader = read_csv(stream, chunksize=chunksize, **self._options(types))
+        except Exception as err:
+            raise Exception("Error loading the csv file", err)
+        with reader:
+            for chunk in reader:
+                rows += len(chunk)
+                yield coerce_types(chunk, types) if isinstance(types, dict) else chunk
+
+        if rows == 0:
+            msg = f"The generated DataFrame is empty after reading the file {source}."
+            raise Exception(msg)
+
+    def _stream(self, source: str | bytes) -> str | IO[bytes]:
+        if isinstance(source, bytes):
+            return BytesIO(source)
+        if not os.path.isfile(source):
+            raise Exception(f"File not found: '{source}'")
+        return source
+
+    def _options(self, types: Dict | None) -> dict:
+        # Column projection, the missing columns are reported by the validations
+        usecols: Callable | None = None
+        if isinstance(types, dict):
+            usecols = types.__contains__
+        _types = "object" if types is None or isinstance(types, dict) else types
+        return {
+            "sep": self.separator,
+            "encoding": self.encoding,
+            "dtype": _types,
+            "keep_default_na": False,
+            "usecols": usecols,
+        }
+
+
+class TsvImporter(CsvImporter):
+    DEFAULT_SEPARATOR = "\t"
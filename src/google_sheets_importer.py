@@ -1,18 +1,43 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import hashlib
 import json
+import threading
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Literal
 
 import gspread
+from gspread.utils import absolute_range_name, fill_gaps, numericise_all
 from pandas import DataFrame
 
+from src.common_importer_functions import coerce_types
+
 
 class GoogleSheetsImporter:
+    """Import worksheets from Google Sheets as DataFrames.
+
+    The gspread clients are shared process-wide by credentials, and the
+    opened Spreadsheet/Worksheet handles are kept for `handles_ttl` seconds,
+    so loading many tabs of the same document only pays the lookups once.
+    With `open_by="key"` the sources are spreadsheet keys instead of titles,
+    avoiding the Drive search needed to find a document by its title.
+    """
+
     DEFAULT_CREDENTIALS = Path(".secrets/google_credentials.json")
+    DEFAULT_HANDLES_TTL = 300.0  # seconds
 
-    def __init__(self, credentials: dict | str | None):
+    _clients: dict[str, gspread.Client] = {}
+    _handles: dict[tuple, tuple[float, Any]] = {}
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        credentials: dict | str | None,
+        open_by: Literal["title", "key"] = "title",
+        handles_ttl: float = DEFAULT_HANDLES_TTL,
+    ):
         if not credentials:
             credentials = str(self.DEFAULT_CREDENTIALS)
 
@@ -24,14 +49,22 @@ class GoogleSheetsImporter:
             except Exception:
                 raise IOError("Error reading Google credentials file.")
 
-        self.client = gspread.service_account_from_dict(credentials)
+        if open_by not in ("title", "key"):
+            raise ValueError(f"Unknown open_by: '{open_by}'")
+
+        self.open_by = open_by
+        self.handles_ttl = handles_ttl
+        self.client_key = hashlib.sha256(
+            json.dumps(credentials, sort_keys=True).encode()
+        ).hexdigest()
+        self.client = self._get_client(self.client_key, credentials)
 
     def load_data(
         self, source: str | bytes, section: int | str, types: Dict | None = None
     ) -> DataFrame:
         try:
-            self.google_sheet = self.client.open(source)
-            worksheet = self.google_sheet.worksheet(section)
+            spreadsheet = self._get_spreadsheet(source)
+            worksheet = self._get_worksheet(spreadsheet, source, section)
             data_in_sheet = worksheet.get_all_records()
             data = DataFrame(data_in_sheet)
         except Exception as err:
@@ -41,4 +74,107 @@ class GoogleSheetsImporter:
             msg = f"The generated DataFrame is empty after reading the file {source}."
             raise ValueError(msg)
 
+        if isinstance(types, dict):
+            data = coerce_types(data, types)
         return data
+
+    def load_many(
+        self, source: str | bytes, sections: list[str], types: Dict | None = None
+    ) -> dict[str, DataFrame]:
+        """Load several worksheets of the same document with one API request.
+
+        All the ranges are fetched with the spreadsheet `values:batchGet`
+        endpoint and each DataFrame is built from its raw value matrix, taking
+        the header from the first row, like `get_all_records` does.
+        """
+        if not sections:
+            return {}
+
+        try:
+            spreadsheet = self._get_spreadsheet(source)
+            ranges = [absolute_range_name(section) for section in sections]
+            response = spreadsheet.values_batch_get(ranges)
+            value_ranges = response.get("valueRanges", [])
+            loaded = {
+                section: self._values_to_dataframe(value_range.get("values", []))
+                for section, value_range in zip(sections, value_ranges)
+            }
+        except Exception as err:
+            raise Exception(f"Error loading the GoogleSheet:\n{err}")
+
+        empty_sections = [
+            str(section) for section in sections if loaded.get(section) is None
+        ]
+        if empty_sections:
+            msg = (
+                f"The generated DataFrame is empty after reading the file {source}"
+                f" section(s): {', '.join(empty_sections)}."
+            )
+            raise ValueError(msg)
+
+        if isinstance(types, dict):
+            loaded = {
+                section: coerce_types(data, types) for section, data in loaded.items()
+            }
+        return loaded
+
+    def _values_to_dataframe(self, values: list[list]) -> DataFrame | None:
+        values = fill_gaps(values)
+        if len(values) < 2:
+            return None
+
+        header, rows = values[0], values[1:]
+        if len(header) != len(set(header)):
+            raise gspread.exceptions.GSpreadException(
+                "the header row in the worksheet is not unique"
+            )
+        # Same cell values conversion as `get_all_records`
+        rows = [numericise_all(row, default_blank="") for row in rows]
+        return DataFrame(rows, columns=header)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop the shared clients and every cached handle."""
+        with cls._lock:
+            cls._clients.clear()
+            cls._handles.clear()
+
+    @classmethod
+    def _get_client(cls, client_key: str, credentials: dict) -> gspread.Client:
+        with cls._lock:
+            if client_key not in cls._clients:
+                client = gspread.service_account_from_dict(credentials)
+                cls._clients[client_key] = client
+            return cls._clients[client_key]
+
+    def _get_spreadsheet(self, source: str | bytes) -> gspread.Spreadsheet:
+        def open_spreadsheet() -> gspread.Spreadsheet:
+            if self.open_by == "key":
+                return self.client.open_by_key(source)
+            return self.client.open(source)
+
+        handle_key = (self.client_key, self.open_by, source)
+        return self._get_handle(handle_key, open_spreadsheet)
+
+    def _get_worksheet(
+        self, spreadsheet: gspread.Spreadsheet, source: str | bytes, section: int | str
+    ) -> gspread.Worksheet:
+        # The spreadsheet is passed explicitly and never kept in the instance,
+        # so concurrent loads of other documents can't swap it
+        def open_worksheet() -> gspread.Worksheet:
+            return spreadsheet.worksheet(section)
+
+        handle_key = (self.client_key, self.open_by, source, section)
+        return self._get_handle(handle_key, open_worksheet)
+
+    def _get_handle(self, handle_key: tuple, open_handle) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._handles.get(handle_key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        handle = open_handle()
+        with self._lock:
+            self._handles[handle_key] = (now + self.handles_ttl, handle)
+        return handle
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Registry of the available importers.
+
+Importers are registered by name as "module:ClassName" paths and only
+imported when requested, so a job using one importer never pays for the
+dependencies of the others (e.g. gspread for xlsx-only jobs).
+"""
+
+from __future__ import annotations
+
+import os
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.protocols import ImporterHandler
+
+_IMPORTERS: dict[str, str | type] = {
+    "xlsx": "src.xlsx_importer:XlsxImporter",
+    "google_sheets": "src.google_sheets_importer:GoogleSheetsImporter",
+    "csv": "src.csv_importer:CsvImporter",
+    "tsv": "src.csv_importer:TsvImporter",
+    "parquet": "src.parquet_importer:ParquetImporter",
+}
+_EXTENSIONS: dict[str, str] = {
+    ".xlsx": "xlsx",
+    ".xlsm": "xlsx",
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".tab": "tsv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+def register_importer(
+    name: str, importer: str | type, extensions: tuple[str, ...] = ()
+) -> None:
+    """Add an importer to the registry.
+
+    :param name: Name used to get the importer back.
+    :param importer: The importer class or its "module:ClassName" path, so it
+        is only imported on first use.
+    :param extensions: File extensions (e.g. ".csv") handled by the importer.
+    """
+    _IMPORTERS[name] = importer
+    for extension in extensions:
+        _EXTENSIONS[extension.lower()] = name
+
+
+def available_importers() -> list[str]:
+    return list(_IMPORTERS)
+
+
+def get_importer_class(name: str) -> type[ImporterHandler]:
+    try:
+        importer = _IMPORTERS[name]
+    except KeyError:
+        msg = f"Unknown importer '{name}'. Expected one of {available_importers()}"
+        raise ValueError(msg)
+
+    if isinstance(importer, str):
+        module_name, _, class_name = importer.partition(":")
+        importer = getattr(import_module(module_name), class_name)
+        _IMPORTERS[name] = importer
+    return importer
+
+
+def get_importer(name: str, *args, **kwargs) -> ImporterHandler:
+    """Instance of the named importer, built with the given arguments."""
+    return get_importer_class(name)(*args, **kwargs)
+
+
+def importer_name_for_source(source: str) -> str:
+    """Name of the importer registered for the file extension of the source."""
+    extension = os.path.splitext(source)[1].lower()
+    try:
+        return _EXTENSIONS[extension]
+    except KeyError:
+        raise ValueError(f"No importer registered for '{extension}' files")
@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Iterator, NamedTuple
+
+from pandas import DataFrame
+
+from src.protocols import ResourceHandler
+
+RESOURCE_STAGES = ("load_input_data", "validate_data", "insert_data", "load_db_data")
+IMPORTER_CALLS = ("load_data", "load_many")
+DB_HANDLER_CALLS = (
+    "connect_with_db",
+    "close_db_connection",
+    "commit",
+    "insert_resource_data",
+    "bulk_insert_resource_data",
+    "load_resource_data",
+    "update_resource_data",
+    "delete_resource_data",
+)
+
+
+class StageRecord(NamedTuple):
+    """Measurements of a single run of a stage.
+
+    :param peak_bytes: Peak of the memory allocated during the stage over the
+        memory in use when it started. None when memory isn't traced.
+    """
+
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float
+    rows: int | None
+    peak_bytes: int | None
+
+    @property
+    def rows_per_second(self) -> float | None:
+        if self.rows is None or self.wall_seconds <= 0:
+            return None
+        return self.rows / self.wall_seconds
+
+
+class StageTimer:
+    """Handle of an active stage, used to report the processed rows."""
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.rows: int | None = None
+        self.peak_bytes = 0
+        self.base_bytes = 0
+
+
+class _DisabledStage:
+    """Shared no-op stage, so a disabled instrumentation costs one call."""
+
+    rows: int | None = None
+
+    def __enter__(self) -> "_DisabledStage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_DISABLED_STAGE = _DisabledStage()
+
+
+class Instrumentation:
+    """Opt-in wall time, CPU time, rows and peak memory measurements by stage.
+
+    Use `stage` as a context manager around any block, or `instrument_resource`
+    to measure the `ResourceHandler` stages together with the calls to its
+    importer and DB handler. Each finished stage is stored in `records` and
+    passed to the `hooks`, e.g. `logging_hook`.
+
+    When `enabled` is False nothing is measured nor wrapped.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        trace_memory: bool = True,
+        hooks: list[Callable[[StageRecord], None]] | None = None,
+    ):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.hooks = hooks or []
+        self.records: list[StageRecord] = []
+        self._active: list[StageTimer] = []
+        self._started_tracing = False
+
+    def stage(self, name: str) -> Any:
+        if not self.enabled:
+            return _DISABLED_STAGE
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[StageTimer]:
+        timer = StageTimer(name)
+        self._start_memory_trace(timer)
+        self._active.append(timer)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield timer
+        finally:
+            wall_seconds = time.perf_counter() - wall_start
+            cpu_seconds = time.process_time() - cpu_start
+            self._active.pop()
+            peak_bytes = self._stop_memory_trace(timer)
+            rows = timer.rows
+            record = StageRecord(name, wall_seconds, cpu_seconds, rows, peak_bytes)
+            self.records.append(record)
+            for hook in self.hooks:
+                hook(record)
+
+    def _start_memory_trace(self, timer: StageTimer) -> None:
+        if not self.trace_memory:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        current, peak = tracemalloc.get_traced_memory()
+        if self._active:
+            # The peak is global, so save it before resetting it for this stage
+            parent = self._active[-1]
+            parent.peak_bytes = max(parent.peak_bytes, peak - parent.base_bytes)
+        tracemalloc.reset_peak()
+        timer.base_bytes = current
+
+    def _stop_memory_trace(self, timer: StageTimer) -> int | None:
+        if not self.trace_memory or not tracemalloc.is_tracing():
+            return None
+        _, peak = tracemalloc.get_traced_memory()
+        peak_bytes = max(timer.peak_bytes, peak - timer.base_bytes)
+        if self._active:
+            parent = self._active[-1]
+            parent.peak_bytes = max(parent.peak_bytes, peak - parent.base_bytes)
+        elif self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return max(peak_bytes, 0)
+
+    def wrap(self, function: Callable, name: str) -> Callable:
+        """Measure each call of the function as the `name` stage.
+
+        The rows are taken from the returned DataFrame or else from the first
+        DataFrame argument.
+        """
+        if not self.enabled:
+            return function
+
+        @wraps(function)
+        def measured(*args, **kwargs):
+            with self.stage(name) as timer:
+                result = function(*args, **kwargs)
+                timer.rows = _count_rows(result, args, kwargs)
+                return result
+
+        return measured
+
+    def instrument_resource(self, resource: ResourceHandler) -> ResourceHandler:
+        """Measure the resource stages and its importer and DB handler calls.
+
+        The methods are wrapped on the given instances, so the resource class
+        and other resources are not affected. Set the importer and the DB
+        handler of the resource before instrumenting it.
+        """
+        if not self.enabled:
+            return resource
+
+        resource_name = type(resource).__name__
+        for method in RESOURCE_STAGES:
+            self._wrap_stage(resource, method, f"{resource_name}.{method}")
+
+        importer = getattr(resource, "data_importer", None)
+        if importer is not None:
+            for method in IMPORTER_CALLS:
+                self._wrap_call(importer, method, f"{type(importer).__name__}.{method}")
+        db_handler = getattr(resource, "db_handler", None)
+        if db_handler is not None:
+            for method in DB_HANDLER_CALLS:
+                name = f"{type(db_handler).__name__}.{method}"
+                self._wrap_call(db_handler, method, name)
+        return resource
+
+    def _wrap_stage(self, resource: ResourceHandler, method: str, name: str) -> None:
+        function = getattr(resource, method, None)
+        if function is None:
+            return
+        # The resource stages return None, so count the rows they leave behind
+        data_attr = "db_data" if method == "load_db_data" else "input_data"
+
+        @wraps(function)
+        def measured(*args, **kwargs):
+            with self.stage(name) as timer:
+                result = function(*args, **kwargs)
+                data = getattr(resource, data_attr, None)
+                timer.rows = len(data) if isinstance(data, DataFrame) else None
+                return result
+
+        setattr(resource, method, measured)
+
+    def _wrap_call(self, handler: object, method: str, name: str) -> None:
+        function = getattr(handler, method, None)
+        if function is not None:
+            setattr(handler, method, self.wrap(function, name))
+
+    def report(self) -> list[dict[str, Any]]:
+        """Totals by stage, in the order each stage first finished."""
+        stages: dict[str, dict[str, Any]] = {}
+        for record in self.records:
+            totals = stages.setdefault(
+                record.stage,
+                {
+                    "stage": record.stage,
+                    "calls": 0,
+                    "wall_seconds": 0.0,
+                    "cpu_seconds": 0.0,
+                    "rows": None,
+                    "rows_per_second": None,
+                    "peak_bytes": None,
+                },
+            )
+            totals["calls"] += 1
+            totals["wall_seconds"] += record.wall_seconds
+            totals["cpu_seconds"] += record.cpu_seconds
+            if record.rows is not None:
+                totals["rows"] = (totals["rows"] or 0) + record.rows
+            if record.peak_bytes is not None:
+                totals["peak_bytes"] = max(totals["peak_bytes"] or 0, record.peak_bytes)
+
+        for totals in stages.values():
+            if totals["rows"] is not None and totals["wall_seconds"] > 0:
+                totals["rows_per_second"] = totals["rows"] / totals["wall_seconds"]
+        return list(stages.values())
+
+    def to_prometheus(self, prefix: str = "load_transmuter_stage") -> str:
+        """The report in the Prometheus text exposition format."""
+        metrics = (
+            ("calls", "counter", "Finished runs of the stage"),
+            ("wall_seconds", "counter", "Wall time spent in the stage"),
+            ("cpu_seconds", "counter", "CPU time spent in the stage"),
+            ("rows", "counter", "Rows processed by the stage"),
+            ("peak_bytes", "gauge", "Highest memory allocation peak of the stage"),
+        )
+        report = self.report()
+        lines = []
+        for metric, kind, description in metrics:
+            name = f"{prefix}_{metric}"
+            if metric == "calls":
+                name += "_total"
+            lines.append(f"# HELP {name} {description}.")
+            lines.append(f"# TYPE {name} {kind}")
+            for totals in report:
+                if totals[metric] is None:
+                    continue
+                stage = totals["stage"].replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{name}{{stage="{stage}"}} {totals[metric]}')
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        self.records.clear()
+
+
+def logging_hook(
+    logger: logging.Logger | None = None, level: int = logging.INFO
+) -> Callable[[StageRecord], None]:
+    """Hook logging each finished stage."""
+    logger = logger or logging.getLogger("load_transmuter")
+
+    def log_record(record: StageRecord) -> None:
+        rows_per_second = record.rows_per_second
+        logger.log(
+            level,
+            "%s: %.3fs wall, %.3fs cpu, %s rows, %s rows/s, %s bytes peak",
+            record.stage,
+            record.wall_seconds,
+            record.cpu_seconds,
+            record.rows,
+            None if rows_per_second is None else round(rows_per_second),
+            record.peak_bytes,
+        )
+
+    return log_record
+
+
+def _count_rows(result: Any, args: tuple, kwargs: dict) -> int | None:
+    if isinstance(result, DataFrame):
+        return len(result)
+    for value in (*args, *kwargs.values()):
+        if isinstance(value, DataFrame):
+            return len(value)
+    return None
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from datetime import datetime, timezone
+from typing import NamedTuple
+
+from pandas import DataFrame
+
+from src.cached_importer import content_hash
+from src.protocols import DataBaseHandler
+
+
+class LoadCheckpoint(NamedTuple):
+    """Committed progress of loading a source into a resource.
+
+    `source_hash` is the content hash of the loaded source version, "" when
+    its content can't be hashed, see `source_identity`.
+    """
+
+    rows: int = 0
+    completed: bool = False
+    source_hash: str = ""
+
+
+def source_identity(source: str | bytes) -> tuple[str, str]:
+    """Identity and content hash of a source.
+
+    Files are identified by their absolute path and bytes by their hash. Other
+    sources (e.g. a Google Sheet title) are identified by their name, with an
+    empty hash because their content can't be read without importing it.
+    """
+    if isinstance(source, bytes):
+        source_hash = content_hash(source)
+        return source_hash, source_hash
+    if os.path.isfile(source):
+        return os.path.abspath(source), content_hash(source)
+    return source, ""
+
+
+class LoadCheckpoints:
+    """Committed rows by resource and source identity, kept in a DB table.
+
+    The checkpoints are written with the same `DataBaseHandler` methods and
+    connection as the resource data, so a chunk, its checkpoint and the keys
+    of its rows are committed (or rolled back) together in one transaction.
+    A rerun after a crash resumes right after the last committed chunk,
+    without inserting any row twice.
+
+    The keys of the rows of an incomplete load are kept in a table by
+    resource (see `keys_table`), so the partial load can be deleted with
+    `discard` when its checkpoint is no longer valid, e.g. the source was
+    corrected after a validation failure. They are dropped once the load is
+    completed. The rows are deleted by key, so the key columns must identify
+    a single row of the resource: `check_new_keys` rejects the rows whose
+    keys are repeated or already stored, e.g. by another source.
+    """
+
+    DEFAULT_TABLE = "load_checkpoints"
+    KEY_COLUMNS = ["resource_name", "source_id"]
+    SOURCE_COLUMN = "checkpoint_source_id"
+
+    def __init__(self, table: str = DEFAULT_TABLE):
+        self.table = table
+
+    def keys_table(self, resource_name: str) -> str:
+        return f"{self.table}__{resource_name}"
+
+    def load(
+        self, db_handler: DataBaseHandler, resource_name: str, source_id: str
+    ) -> LoadCheckpoint:
+        stored = self._stored(db_handler, resource_name, source_id)
+        if stored.empty:
+            return LoadCheckpoint()
+        record = stored.iloc[-1]
+        return LoadCheckpoint(
+            int(record["rows"]), bool(record["completed"]), str(record["source_hash"])
+        )
+
+    def save(
+        self,
+        db_handler: DataBaseHandler,
+        resource_name: str,
+        source_id: str,
+        checkpoint: LoadCheckpoint,
+        keys: DataFrame | None = None,
+    ) -> None:
+        """Store the checkpoint in the current transaction of the handler.
+
+        :param keys: The key columns of the rows loaded since the previous
+            checkpoint, for `discard`. Ignored for a completed checkpoint,
+            which drops the stored ones.
+        """
+        record = self._keys(resource_name, source_id).assign(
+            rows=checkpoint.rows,
+            completed=checkpoint.completed,
+            source_hash=checkpoint.source_hash,
+            updated_at=datetime.now(timezone.utc).isoformat(),
+        )
+        if self._stored(db_handler, resource_name, source_id).empty:
+            db_handler.bulk_insert_resource_data(self.table, record)
+        else:
+            db_handler.update_resource_data(self.table, record, self.KEY_COLUMNS)
+
+        if checkpoint.completed:
+            self._delete_row_keys(db_handler, resource_name, source_id)
+        elif keys is not None and not keys.empty:
+            row_keys = keys.reset_index(drop=True)
+            row_keys.insert(0, self.SOURCE_COLUMN, source_id)
+            keys_table = self.keys_table(resource_name)
+            db_handler.bulk_insert_resource_data(keys_table, row_keys)
+
+    def discard(
+        self,
+        db_handler: DataBaseHandler,
+        resource_name: str,
+        source_id: str,
+        key_columns: list[str],
+    ) -> int:
+        """Delete the rows of an incomplete load and forget its checkpoint.
+
+        Every resource row with one of the stored keys is deleted, see
+        `check_new_keys`.
+
+        :return: The number of row keys deleted from the resource.
+        """
+        row_keys = self._row_keys(db_handler, resource_name, source_id)
+        if not row_keys.empty:
+            keys = row_keys[key_columns]
+            db_handler.delete_resource_data(resource_name, keys, key_columns)
+        self.clear(db_handler, resource_name, source_id)
+        return len(row_keys)
+
+    def check_new_keys(
+        self,
+        db_handler: DataBaseHandler,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str],
+    ) -> None:
+        """Raise a ValueError unless the keys of the rows are new and unique.
+
+        Checked before inserting the rows, so `discard` only ever deletes the
+        rows of its own load.
+        """
+        keys = data[key_columns]
+        duplicated = keys[keys.duplicated()]
+        if duplicated.empty:
+            stored = db_handler.iter_resource_data(
+                resource_name, keys, key_columns, chunksize=1
+            )
+            duplicated = next(stored, keys.iloc[0:0])
+            stored.close()
+        if not duplicated.empty:
+            key = duplicated[key_columns].iloc[0].tolist()
+            msg = (
+                f"The key {key} is repeated or already stored in '{resource_name}'"
+                ", the rows loaded with checkpoints must have new unique keys"
+            )
+            raise ValueError(msg)
+
+    def clear(
+        self, db_handler: DataBaseHandler, resource_name: str, source_id: str
+    ) -> None:
+        """Forget the checkpoint, so the source is loaded again from the start."""
+        stored = self._stored(db_handler, resource_name, source_id)
+        if not stored.empty:
+            keys = stored[self.KEY_COLUMNS]
+            db_handler.delete_resource_data(self.table, keys, self.KEY_COLUMNS)
+        self._delete_row_keys(db_handler, resource_name, source_id)
+
+    def _stored(
+        self, db_handler: DataBaseHandler, resource_name: str, source_id: str
+    ) -> DataFrame:
+        keys = self._keys(resource_name, source_id)
+        return db_handler.load_resource_data(self.table, keys, self.KEY_COLUMNS)
+
+    def _keys(self, resource_name: str, source_id: str) -> DataFrame:
+        keys = {"resource_name": [resource_name], "source_id": [source_id]}
+        return DataFrame(keys)
+
+    def _row_keys(
+        self, db_handler: DataBaseHandler, resource_name: str, source_id: str
+    ) -> DataFrame:
+        source = DataFrame({self.SOURCE_COLUMN: [source_id]})
+        keys_table = self.keys_table(resource_name)
+        return db_handler.load_resource_data(keys_table, source, [self.SOURCE_COLUMN])
+
+    def _delete_row_keys(
+        self, db_handler: DataBaseHandler, resource_name: str, source_id: str
+    ) -> None:
+        source = DataFrame({self.SOURCE_COLUMN: [source_id]})
+        keys_table = self.keys_table(resource_name)
+        # Only checks for a stored key, the table may not even exist
+        stored = db_handler.iter_resource_data(
+            keys_table, source, [self.SOURCE_COLUMN], chunksize=1
+        )
+        if next(stored, None) is not None:
+            stored.close()
+            db_handler.delete_resource_data(keys_table, source, [self.SOURCE_COLUMN])
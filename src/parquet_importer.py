@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import os
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Dict, Iterator
+
+from pandas import DataFrame, RangeIndex
+
+from src.common_importer_functions import coerce_types
+
+if TYPE_CHECKING:
+    from pyarrow import RecordBatch, Table
+
+
+class ParquetImporter:
+    """Import Parquet files and hive partitioned Parquet datasets.
+
+    Requires the optional `pyarrow` dependency, imported on first use. Its
+    readers decode the columns in parallel threads. With a types dict only
+    its columns are read.
+
+    The `section` is a row group index for a single file, or a partition
+    directory (e.g. "year=2024") for a dataset directory. None reads it all.
+    """
+
+    def load_data(
+        self,
+        source: str | bytes,
+        section: int | str | None = None,
+        types: Dict | None = None,
+    ) -> DataFrame:
+        reader = self._open(source, section)
+        columns = self._columns(reader, types)
+        try:
+            if isinstance(section, int):
+                table = reader.read_row_group(section, columns, use_threads=True)
+            elif hasattr(reader, "to_table"):
+                table = reader.to_table(columns, use_threads=True)
+            else:
+                table = reader.read(columns, use_threads=True)
+        except Exception as err:
+            raise Exception("Error loading the parquet file", err)
+
+        data = self._to_dataframe(table, 0)
+        if data.empty:
+            msg = f"The generated DataFrame is empty after reading the file {source}."
+            raise Exception(msg)
+        return self._coerce(data, types)
+
+    def iter_chunks(
+        self,
+        source: str | bytes,
+        section: int | str | None,
+        chunksize: int,
+        types: Dict | None = None,
+    ) -> Iterator[DataFrame]:
+        """Stream the data as DataFrames of up to `chunksize` rows.
+
+        Each chunk keeps the index it would have in `load_data`. Chunks can
+        be shorter at the row group boundaries.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+
+        reader = self._open(source, section)
+        columns = self._columns(reader, types)
+        if hasattr(reader, "to_batches"):
+            batches = reader.to_batches(
+                columns=columns, batch_size=chunksize, use_threads=True
+            )
+        else:
+            row_groups = [section] if isinstance(section, int) else None
+            batches = reader.iter_batches(
+                chunksize, row_groups, columns, use_threads=True
+            )
+
+        offset = 0
+        for batch in batches:
+            if batch.num_rows == 0:
+                continue
+            chunk = self._to_dataframe(batch, offset)
+            offset += len(chunk)
+            yield self._coerce(chunk, types)
+
+        if offset == 0:
+            msg = f"The generated DataFrame is empty after reading the file {source}."
+            raise Exception(msg)
+
+    def _open(self, source: str | bytes, section: int | str | None) -> Any:
+        """A `ParquetFile` for single files or a `Dataset` for directories."""
+        parquet, dataset = _import_pyarrow()
+        if isinstance(source, str) and not os.path.exists(source):
+            raise Exception(f"File not found: '{source}'")
+
+        is_directory = isinstance(source, str) and os.path.isdir(source)
+        partition, row_group = isinstance(section, str), isinstance(section, int)
+        if (partition and not is_directory) or (row_group and is_directory):
+            msg = "The section must be a partition directory for a dataset directory"
+            msg += " or a row group index for a single file"
+            raise Exception(msg, section)
+        try:
+            if is_directory:
+                path = os.path.join(source, section) if section else source
+                return dataset.dataset(path, format="parquet", partitioning="hive")
+            stream = BytesIO(source) if isinstance(source, bytes) else source
+            return parquet.ParquetFile(stream)
+        except Exception as err:
+            raise Exception("Error loading the parquet file", err)
+
+    def _columns(self, reader: Any, types: Dict | None) -> list[str] | None:
+        # Column projection, the missing columns are reported by the validations
+        if not isinstance(types, dict):
+            return None
+        schema = getattr(reader, "schema_arrow", None) or reader.schema
+        return [name for name in schema.names if name in types]
+
+    def _to_dataframe(self, table: Table | RecordBatch, offset: int) -> DataFrame:
+        data = table.to_pandas()
+        data.index = RangeIndex(offset, offset + len(data))
+        return data
+
+    def _coerce(self, data: DataFrame, types: Dict | None) -> DataFrame:
+        if isinstance(types, dict):
+            return coerce_types(data, types)
+        if types is not None:
+            return data.astype(types)
+        return data
+
+
+def _import_pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow.dataset as dataset
+        import pyarrow.parquet as parquet
+    except ImportError as err:
+        raise ImportError("The Parquet importer requires pyarrow") from err
+    return parquet, dataset
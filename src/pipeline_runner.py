@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Iterator, NamedTuple
+
+from pandas import DataFrame
+
+from src.load_checkpoints import LoadCheckpoint, LoadCheckpoints, source_identity
+from src.protocols import DataBaseHandler, ImporterHandler, ResourceHandler
+
+_END = object()  # Marks the end of a queue
+_POLL_SECONDS = 0.1
+
+
+class PipelineResult(NamedTuple):
+    chunks: int
+    rows: int
+
+
+class PipelineRunner:
+    """Run a resource as overlapping import, validation and insert stages.
+
+    The importer produces row chunks, a second thread validates them and the
+    calling thread inserts them, all connected by bounded queues. So parsing
+    chunk N+1 overlaps validating chunk N and inserting chunk N-1, and a slow
+    stage makes the previous ones wait (backpressure) instead of buffering
+    the whole file.
+
+    Every chunk is inserted in the same DB transaction, so the load is all or
+    nothing: if any stage fails the others are stopped and the connection is
+    closed with `rollback=True` before re-raising the error.
+
+    With `checkpoints` each chunk is committed with the count of loaded rows
+    of the source and the `key_columns` of its rows instead, see
+    `LoadCheckpoints`. The checkpoints are kept by source identity, see
+    `source_identity`. A failed or killed run then keeps its committed chunks
+    and a rerun with the same source content skips them (they are still
+    parsed, but not validated nor inserted again). When the content changed
+    (e.g. it was corrected after a validation failure), or it can't be
+    hashed, the rows of the incomplete load are deleted in the transaction
+    of the first chunk and the source is loaded from the start. A completed
+    load is skipped until its checkpoint is cleared or the source content
+    changes. The sources whose content can't be hashed (e.g. a Google Sheet
+    title) need a `source_id` naming their version, which is skipped once
+    completed. The rows are deleted by their `key_columns`, so each chunk is
+    checked to only have new and unique keys, see `check_new_keys`.
+
+    The validations run on each chunk as the resource `input_data`, so the
+    checks across rows (e.g. the `Unique` rule) only cover a chunk at a time.
+    The DB handler is used only from the calling thread, because connections
+    like sqlite3 ones can't be shared between threads.
+    """
+
+    def __init__(
+        self,
+        resource: ResourceHandler,
+        importer: ImporterHandler | None = None,
+        db_handler: DataBaseHandler | None = None,
+        chunksize: int = 10_000,
+        queue_size: int = 2,
+        batch_size: int = 10_000,
+        validate: Callable[[DataFrame], None] | None = None,
+        checkpoints: LoadCheckpoints | None = None,
+        key_columns: list[str] | None = None,
+    ):
+        """Constructor method
+
+        :param resource: The resource to load.
+        :param importer: Defaults to the resource `data_importer`.
+        :param db_handler: Defaults to the resource `db_handler`.
+        :param chunksize: Rows in each chunk.
+        :param queue_size: Chunks waiting between two stages at most.
+        :param batch_size: Rows sent to the database on each call.
+        :param validate: Validation of each chunk. Defaults to setting the
+            chunk as the resource `input_data` and calling `validate_data`.
+        :param checkpoints: Commit each chunk and resume from the last
+            committed one. None loads everything in a single transaction.
+        :param key_columns: Columns identifying a single resource row,
+            required with `checkpoints` to delete the rows of an invalidated
+            load.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be a positive integer, got {queue_size}")
+        if checkpoints and not key_columns:
+            raise ValueError("The key_columns are required to load with checkpoints")
+
+        self.resource = resource
+        self.importer = importer or resource.data_importer
+        self.db_handler = db_handler or resource.db_handler
+        self.chunksize = chunksize
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.validate = validate or self._validate_with_resource
+        self.checkpoints = checkpoints
+        self.key_columns = key_columns
+
+    def run(self, source: str | bytes, source_id: str | None = None) -> PipelineResult:
+        """Load the source into the DB.
+
+        :param source_id: Identity of the source for its checkpoint. Defaults
+            to the one of `source_identity`, e.g. the hash of bytes, so a
+            corrected version of them isn't recognized as the same source.
+            Required for the sources whose content can't be hashed, with
+            their version (e.g. "title@modified time"): a completed load of
+            the same `source_id` isn't repeated.
+        :return: The chunks and rows inserted by this run.
+        """
+        source_hash = ""
+        if self.checkpoints:
+            default_id, source_hash = source_identity(source)
+            if not source_hash and not source_id:
+                msg = (
+                    f"The content of '{source}' can't be hashed, a source_id "
+                    "naming its version is required to load it with checkpoints"
+                )
+                raise ValueError(msg)
+            source_id = source_id or default_id
+        self.db_handler.connect_with_db()
+        try:
+            checkpoint = self._load_checkpoint(source_id, source_hash)
+        except BaseException:
+            self.db_handler.close_db_connection(rollback=True)
+            raise
+        if checkpoint.completed:
+            self.db_handler.close_db_connection()
+            self.resource.validated_data = True
+            return PipelineResult(0, 0)
+
+        source_chunks = self._iter_chunks(source, checkpoint.rows)
+        stop = threading.Event()
+        errors: list[BaseException] = []
+        parsed: Queue = Queue(maxsize=self.queue_size)
+        validated: Queue = Queue(maxsize=self.queue_size)
+        threads = [
+            threading.Thread(
+                target=self._stage,
+                args=(source_chunks, parsed, stop, errors),
+                name="pipeline-import",
+            ),
+            threading.Thread(
+                target=self._stage,
+                args=(self._validated(parsed, stop), validated, stop, errors),
+                name="pipeline-validate",
+            ),
+        ]
+
+        chunks = rows = 0
+        try:
+            for thread in threads:
+                thread.start()
+            for chunk in self._consume(validated, stop):
+                if self.checkpoints:
+                    self.checkpoints.check_new_keys(
+                        self.db_handler,
+                        self.resource.resource_name,
+                        chunk,
+                        self.key_columns,
+                    )
+                self.db_handler.bulk_insert_resource_data(
+                    self.resource.resource_name, chunk, self.batch_size
+                )
+                chunks += 1
+                rows += len(chunk)
+                if self.checkpoints:
+                    rows_loaded = checkpoint.rows + len(chunk)
+                    checkpoint = checkpoint._replace(rows=rows_loaded)
+                    self._save_checkpoint(source_id, checkpoint, chunk)
+                    self.db_handler.commit()
+            if self.checkpoints and not errors:
+                checkpoint = checkpoint._replace(completed=True)
+                self._save_checkpoint(source_id, checkpoint)
+        except BaseException as err:
+            errors.append(err)
+            stop.set()
+        finally:
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            self.db_handler.close_db_connection(rollback=True)
+            raise errors[0]
+        self.db_handler.close_db_connection()
+        self.resource.validated_data = True
+        return PipelineResult(chunks, rows)
+
+    def _load_checkpoint(self, source_id: str, source_hash: str) -> LoadCheckpoint:
+        """The checkpoint to resume from, discarding an invalidated one.
+
+        Without a `source_hash` the `source_id` names the source version, so
+        its completed checkpoint is kept.
+        """
+        if not self.checkpoints:
+            return LoadCheckpoint()
+        resource_name = self.resource.resource_name
+        checkpoint = self.checkpoints.load(self.db_handler, resource_name, source_id)
+        if checkpoint.completed and checkpoint.source_hash == source_hash:
+            return checkpoint
+        if checkpoint.rows and source_hash and checkpoint.source_hash == source_hash:
+            return checkpoint
+        if checkpoint.rows and not checkpoint.completed:
+            # Committed with the first chunk, a failure before keeps the old rows
+            self.checkpoints.discard(
+                self.db_handler, resource_name, source_id, self.key_columns
+            )
+        return LoadCheckpoint(source_hash=source_hash)
+
+    def _save_checkpoint(
+        self, source_id: str, checkpoint: LoadCheckpoint, chunk: DataFrame | None = None
+    ) -> None:
+        resource_name = self.resource.resource_name
+        keys = None if chunk is None else chunk[self.key_columns]
+        self.checkpoints.save(
+            self.db_handler, resource_name, source_id, checkpoint, keys
+        )
+
+    def _iter_chunks(self, source: str | bytes, skip_rows: int) -> Iterator[DataFrame]:
+        """Chunks of the source, without its first `skip_rows` rows."""
+        position = 0
+        for chunk in self._parse_chunks(source):
+            start, position = position, position + len(chunk)
+            if position <= skip_rows:
+                continue
+            yield chunk.iloc[max(skip_rows - start, 0) :]
+
+    def _parse_chunks(self, source: str | bytes) -> Iterator[DataFrame]:
+        section = self.resource.section
+        types = self.resource.expected_input_data_format or None
+        if hasattr(self.importer, "iter_chunks"):
+            yield from self.importer.iter_chunks(source, section, self.chunksize, types)
+            return
+
+        # Importers without streaming support are sliced after loading
+        data = self.importer.load_data(source, section, types)
+        for start in range(0, len(data), self.chunksize):
+            yield data.iloc[start : start + self.chunksize]
+
+    def _validated(self, parsed: Queue, stop: threading.Event) -> Iterator[DataFrame]:
+        for chunk in self._consume(parsed, stop):
+            self.validate(chunk)
+            yield chunk
+
+    def _validate_with_resource(self, chunk: DataFrame) -> None:
+        self.resource.input_data = chunk
+        self.resource.validate_data()
+
+    def _stage(
+        self,
+        items: Iterator[Any],
+        output: Queue,
+        stop: threading.Event,
+        errors: list[BaseException],
+    ) -> None:
+        try:
+            for item in items:
+                if not self._put(output, item, stop):
+                    return
+        except BaseException as err:
+            errors.append(err)
+            stop.set()
+        finally:
+            self._put(output, _END, stop)
+
+    def _put(self, output: Queue, item: Any, stop: threading.Event) -> bool:
+        # Waits while the queue is full, unless another stage failed
+        while not stop.is_set():
+            try:
+                output.put(item, timeout=_POLL_SECONDS)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _consume(self, source: Queue, stop: threading.Event) -> Iterator[DataFrame]:
+        while not stop.is_set():
+            try:
+                item = source.get(timeout=_POLL_SECONDS)
+            except Empty:
+                continue
+            if item is _END:
+                return
+            yield item
@@ -1,9 +1,15 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Dict, Protocol
+from __future__ import annotations
 
-from pandas import DataFrame
+from typing import TYPE_CHECKING, Dict, Iterator, Protocol
+
+# Only needed for the annotations, so importing the protocols stays cheap
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+    from src.validation_rules import ValidationRule
 
 
 class DataBaseHandler(Protocol):
@@ -35,6 +41,10 @@ class DataBaseHandler(Protocol):
         """
         ...
 
+    def commit(self) -> None:
+        """Commit the pending transaction, keeping the connection open."""
+        ...
+
     def insert_resource_data(self, resource_name: str, data: DataFrame) -> None:
         """Insert a resource's data into the database.
 
@@ -43,15 +53,135 @@ class DataBaseHandler(Protocol):
         """
         ...
 
-    def load_resource_data(self, resource_name: str, data: DataFrame) -> DataFrame:
+    def bulk_insert_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        batch_size: int = 10_000,
+        commit_every: int | None = None,
+    ) -> None:
+        """Insert a resource's data into the database in batches.
+
+        Each batch must be sent in a single executemany-style call, with the
+        parameters taken directly from the DataFrame columns (see
+        `common_db_functions.iter_parameter_batches`) instead of building a
+        tuple per row up front.
+
+        :param resource_name: Identifier of the resource.
+        :param data: DataFrame containing the resource data.
+        :param batch_size: Number of rows sent to the database on each call.
+        :param commit_every: Commit after this number of batches. If None, the
+            commit is left to `close_db_connection`, so a rollback discards
+            the whole insert.
+        """
+        ...
+
+    def load_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str] | None = None,
+        chunksize: int = 10_000,
+    ) -> DataFrame:
         """Load resource data from the database, selecting entries based on the given DataFrame.
 
+        The keys must be matched with a set-based query, like a join with a
+        temporary table of keys or chunked IN lists, never one query per key
+        nor a full table read filtered afterwards.
+
         :param resource_name: The name of the resource to load from the database.
         :param data: A DataFrame containing the keys or conditions to select matching records.
+            An empty DataFrame selects every record.
+        :param key_columns: The columns of `data` identifying each record.
+            Defaults to the `data` columns stored in the resource.
+        :param chunksize: Number of records fetched from the database on each call.
         :return: A DataFrame with the loaded resource data.
         """
         ...
 
+    def iter_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str] | None = None,
+        chunksize: int = 10_000,
+    ) -> Iterator[DataFrame]:
+        """Stream the same records of `load_resource_data` in chunks.
+
+        See Also: DataBaseHandler.load_resource_data
+        """
+        ...
+
+    def update_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str],
+        batch_size: int = 10_000,
+    ) -> None:
+        """Update the records matching the key columns with the other columns.
+
+        :param resource_name: Identifier of the resource.
+        :param data: DataFrame with the key columns and the new values.
+        :param key_columns: Columns identifying each record.
+        :param batch_size: Number of rows sent to the database on each call.
+        """
+        ...
+
+    def delete_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str],
+        batch_size: int = 10_000,
+    ) -> None:
+        """Delete the records matching the key columns of the given DataFrame.
+
+        :param resource_name: Identifier of the resource.
+        :param data: DataFrame with the key columns of the records to delete.
+        :param key_columns: Columns identifying each record.
+        :param batch_size: Number of rows sent to the database on each call.
+        """
+        ...
+
+
+class PooledDataBaseHandler(Protocol):
+    """Protocol for pools of warm database connections.
+
+    Many resources importing at the same time share the pool connections
+    instead of paying a full connect/auth handshake on every run. Each
+    resource gets its own `DataBaseHandler` from `handler`: its
+    `connect_with_db` checks out a connection and `close_db_connection` ends
+    the transaction and returns the connection to the pool.
+
+    Implementations must keep between `min_size` and `max_size` connections,
+    check the health of the idle ones before handing them out, give the same
+    connection to nested checkouts from the same thread, and cache the
+    prepared statements of each connection.
+    """
+
+    min_size: int
+    max_size: int
+
+    def set_credentials(self, **credentials) -> None:
+        """Store all necessary credentials to open the pool connections.
+
+        Should be executed before `open_pool`.
+        """
+        ...
+
+    def open_pool(self) -> None:
+        """Open the first `min_size` connections."""
+        ...
+
+    def close_pool(self) -> None:
+        """Close the idle connections, and the checked out ones when released."""
+        ...
+
+    def handler(self) -> DataBaseHandler:
+        """A database handler using the pool connections."""
+        ...
+
 
 class ImporterHandler(Protocol):
     def load_data(
@@ -70,6 +200,20 @@ class ImporterHandler(Protocol):
         ...
 
 
+class AsyncImporterHandler(Protocol):
+    async def load_data(
+        self,
+        source: str | bytes,
+        section: int | str | None = None,
+        types: Dict | None = None,
+    ) -> DataFrame:
+        """Load data from an external file without blocking the event loop.
+
+        See Also: ImporterHandler.load_data
+        """
+        ...
+
+
 class ResourceHandler(Protocol):
     """Protocol for domain resource handlers, e.g., SummaryReports, UsersList,
     etc.
@@ -97,6 +241,10 @@ class ResourceHandler(Protocol):
     :type section: int, str, None
     :param validated_data: state of the data validation. Defaults to False.
     :type validated_data: bool
+    :param validation_rules: Column/field name and its extra rules, e.g.
+        `{"code": [Pattern("[A-Z]{3}-[0-9]+"), Unique()]}`. Declared on the class,
+        so they are compiled only once. See `validation_rules`.
+    :type validation_rules: dict: str, list
     """
 
     data_importer: ImporterHandler
@@ -108,6 +256,7 @@ class ResourceHandler(Protocol):
     resource_name: str
     section: int | str | None
     validated_data: bool = False
+    validation_rules: dict[str, list[ValidationRule]] = {}
 
     def __init__(self, section: str):
         """Constructor method
@@ -126,6 +275,10 @@ class ResourceHandler(Protocol):
     def load_input_data(self, source: str | bytes) -> None:
         """Load input data from a file using the configured importer.
 
+        The `expected_input_data_format` should be passed to the importer as
+        `types`, so the columns are loaded with compact dtypes and the
+        conversion failures reported by `validate_data`.
+
         :param source: Source file path, URL, or raw data (must include extension).
         """
         ...
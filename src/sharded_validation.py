@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+
+import numpy
+from numpy import ndarray
+from pandas import DataFrame, Series
+
+from src.cell_validators import (
+    classify_cell_characters,
+    find_blank_cells,
+    find_invalid_cells,
+    split_cells,
+    string_cells,
+)
+from src.validation_errors import ErrorRecord
+
+_ALIGNMENT = 8
+
+
+class SharedArray(NamedTuple):
+    """Location of an array inside the shared memory block of a shard."""
+
+    offset: int
+    dtype: str
+    length: int
+
+
+class ColumnSpec(NamedTuple):
+    """Arrays of a column shard. `text` is the utf-8 `join_cells` buffer of
+    the str cells, None for non-str columns, and `positions` are the
+    positions of those cells, None when every cell is a str."""
+
+    position: int
+    label: str
+    check_missing: bool
+    nulls: SharedArray
+    positions: SharedArray | None
+    text: SharedArray | None
+
+
+class ShardSpec(NamedTuple):
+    memory_name: str
+    rows: SharedArray
+    columns: list[ColumnSpec]
+
+
+class ShardResult(NamedTuple):
+    # Both keyed by the column position in the validated DataFrame
+    missing_rows: dict[int, ndarray]
+    character_records: dict[int, list[ErrorRecord]]
+
+
+def validate_in_shards(
+    data: DataFrame,
+    required_fields: list[str],
+    workers: int | None = None,
+    rows_per_shard: int | None = None,
+) -> tuple[dict[str, ndarray], list[ErrorRecord]]:
+    """Run the missing values and the cells characters checks in a process pool.
+
+    The columns are split into one group per worker, and each group into row
+    ranges of `rows_per_shard` for very tall sheets. Each shard is copied
+    once into a shared memory block as plain numpy arrays (the str cells as
+    one utf-8 buffer, see `join_cells`), so the workers map it instead of
+    unpickling a DataFrame. The results are merged in the column and row
+    order of the serial checks.
+
+    :return: The missing rows of each required field, in the required fields
+        order, and the invalid characters records, in column order.
+    """
+    workers = workers or os.cpu_count() or 1
+    n_rows, n_columns = data.shape
+    rows_per_shard = rows_per_shard or max(n_rows, 1)
+    if rows_per_shard < 1:
+        msg = f"rows_per_shard must be a positive integer, got {rows_per_shard}"
+        raise ValueError(msg)
+
+    column_groups = [
+        group
+        for group in numpy.array_split(numpy.arange(n_columns), workers)
+        if len(group) > 0
+    ]
+    human_rows = data.index.to_numpy().astype(numpy.int64) + 2  # +1 0-idx +1 header
+    required = set(required_fields)
+
+    missing_rows: dict[int, list[ndarray]] = {}
+    character_records: dict[int, list[ErrorRecord]] = {}
+    shared_blocks: list[SharedMemory] = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures: list[Future] = []
+            # Built while the previous shards are already being validated
+            for group in column_groups:
+                for start in range(0, n_rows, rows_per_shard):
+                    rows = slice(start, start + rows_per_shard)
+                    block, spec = _share_shard(data, group, rows, human_rows, required)
+                    shared_blocks.append(block)
+                    futures.append(executor.submit(_validate_shard, spec))
+
+            for future in futures:
+                result = future.result()
+                for position, rows in result.missing_rows.items():
+                    missing_rows.setdefault(position, []).append(rows)
+                for position, records in result.character_records.items():
+                    character_records.setdefault(position, []).extend(records)
+    finally:
+        for block in shared_blocks:
+            block.close()
+            block.unlink()
+
+    labels = list(data.columns)
+    missing_by_label = {
+        labels[position]: numpy.concatenate(rows)
+        for position, rows in missing_rows.items()
+    }
+    missing_by_field = {
+        field: missing_by_label[field]
+        for field in required_fields
+        if field in missing_by_label
+    }
+    records = [
+        record
+        for position in sorted(character_records)
+        for record in character_records[position]
+    ]
+    return missing_by_field, records
+
+
+def _share_shard(
+    data: DataFrame,
+    columns: ndarray,
+    rows: slice,
+    human_rows: ndarray,
+    required: set[str],
+) -> tuple[SharedMemory, ShardSpec]:
+    arrays: list[ndarray] = [human_rows[rows]]
+
+    def add(array: ndarray | None) -> int | None:
+        if array is None:
+            return None
+        arrays.append(array)
+        return len(arrays) - 1
+
+    column_arrays = []
+    for position in columns:
+        nulls, positions, text = _column_arrays(data.iloc[rows, position])
+        column_arrays.append((int(position), add(nulls), add(positions), add(text)))
+
+    block, shared = _copy_to_shared_memory(arrays)
+    labels = data.columns
+    column_specs = [
+        ColumnSpec(
+            position,
+            labels[position],
+            labels[position] in required,
+            shared[nulls],
+            None if positions is None else shared[positions],
+            None if text is None else shared[text],
+        )
+        for position, nulls, positions, text in column_arrays
+    ]
+    return block, ShardSpec(block.name, shared[0], column_specs)
+
+
+def _copy_to_shared_memory(
+    arrays: list[ndarray],
+) -> tuple[SharedMemory, list[SharedArray]]:
+    offsets = []
+    size = 0
+    for array in arrays:
+        offsets.append(size)
+        size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+    block = SharedMemory(create=True, size=max(size, 1))
+    shared = []
+    for array, offset in zip(arrays, offsets):
+        location = SharedArray(offset, array.dtype.str, len(array))
+        _view(block, location)[:] = array
+        shared.append(location)
+    return block, shared
+
+
+def _column_arrays(content: Series) -> tuple[ndarray, ndarray | None, ndarray | None]:
+    nulls = content.isna().to_numpy(dtype=bool)
+    cells = string_cells(content)
+    if cells is None:  # numeric or datetime, no strings
+        return nulls, None, None
+
+    # Variable width, unlike a numpy str array padded to the longest cell
+    text = numpy.frombuffer(cells.buffer.encode("utf-8"), dtype=numpy.uint8)
+    return nulls, cells.positions, text
+
+
+def _validate_shard(spec: ShardSpec) -> ShardResult:
+    # Module level, so it can be pickled into the worker processes
+    block = SharedMemory(name=spec.memory_name)
+    try:
+        return _scan_shard(block, spec)
+    finally:
+        block.close()
+
+
+def _scan_shard(block: SharedMemory, spec: ShardSpec) -> ShardResult:
+    result = ShardResult({}, {})
+    human_rows = _view(block, spec.rows)
+    for column in spec.columns:
+        nulls = _view(block, column.nulls)
+        positions = None if column.positions is None else _view(block, column.positions)
+        text = None if column.text is None else str(_view(block, column.text), "utf-8")
+
+        if column.check_missing:
+            missing = nulls.copy()
+            if text is not None:
+                blank_cells = find_blank_cells(text)
+                if positions is not None:
+                    blank_cells = positions[blank_cells]
+                missing[blank_cells] = True
+            if missing.any():
+                result.missing_rows[column.position] = human_rows[missing]
+
+        if text is None:
+            continue
+        strings = split_cells(text)
+        records = []
+        for cell in find_invalid_cells(strings, text):
+            value = strings[cell]
+            code = classify_cell_characters(value)
+            if code:
+                row = cell if positions is None else positions[cell]
+                human_row = int(human_rows[row])
+                records.append(ErrorRecord(code, column.label, human_row, value))
+        if records:
+            result.character_records[column.position] = records
+    return result
+
+
+def _view(block: SharedMemory, array: SharedArray) -> ndarray:
+    dtype = numpy.dtype(array.dtype)
+    return numpy.ndarray((array.length,), dtype, block.buf, array.offset)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sqlite3
+from typing import Iterator
+from uuid import uuid4
+
+from pandas import DataFrame, concat
+
+from src.common_db_functions import iter_parameter_batches, quote_identifier
+
+
+class SQLiteDataBaseHandler:
+    """Reference `DataBaseHandler` implementation over the stdlib sqlite3."""
+
+    DEFAULT_DATABASE = ":memory:"
+
+    def __init__(self):
+        self.database: str = self.DEFAULT_DATABASE
+        self.connection: sqlite3.Connection | None = None
+
+    def set_credentials(self, **credentials) -> None:
+        self.database = str(credentials.get("database") or self.DEFAULT_DATABASE)
+
+    def connect_with_db(self) -> None:
+        try:
+            self.connection = sqlite3.connect(self.database)
+        except sqlite3.Error as err:
+            raise ConnectionError(f"Can't connect with '{self.database}'", err)
+
+    def close_db_connection(self, rollback: bool = False) -> None:
+        if self.connection is None:
+            return
+        if rollback:
+            self.connection.rollback()
+        else:
+            self.connection.commit()
+        self.connection.close()
+        self.connection = None
+
+    def commit(self) -> None:
+        self._get_connection().commit()
+
+    def insert_resource_data(self, resource_name: str, data: DataFrame) -> None:
+        self.bulk_insert_resource_data(resource_name, data)
+
+    def bulk_insert_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        batch_size: int = 10_000,
+        commit_every: int | None = None,
+    ) -> None:
+        connection = self._get_connection()
+        self._create_table_if_not_exists(resource_name, data)
+
+        columns = ", ".join(quote_identifier(label) for label in data.columns)
+        placeholders = ", ".join("?" * len(data.columns))
+        table = quote_identifier(resource_name)
+        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+
+        cursor = connection.cursor()
+        try:
+            batches = iter_parameter_batches(data, batch_size)
+            for batch_number, parameters in enumerate(batches, start=1):
+                cursor.executemany(query, parameters)
+                if commit_every and batch_number % commit_every == 0:
+                    connection.commit()
+        finally:
+            cursor.close()
+
+    def update_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str],
+        batch_size: int = 10_000,
+    ) -> None:
+        value_columns = [label for label in data.columns if label not in key_columns]
+        if not value_columns:
+            return
+        assignments = ", ".join(f"{quote_identifier(lbl)} = ?" for lbl in value_columns)
+        self.create_key_index(resource_name, key_columns)
+        table = quote_identifier(resource_name)
+        query = f"UPDATE {table} SET {assignments} WHERE {self._match(key_columns)}"
+        self._execute_in_batches(query, data[value_columns + key_columns], batch_size)
+
+    def delete_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str],
+        batch_size: int = 10_000,
+    ) -> None:
+        self.create_key_index(resource_name, key_columns)
+        table = quote_identifier(resource_name)
+        query = f"DELETE FROM {table} WHERE {self._match(key_columns)}"
+        self._execute_in_batches(query, data[key_columns], batch_size)
+
+    def load_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str] | None = None,
+        chunksize: int = 10_000,
+    ) -> DataFrame:
+        chunks = list(
+            self.iter_resource_data(resource_name, data, key_columns, chunksize)
+        )
+        if chunks:
+            return concat(chunks, ignore_index=True)
+        columns = self._table_columns(resource_name)
+        return DataFrame(columns=columns or ([] if data is None else data.columns))
+
+    def iter_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str] | None = None,
+        chunksize: int = 10_000,
+    ) -> Iterator[DataFrame]:
+        """Stream the records matching the keys, `chunksize` rows at a time.
+
+        The keys are inserted in a temporary table and joined with the
+        resource table, so any number of keys takes one query plus a few
+        batched inserts. Reading never changes the schema: the join uses the
+        index of the key columns once `create_key_index` (also run by the
+        keyed updates and deletes) has created it.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+        table_columns = self._table_columns(resource_name)
+        if not table_columns:
+            return
+
+        table = quote_identifier(resource_name)
+        if data is None or data.empty:
+            yield from self._fetch_chunks(f"SELECT * FROM {table}", chunksize)
+            return
+
+        if key_columns is None:
+            key_columns = [label for label in data.columns if label in table_columns]
+        available_columns = set(table_columns) & set(data.columns)
+        missing_keys = set(key_columns) - available_columns
+        if missing_keys or not key_columns:
+            msg = f"Missing key column(s) to load '{resource_name}': {missing_keys}"
+            raise ValueError(msg)
+
+        keys_table = self._create_keys_table(data[key_columns].drop_duplicates())
+        try:
+            join = " AND ".join(
+                f"t.{quote_identifier(label)} = k.{quote_identifier(label)}"
+                for label in key_columns
+            )
+            query = (
+                f"SELECT t.* FROM {table} AS t JOIN temp.{keys_table} AS k "
+                f"ON {join} ORDER BY t.rowid"
+            )
+            yield from self._fetch_chunks(query, chunksize)
+        finally:
+            self._get_connection().execute(f"DROP TABLE IF EXISTS temp.{keys_table}")
+
+    def create_key_index(self, resource_name: str, key_columns: list[str]) -> None:
+        """Index the key columns of the table, for the keyed loads and writes."""
+        index = quote_identifier("__".join(["ix", resource_name, *key_columns]))
+        columns = ", ".join(quote_identifier(label) for label in key_columns)
+        table = quote_identifier(resource_name)
+        query = f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({columns})"
+        self._get_connection().execute(query)
+
+    def _fetch_chunks(self, query: str, chunksize: int) -> Iterator[DataFrame]:
+        cursor = self._get_connection().execute(query)
+        try:
+            columns = [description[0] for description in cursor.description]
+            while rows := cursor.fetchmany(chunksize):
+                yield DataFrame.from_records(rows, columns=columns, coerce_float=True)
+        finally:
+            cursor.close()
+
+    def _create_keys_table(self, keys: DataFrame) -> str:
+        keys_table = quote_identifier(f"_keys_{uuid4().hex}")
+        columns = ", ".join(quote_identifier(label) for label in keys.columns)
+        placeholders = ", ".join("?" * len(keys.columns))
+        connection = self._get_connection()
+        connection.execute(f"CREATE TEMP TABLE {keys_table} ({columns})")
+        query = f"INSERT INTO temp.{keys_table} VALUES ({placeholders})"
+        for parameters in iter_parameter_batches(keys, 10_000):
+            connection.executemany(query, parameters)
+        return keys_table
+
+    def _table_columns(self, resource_name: str) -> list[str]:
+        query = f"PRAGMA table_info({quote_identifier(resource_name)})"
+        return [row[1] for row in self._get_connection().execute(query)]
+
+    def _match(self, key_columns: list[str]) -> str:
+        return " AND ".join(f"{quote_identifier(label)} = ?" for label in key_columns)
+
+    def _execute_in_batches(self, query: str, data: DataFrame, batch_size: int) -> None:
+        cursor = self._get_connection().cursor()
+        try:
+            for parameters in iter_parameter_batches(data, batch_size):
+                cursor.executemany(query, parameters)
+        finally:
+            cursor.close()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self.connection is None:
+            raise ConnectionError("No DB connection. Try 'connect_with_db' first.")
+        return self.connection
+
+    def _create_table_if_not_exists(self, resource_name: str, data: DataFrame) -> None:
+        columns = ", ".join(quote_identifier(label) for label in data.columns)
+        table = quote_identifier(resource_name)
+        query = f"CREATE TABLE IF NOT EXISTS {table} ({columns})"
+        self._get_connection().execute(query)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import itertools
+import sqlite3
+import threading
+import time
+from collections import deque
+
+from src.sqlite_handler import SQLiteDataBaseHandler
+
+_pool_ids = itertools.count()
+
+
+class PooledSQLiteHandler(SQLiteDataBaseHandler):
+    """`DataBaseHandler` borrowing its connection from a `SQLiteConnectionPool`.
+
+    `connect_with_db` checks out a warm connection and `close_db_connection`
+    ends the transaction and returns it to the pool instead of closing it.
+    """
+
+    def __init__(self, pool: "SQLiteConnectionPool"):
+        super().__init__()
+        self.pool = pool
+        self.database = pool.database
+
+    def set_credentials(self, **credentials) -> None:
+        raise ValueError("The credentials of a pooled handler are set on its pool")
+
+    def connect_with_db(self) -> None:
+        if self.connection is None:
+            self.connection = self.pool.acquire()
+
+    def close_db_connection(self, rollback: bool = False) -> None:
+        if self.connection is None:
+            return
+        connection, self.connection = self.connection, None
+        self.pool.release(connection, rollback)
+
+
+class SQLiteConnectionPool:
+    """Reference `PooledDataBaseHandler` implementation over the stdlib sqlite3.
+
+    Idle connections are reused last-in first-out, so the warmest ones (with
+    their statement cache filled) are handed out first. A thread checking
+    out again before releasing gets its same connection back, so nested
+    handlers share one transaction.
+
+    The `:memory:` database is shared by all the connections of a pool.
+    File databases are opened in WAL mode, so readers don't block writers.
+    """
+
+    DEFAULT_DATABASE = ":memory:"
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 5,
+        timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+        statement_cache_size: int = 256,
+    ):
+        """Constructor method
+
+        :param min_size: Connections opened with the pool and kept open.
+        :param max_size: Connections open at the same time at most.
+        :param timeout: Seconds to wait for a free connection, and for the
+            database locks of the other connections.
+        :param health_check_interval: Idle seconds after which a connection
+            is pinged before being handed out again.
+        :param statement_cache_size: Prepared statements cached by connection.
+        """
+        if not 0 <= min_size <= max_size or max_size < 1:
+            msg = f"Invalid pool size: min_size={min_size}, max_size={max_size}"
+            raise ValueError(msg)
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.statement_cache_size = statement_cache_size
+        self.database: str = self.DEFAULT_DATABASE
+        self.created_count = 0
+
+        self._idle: deque[tuple[sqlite3.Connection, float]] = deque()
+        self._open_count = 0
+        self._condition = threading.Condition()
+        self._checkouts = threading.local()
+        self._memory_anchor: sqlite3.Connection | None = None
+        self._memory_uri = f"file:pool-{next(_pool_ids)}?mode=memory&cache=shared"
+        self._closed = True
+
+    def set_credentials(self, **credentials) -> None:
+        self.database = str(credentials.get("database") or self.DEFAULT_DATABASE)
+
+    def open_pool(self) -> None:
+        with self._condition:
+            if not self._closed:
+                return
+            self._closed = False
+            if self.database == self.DEFAULT_DATABASE:
+                # Keeps the shared in-memory database alive while the pool is open
+                self._memory_anchor = self._connect()
+                self.created_count += 1
+            for _ in range(self.min_size):
+                self._idle.append((self._connect(), time.monotonic()))
+                self._open_count += 1
+                self.created_count += 1
+
+    def close_pool(self) -> None:
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                connection, _ = self._idle.pop()
+                connection.close()
+                self._open_count -= 1
+            if self._memory_anchor is not None:
+                self._memory_anchor.close()
+                self._memory_anchor = None
+            self._condition.notify_all()
+
+    def handler(self) -> PooledSQLiteHandler:
+        return PooledSQLiteHandler(self)
+
+    def acquire(self) -> sqlite3.Connection:
+        checkout = getattr(self._checkouts, "connection", None)
+        if checkout is not None:
+            self._checkouts.depth += 1
+            return checkout
+
+        connection = self._checkout()
+        self._checkouts.connection = connection
+        self._checkouts.depth = 1
+        self._checkouts.rollback = False
+        return connection
+
+    def release(self, connection: sqlite3.Connection, rollback: bool = False) -> None:
+        """Return a connection checked out by this thread.
+
+        The transaction ends when the outermost checkout is released. It is
+        rolled back if any of the nested checkouts asked for it.
+        """
+        if getattr(self._checkouts, "connection", None) is not connection:
+            raise ValueError("The connection wasn't checked out by this thread")
+        self._checkouts.rollback |= rollback
+        self._checkouts.depth -= 1
+        if self._checkouts.depth > 0:
+            return
+        self._checkouts.connection = None
+
+        try:
+            if self._checkouts.rollback:
+                connection.rollback()
+            else:
+                connection.commit()
+        except sqlite3.Error:
+            # Broken connection, replaced on the next checkout
+            connection.close()
+            with self._condition:
+                self._open_count -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            if self._closed:
+                connection.close()
+                self._open_count -= 1
+            else:
+                self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    def _checkout(self) -> sqlite3.Connection:
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise ConnectionError("The pool is closed. Try 'open_pool' first.")
+                if self._idle:
+                    connection, idle_since = self._idle.pop()
+                    if self._is_healthy(connection, idle_since):
+                        return connection
+                    connection.close()
+                    self._open_count -= 1
+                    continue
+                if self._open_count < self.max_size:
+                    # The slot is reserved here and connected outside the lock,
+                    # so the other checkouts and releases don't wait for it
+                    self._open_count += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    msg = f"No free connection in the pool after {self.timeout}s"
+                    raise ConnectionError(msg)
+
+        try:
+            connection = self._connect()
+        except BaseException:
+            with self._condition:
+                self._open_count -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self.created_count += 1
+            if not self._closed:
+                return connection
+            connection.close()
+            self._open_count -= 1
+        raise ConnectionError("The pool is closed. Try 'open_pool' first.")
+
+    def _is_healthy(self, connection: sqlite3.Connection, idle_since: float) -> bool:
+        if time.monotonic() - idle_since < self.health_check_interval:
+            return True
+        try:
+            connection.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _connect(self) -> sqlite3.Connection:
+        database, uri = self.database, False
+        if database == self.DEFAULT_DATABASE:
+            database, uri = self._memory_uri, True
+        try:
+            connection = sqlite3.connect(
+                database,
+                timeout=self.timeout,
+                cached_statements=self.statement_cache_size,
+                check_same_thread=False,  # checked out by one thread at a time
+                uri=uri,
+            )
+            if not uri:
+                connection.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error as err:
+            raise ConnectionError(f"Can't connect with '{self.database}'", err)
+        return connection
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections import Counter
+from typing import Any, Callable, Iterable, NamedTuple, SupportsIndex
+
+MISSING_FIELD = "missing_field"
+MISSING_VALUE = "missing_value"
+INVALID_TYPE = "invalid_type"
+INVALID_CHARACTER = "invalid_character"
+INVALID_FIRST_CHAR = "invalid_first_char"
+INVALID_LAST_CHAR = "invalid_last_char"
+RULE_VIOLATION = "rule_violation"
+CUSTOM_ERROR = "custom_error"
+
+# Codes rendered as one block listing every field, or the rows by column
+_BLOCK_HEADERS = {
+    MISSING_FIELD: "Missing required field(s):\n",
+    MISSING_VALUE: "Missing data in mandatory fields:\n",
+    INVALID_TYPE: "Invalid data type in fields:\n",
+}
+# Codes counted as one problem per column instead of one per record
+_PER_COLUMN_CODES = (MISSING_VALUE, INVALID_TYPE)
+
+
+class ErrorRecord(NamedTuple):
+    """A compact validation problem, rendered to text only when displayed.
+
+    :param code: Kind of problem, one of the module codes.
+    :param column: Label of the affected column.
+    :param row: Human row number (+1 for 0-idx, +1 for the header row).
+    :param value: The offending value or extra detail (e.g. the expected type).
+        For rule violations, the value and the description of the rule.
+    """
+
+    code: str
+    column: str | None = None
+    row: int | None = None
+    value: Any = None
+
+
+class ErrorMessages(list):
+    """The rendered messages, writing every change through to the validator.
+
+    Lets the code written for a plain `errors` list keep changing it. The
+    appended messages are passed to `add_message`, and after any other change
+    (e.g. `remove`, `clear` or a slice assignment) the whole list is passed to
+    `set_messages`.
+    """
+
+    def __init__(
+        self,
+        messages: Iterable[str],
+        add_message: Callable[[str], None],
+        set_messages: Callable[[list[str]], None],
+    ):
+        super().__init__(messages)
+        self._add_message = add_message
+        self._set_messages = set_messages
+
+    def append(self, message: str) -> None:
+        super().append(message)
+        self._add_message(message)
+
+    def extend(self, messages: Iterable[str]) -> None:
+        for message in messages:
+            self.append(message)
+
+    def __iadd__(self, messages: Iterable[str]) -> "ErrorMessages":
+        self.extend(messages)
+        return self
+
+    def insert(self, index: SupportsIndex, message: str) -> None:
+        super().insert(index, message)
+        self._changed()
+
+    def remove(self, message: str) -> None:
+        super().remove(message)
+        self._changed()
+
+    def pop(self, index: SupportsIndex = -1) -> str:
+        message = super().pop(index)
+        self._changed()
+        return message
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __imul__(self, times: SupportsIndex) -> "ErrorMessages":
+        super().__imul__(times)
+        self._changed()
+        return self
+
+    def _changed(self) -> None:
+        self._set_messages(list(self))
+
+
+class ErrorStore:
+    """Bounded store of validation problems.
+
+    Only the first `max_errors` records are kept with their details, but the
+    counts by code and column are always exact.
+    """
+
+    def __init__(self, max_errors: int | None = None):
+        self.max_errors = max_errors
+        self.records: list[ErrorRecord] = []
+        self.counts: Counter[tuple[str, str | None]] = Counter()
+        self.column_details: dict[tuple[str, str | None], Any] = {}
+
+    def __len__(self) -> int:
+        return self.problems_count
+
+    @property
+    def problems_count(self) -> int:
+        problems = 0
+        for (code, _), count in self.counts.items():
+            problems += 1 if code in _PER_COLUMN_CODES else count
+        return problems
+
+    @property
+    def omitted_count(self) -> int:
+        return sum(self.counts.values()) - len(self.records)
+
+    @property
+    def is_full(self) -> bool:
+        return self.max_errors is not None and len(self.records) >= self.max_errors
+
+    def add(
+        self,
+        code: str,
+        column: str | None = None,
+        row: int | None = None,
+        value: Any = None,
+    ) -> None:
+        self.counts[(code, column)] += 1
+        if self.max_errors is None or len(self.records) < self.max_errors:
+            self.records.append(ErrorRecord(code, column, row, value))
+
+    def add_rows(
+        self, code: str, column: str, rows: Iterable[int], value: Any = None
+    ) -> None:
+        """Add a problem for each row of the column, e.g. missing values.
+
+        The `value` is a detail of the whole column, like the expected type.
+        """
+        rows = list(rows)
+        self.counts[(code, column)] += len(rows)
+        if value is not None:
+            self.column_details[(code, column)] = value
+        capacity = len(rows)
+        if self.max_errors is not None:
+            capacity = max(self.max_errors - len(self.records), 0)
+        self.records.extend(
+            ErrorRecord(code, column, int(row)) for row in rows[:capacity]
+        )
+
+    def column_counts(self) -> dict[str, int]:
+        """Exact number of records by column, including the omitted ones."""
+        columns: Counter[str] = Counter()
+        for (_, column), count in self.counts.items():
+            columns[str(column)] += count
+        return dict(columns)
+
+    def render(self) -> list[str]:
+        """Build the human messages, one for each problem or block."""
+        messages: list[str] = []
+        rendered_blocks: set[str] = set()
+        for record in self.records:
+            if record.code not in _BLOCK_HEADERS:
+                messages.append(self._render_record(record))
+            elif record.code not in rendered_blocks:
+                rendered_blocks.add(record.code)
+                messages.append(self._render_block(record.code))
+
+        # Blocks with every record over the cap
+        for code, _ in self.counts:
+            if code in _BLOCK_HEADERS and code not in rendered_blocks:
+                rendered_blocks.add(code)
+                messages.append(self._render_block(code))
+
+        # The omitted rows of the blocks are already reported inside them
+        omitted_records = sum(
+            count
+            for (code, _), count in self.counts.items()
+            if code not in _BLOCK_HEADERS
+        ) - sum(1 for record in self.records if record.code not in _BLOCK_HEADERS)
+        if omitted_records > 0:
+            messages.append(f"... and {omitted_records} more problem(s) not shown.")
+        return messages
+
+    def _code_count(self, code: str) -> int:
+        counts = self.counts.items()
+        return sum(count for (count_code, _), count in counts if count_code == code)
+
+    def _render_record(self, record: ErrorRecord) -> str:
+        location = f"in column '{record.column}' row '{record.row}'."
+        if record.code == INVALID_CHARACTER:
+            return f"Invalid character {location}"
+        if record.code == INVALID_FIRST_CHAR:
+            return f"Invalid first char: '{record.value}' {location}"
+        if record.code == INVALID_LAST_CHAR:
+            return f"Invalid last char: '{record.value}' {location}"
+        if record.code == RULE_VIOLATION:
+            value, rule = record.value
+            return f"Invalid value '{value}' {location} It must {rule}."
+        if record.code == CUSTOM_ERROR:
+            return str(record.value)
+        return f"Problem '{record.code}' {location}"
+
+    def _render_block(self, code: str) -> str:
+        records = [record for record in self.records if record.code == code]
+        parts = [_BLOCK_HEADERS[code]]
+        if code == MISSING_FIELD:
+            parts.extend(f"   - {record.column}\n" for record in records)
+            omitted_fields = self._code_count(code) - len(records)
+            if omitted_fields > 0:
+                parts.append(f"   - ... and {omitted_fields} more field(s)\n")
+            return "".join(parts)
+
+        rows_by_column: dict[str | None, list[ErrorRecord]] = {}
+        for record in records:
+            rows_by_column.setdefault(record.column, []).append(record)
+        for block_code, column in self.counts:
+            if block_code == code:
+                rows_by_column.setdefault(column, [])
+
+        for column, column_records in rows_by_column.items():
+            if code == INVALID_TYPE:
+                expected = self.column_details.get((code, column))
+                parts.append(f"  - Column '{column}' (expected {expected}):\n")
+            else:
+                parts.append(f"  - Column '{column}':\n")
+            parts.extend(f"    - Row {record.row}\n" for record in column_records)
+            omitted_rows = self.counts[(code, column)] - len(column_records)
+            if omitted_rows > 0:
+                parts.append(f"    - ... and {omitted_rows} more row(s)\n")
+        return "".join(parts)
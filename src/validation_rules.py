@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import datetime
+import re
+from functools import cache
+from numbers import Number, Real
+from typing import Any, Callable, NamedTuple
+
+import numpy
+from numpy import ndarray
+from pandas import Series, Timestamp, to_datetime, to_numeric
+
+from src.cell_validators import missing_values
+from src.validation_errors import RULE_VIOLATION, ErrorRecord
+
+
+class Pattern(NamedTuple):
+    """The cell text must fully match the regex."""
+
+    regex: str
+
+    def describe(self) -> str:
+        return f"match '{self.regex}'"
+
+
+class Length(NamedTuple):
+    """The cell text must have between `min` and `max` characters."""
+
+    min: int | None = None
+    max: int | None = None
+
+    def describe(self) -> str:
+        return f"have {_describe_bounds(self.min, self.max)} characters"
+
+
+class AllowedValues(NamedTuple):
+    """The cell value must be one of `values`."""
+
+    values: tuple
+
+    def describe(self) -> str:
+        return f"be one of {', '.join(map(repr, self.values))}"
+
+
+class Range(NamedTuple):
+    """The cell value must be a number (or date) between `min` and `max`."""
+
+    min: Any = None
+    max: Any = None
+
+    def describe(self) -> str:
+        return f"be {_describe_bounds(self.min, self.max)}"
+
+
+class Unique(NamedTuple):
+    """The cell value can't be repeated in the column."""
+
+    def describe(self) -> str:
+        return "be unique in the column"
+
+
+ValidationRule = Pattern | Length | AllowedValues | Range | Unique
+
+
+# Backreferences and conditionals refer to the groups by their number, which
+# changes when the pattern is merged with others
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+class ColumnCells:
+    """The non-missing cells of a column, shared by all the rules on it."""
+
+    def __init__(self, content: Series, patterns: re.Pattern | None):
+        self.values = content[~missing_values(content)]
+        self._patterns = patterns
+        self._strings: ndarray | None = None
+        self._pattern_failures: ndarray | None = None
+
+    @property
+    def strings(self) -> ndarray:
+        if self._strings is None:
+            self._strings = self.values.astype(str).to_numpy(dtype="object")
+        return self._strings
+
+    @property
+    def pattern_failures(self) -> ndarray:
+        """Cells failing any of the patterns, found in a single scan."""
+        if self._pattern_failures is None:
+            match = self._patterns.match  # type: ignore[union-attr]
+            matched = map(match, self.strings)
+            self._pattern_failures = numpy.fromiter(
+                (result is None for result in matched), bool, len(self.strings)
+            )
+        return self._pattern_failures
+
+
+class ColumnRules:
+    """The rules of a column compiled into vectorized predicates.
+
+    Every predicate returns the mask of the cells breaking its rule. The
+    patterns are also merged into a single regex of lookaheads, so a column
+    is only scanned once no matter how many patterns it has. Each merged
+    pattern is then only checked on the cells that failed the merged one.
+    Patterns with global inline flags (e.g. `(?i)`) or references to their
+    groups can't be merged, so they are checked on every cell instead.
+    """
+
+    def __init__(self, label: str, rules: list[ValidationRule]):
+        self.label = label
+        self.rules = tuple(rules)
+        patterns = [rule.regex for rule in self.rules if isinstance(rule, Pattern)]
+        merged = [regex for regex in patterns if _can_merge(regex)]
+        self.patterns = None
+        if merged:
+            lookaheads = "".join(f"(?=(?:{regex})\\Z)" for regex in merged)
+            try:
+                self.patterns = re.compile(lookaheads)
+            except re.error:  # e.g. the same group name in two patterns
+                merged = []
+        self.predicates = [
+            _compile_rule(rule, merged=getattr(rule, "regex", None) in merged)
+            for rule in self.rules
+        ]
+
+    def evaluate(self, content: Series) -> list[ErrorRecord]:
+        """Records of the broken rules, by row and then by rule order."""
+        cells = ColumnCells(content, self.patterns)
+        if cells.values.empty or not self.predicates:
+            return []
+
+        violations = numpy.vstack([predicate(cells) for predicate in self.predicates])
+        # +1 for 0-idx and +1 for the header row
+        human_rows = cells.values.index.to_numpy().astype(int) + 2
+        records = []
+        for cell, rule in zip(*numpy.nonzero(violations.T)):
+            human_row = int(human_rows[cell])
+            details = (cells.values.iloc[cell], self.rules[rule].describe())
+            records.append(ErrorRecord(RULE_VIOLATION, self.label, human_row, details))
+        return records
+
+
+@cache
+def compile_resource_rules(resource_class: type) -> dict[str, ColumnRules]:
+    """Compile the `validation_rules` of a resource class, only once per class."""
+    rules = getattr(resource_class, "validation_rules", None) or {}
+    return {label: ColumnRules(label, rules[label]) for label in rules}
+
+
+def _can_merge(regex: str) -> bool:
+    """If the pattern keeps its meaning inside the merged regex."""
+    compiled = re.compile(regex)
+    global_flags = compiled.flags & ~re.UNICODE
+    return not global_flags and not _GROUP_REFERENCE.search(regex)
+
+
+def _compile_rule(
+    rule: ValidationRule, merged: bool = False
+) -> Callable[[ColumnCells], ndarray]:
+    """Predicate of the rule.
+
+    :param merged: The rule is a pattern merged into `ColumnRules.patterns`.
+    """
+    if isinstance(rule, Pattern) and not merged:
+        regex = re.compile(rule.regex)
+
+        def predicate(cells: ColumnCells) -> ndarray:
+            strings = cells.strings
+            failures = (regex.fullmatch(text) is None for text in strings)
+            return numpy.fromiter(failures, bool, len(strings))
+
+    elif isinstance(rule, Pattern):
+        regex = re.compile(rule.regex)
+
+        def predicate(cells: ColumnCells) -> ndarray:
+            failures = cells.pattern_failures.copy()
+            candidates = numpy.flatnonzero(failures)
+            failures[candidates] = [
+                regex.fullmatch(text) is None for text in cells.strings[candidates]
+            ]
+            return failures
+
+    elif isinstance(rule, Length):
+
+        def predicate(cells: ColumnCells) -> ndarray:
+            strings = cells.strings
+            lengths = numpy.fromiter(map(len, strings), int, len(strings))
+            return _out_of_bounds(lengths, rule.min, rule.max)
+
+    elif isinstance(rule, AllowedValues):
+
+        def predicate(cells: ColumnCells) -> ndarray:
+            return ~cells.values.isin(rule.values).to_numpy(dtype=bool)
+
+    elif isinstance(rule, Range):
+        bounds = [bound for bound in (rule.min, rule.max) if bound is not None]
+        if all(isinstance(bound, Real) for bound in bounds):
+            as_range_values = _as_numbers
+            minimum, maximum = rule.min, rule.max
+        elif all(_is_date(bound) for bound in bounds):
+            as_range_values = _as_dates
+            minimum, maximum = (
+                None if bound is None else Timestamp(bound)
+                for bound in (rule.min, rule.max)
+            )
+        else:
+            raise ValueError(f"Range bounds must be numbers or dates: {rule!r}")
+
+        def predicate(cells: ColumnCells) -> ndarray:
+            values = as_range_values(cells.values)
+            # Values that can't be compared (e.g. text) are out of range too
+            invalid = values.isna().to_numpy(dtype=bool)
+            valid = ~invalid
+            invalid[valid] = _out_of_bounds(values[valid], minimum, maximum)
+            return invalid
+
+    elif isinstance(rule, Unique):
+
+        def predicate(cells: ColumnCells) -> ndarray:
+            return cells.values.duplicated(keep="first").to_numpy(dtype=bool)
+
+    else:
+        raise ValueError(f"Unknown validation rule: {rule!r}")
+    return predicate
+
+
+def _is_date(value: Any) -> bool:
+    return isinstance(value, (datetime.date, numpy.datetime64))
+
+
+def _as_numbers(values: Series) -> Series:
+    """The values as numbers, missing where they aren't."""
+    if values.dtype.kind in "biuf":
+        return values
+    if values.dtype.kind in "mM":
+        return Series(numpy.nan, index=values.index)
+    return to_numeric(values, errors="coerce")
+
+
+def _as_dates(values: Series) -> Series:
+    """The values as datetimes, missing where they aren't."""
+    if values.dtype.kind == "M":
+        return values
+    if values.dtype.kind in "biufm":
+        return Series(numpy.datetime64("NaT"), index=values.index)
+    # Numbers would be read as epoch timestamps, so only dates and text are
+    is_number = values.map(lambda value: isinstance(value, Number)).astype(bool)
+    return to_datetime(values.where(~is_number), errors="coerce", format="mixed")
+
+
+def _out_of_bounds(values: Any, minimum: Any, maximum: Any) -> ndarray:
+    mask = numpy.zeros(len(values), dtype=bool)
+    if minimum is not None:
+        mask |= numpy.asarray(values < minimum, dtype=bool)
+    if maximum is not None:
+        mask |= numpy.asarray(values > maximum, dtype=bool)
+    return mask
+
+
+def _describe_bounds(minimum: Any, maximum: Any) -> str:
+    if minimum is not None and maximum is not None:
+        return f"between {minimum} and {maximum}"
+    if minimum is not None:
+        return f"at least {minimum}"
+    return f"at most {maximum}"
@@ -1,20 +1,49 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from __future__ import annotations
+
 import os
-from typing import Dict
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterator
+
+from pandas import DataFrame, ExcelFile, RangeIndex, read_excel
+from pandas.io.parsers import TextParser
+
+from src.common_importer_functions import coerce_types
 
-from pandas import DataFrame, ExcelFile, read_excel
+if TYPE_CHECKING:
+    from openpyxl.workbook import Workbook
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 
 
 class XlsxImporter:
     def load_data(
-        self, source: str | bytes, section: int | str, types: Dict | None = None
+        self,
+        source: str | bytes,
+        section: int | str,
+        types: Dict | None = None,
+        usecols: list[str] | None = None,
     ) -> DataFrame:
+        """Load a sheet of the file.
+
+        :param usecols: Only parse the cells of these columns. The ones not
+            in the header are skipped, to be reported by the validations.
+        """
         if isinstance(source, str) and not os.path.isfile(source):
             raise Exception(f"File not found: '{source}'")
 
-        _types = "object" if types is None else types
+        if usecols is not None:
+            # read_excel parses every cell before selecting the columns, so
+            # the projected rows are read as a single chunk instead
+            (data,) = self.iter_chunks(source, section, sys.maxsize, types, usecols)
+            return data
+
+        # Expected types by column are converted after parsing, see coerce_types
+        _types = "object" if types is None or isinstance(types, dict) else types
         try:
             data: DataFrame = read_excel(
                 source,
@@ -32,8 +61,193 @@ class XlsxImporter:
         if not isinstance(data, DataFrame) or data.empty:
             msg = f"The generated DataFrame is empty after reading the file {source}."
             raise Exception(msg)
+
+        if isinstance(types, dict):
+            data = coerce_types(data, types)
         return data
 
+    def load_many(
+        self,
+        source: str | bytes,
+        sections: list[int | str],
+        max_workers: int | None = None,
+        types: Dict | None = None,
+    ) -> dict[int | str, DataFrame]:
+        """Load several sections of the same file, parsing them in parallel.
+
+        Each section is parsed by `load_data` in its own worker process. If
+        any of them fails, a single exception reports every failed section
+        in the same order as `sections`.
+        """
+        if not sections:
+            return {}
+        if isinstance(source, str) and not os.path.isfile(source):
+            raise Exception(f"File not found: '{source}'")
+
+        max_workers = max_workers or min(len(sections), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                section: executor.submit(_load_section, source, section, types)
+                for section in sections
+            }
+
+        loaded: dict[int | str, DataFrame] = {}
+        errors: list[str] = []
+        for section, future in futures.items():
+            try:
+                loaded[section] = future.result()
+            except Exception as err:
+                errors.append(f"   - {section}: {err}")
+
+        if errors:
+            msg = f"Error loading {len(errors)} section(s) of the xlsx file:\n"
+            raise Exception(msg + "\n".join(errors))
+        return loaded
+
+    def iter_chunks(
+        self,
+        source: str | bytes,
+        section: int | str,
+        chunksize: int,
+        types: Dict | None = None,
+        usecols: list[str] | None = None,
+    ) -> Iterator[DataFrame]:
+        """Stream the sheet as DataFrames of up to `chunksize` rows.
+
+        Rows are read in openpyxl's read-only mode, so memory stays flat
+        regardless of the sheet size. Each chunk keeps the header from row 1
+        and the same index it would have in `load_data`, so the validations
+        report the same rows. Header labels, cells, empty cells and trailing
+        empty rows are handled like `load_data` does, and `usecols` limits the
+        parsed columns. As in `read_excel`, the values of object columns are
+        inferred by column (e.g. `True` and `1` as booleans), but here by
+        chunk, and cells right of the last header label are ignored.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+
+        workbook, worksheet = self._open_worksheet(source, section)
+        try:
+            header, rows = self._read_rows(worksheet, usecols)
+            width = len(header)
+            offset = 0
+            pending_empty_rows = 0
+            chunk: list[list] = []
+            for row in rows:
+                values = list(islice(row, width))
+                # Rows with data only in the skipped columns, see OtherColumnsRow
+                has_data = getattr(row, "has_data", False)
+                if not has_data and all(value == "" for value in values):
+                    # Only kept if there are more rows with data after them
+                    pending_empty_rows += 1
+                    continue
+                for _ in range(pending_empty_rows):
+                    chunk.append([""] * width)
+                pending_empty_rows = 0
+                values.extend([""] * (width - len(values)))
+                chunk.append(values)
+
+                while len(chunk) >= chunksize:
+                    yield self._build_chunk(chunk[:chunksize], header, offset, types)
+                    offset += chunksize
+                    chunk = chunk[chunksize:]
+            if chunk:
+                yield self._build_chunk(chunk, header, offset, types)
+                offset += len(chunk)
+        finally:
+            workbook.close()
+
+        if offset == 0:
+            msg = f"The generated DataFrame is empty after reading the file {source}."
+            raise Exception(msg)
+
+    def read_header(self, source: str | bytes, section: int | str) -> list:
+        """Column labels of the sheet, reading only its first row."""
+        workbook, worksheet = self._open_worksheet(source, section)
+        try:
+            return self._read_header_row(worksheet)
+        finally:
+            workbook.close()
+
+    def _open_worksheet(
+        self, source: str | bytes, section: int | str
+    ) -> tuple[Workbook, ReadOnlyWorksheet]:
+        if isinstance(source, str) and not os.path.isfile(source):
+            raise Exception(f"File not found: '{source}'")
+
+        # Imported on first use, read_excel also loads it lazily
+        from openpyxl import load_workbook
+
+        stream = BytesIO(source) if isinstance(source, bytes) else source
+        try:
+            workbook = load_workbook(stream, read_only=True, data_only=True)
+        except Exception as err:
+            raise Exception("Error loading the xlsx file", err)
+
+        try:
+            if isinstance(section, int):
+                worksheet = workbook.worksheets[section]
+            else:
+                worksheet = workbook[section]
+        except (IndexError, KeyError) as err:
+            workbook.close()
+            raise Exception("Error loading the xlsx file", err)
+        return workbook, worksheet
+
+    def _read_rows(
+        self, worksheet: ReadOnlyWorksheet, usecols: list[str] | None
+    ) -> tuple[list, Iterator[tuple]]:
+        """Header and row values, limited to the `usecols` columns if any."""
+        from src.xlsx_projection import iter_sheet_rows
+
+        if usecols is None:
+            rows = iter_sheet_rows(worksheet)
+            return self._parse_header(next(rows, ())), rows
+
+        header = self._read_header_row(worksheet)
+        selected = set(usecols)
+        positions = [
+            position for position, label in enumerate(header) if str(label) in selected
+        ]
+        projected_header = [header[position] for position in positions]
+        return projected_header, iter_sheet_rows(worksheet, positions, min_row=2)
+
+    def _read_header_row(self, worksheet: ReadOnlyWorksheet) -> list:
+        from src.xlsx_projection import iter_sheet_rows
+
+        rows = iter_sheet_rows(worksheet)
+        try:
+            return self._parse_header(next(rows, ()))
+        finally:
+            rows.close()
+
+    def _parse_header(self, header_row: tuple) -> list:
+        header_row = list(header_row)
+        while header_row and header_row[-1] == "":
+            header_row.pop()
+        if not header_row:
+            return []
+        # Same labels as read_excel for unnamed and duplicated columns
+        return TextParser([header_row], header=0).read().columns.tolist()
+
+    def _build_chunk(
+        self, rows: list[list], header: list, offset: int, types: Dict | None
+    ) -> DataFrame:
+        # Same parser and options as read_excel, for the same value inference
+        _types = "object" if types is None or isinstance(types, dict) else types
+        chunk = TextParser(
+            rows,
+            names=header,
+            header=None,
+            dtype=_types,
+            keep_default_na=False,
+            skip_blank_lines=False,
+        ).read()
+        chunk.index = RangeIndex(offset, offset + len(rows))
+        if isinstance(types, dict):
+            chunk = coerce_types(chunk, types)
+        return chunk
+
     def get_sheet_names_in_xlsx_file(self, filename: str) -> list[str]:
         try:
             xlsx_file = ExcelFile(filename)
@@ -43,3 +257,10 @@ class XlsxImporter:
         # ExcelFile.sheet_names -> list[int | str], so better conver all to str
         sheet_names = [str(sheet) for sheet in xlsx_file.sheet_names]
         return sheet_names
+
+
+def _load_section(
+    source: str | bytes, section: int | str, types: Dict | None
+) -> DataFrame:
+    # Module level, so it can be pickled into the `load_many` worker processes
+    return XlsxImporter().load_data(source, section, types)
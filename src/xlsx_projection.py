@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Read the rows of a read-only openpyxl worksheet, optionally some columns.
+
+openpyxl parses every cell of a row even when a range of columns is asked.
+The parser here skips the cells of the other columns before converting their
+values, which is where most of the time goes. Both the full and the projected
+reads convert the cells like `read_excel` does, see `convert_cell`. It is
+built on the openpyxl worksheet parser internals, see the pinned version in
+requirements.txt.
+"""
+
+import warnings
+from math import nan
+from string import digits
+from typing import Any, Iterator
+
+import openpyxl
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from openpyxl.utils.cell import column_index_from_string
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet._reader import INLINE_STRING, VALUE_TAG, WorkSheetParser
+
+# The openpyxl releases whose private parser internals this module was tested with
+SUPPORTED_OPENPYXL = "3.1."
+
+
+def check_openpyxl_version(version: str) -> None:
+    if not version.startswith(SUPPORTED_OPENPYXL):
+        msg = f"The xlsx projection is tested with openpyxl {SUPPORTED_OPENPYXL}x"
+        msg += f" and relies on its private worksheet parser, found {version}"
+        warnings.warn(msg, RuntimeWarning, stacklevel=2)
+
+
+check_openpyxl_version(openpyxl.__version__)
+
+
+class OtherColumnsRow(tuple):
+    """Empty projected row of a row with values in the skipped columns.
+
+    `read_excel` keeps these rows even at the end of the sheet.
+    """
+
+    has_data = True
+
+
+class ProjectedSheetParser(WorkSheetParser):
+    def __init__(self, *args, columns: set[int] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.columns = columns
+        self._column_indexes: dict[str, int] = {}
+
+    def parse_row(self, row) -> tuple[int, tuple[list[dict], bool]]:
+        """Parsed projected cells and if the skipped cells have values."""
+        if self.columns is None:
+            row_number, cells = super().parse_row(row)
+            return row_number, (cells, False)
+
+        row_number = row.get("r")
+        if row_number is not None:
+            self.row_counter = int(float(row_number))
+        else:
+            self.row_counter += 1
+        self.col_counter = 0
+
+        cells = []
+        other_data = False
+        for element in row:
+            coordinate = element.get("r")
+            if coordinate is None:
+                column = self.col_counter + 1
+            else:
+                column = self._column_index(coordinate.rstrip(digits))
+            if column in self.columns:
+                cells.append(self.parse_cell(element))
+            else:
+                self.col_counter = column
+                other_data = other_data or _has_value(element)
+        return self.row_counter, (cells, other_data)
+
+    def _column_index(self, letters: str) -> int:
+        try:
+            return self._column_indexes[letters]
+        except KeyError:
+            index = self._column_indexes[letters] = column_index_from_string(letters)
+            return index
+
+
+def iter_sheet_rows(
+    worksheet: ReadOnlyWorksheet, positions: list[int] | None = None, min_row: int = 1
+) -> Iterator[tuple]:
+    """Converted cell values of each row from `min_row`, see `convert_cell`.
+
+    With `positions`, only the cells of those 0-based columns are returned, in
+    the same order, and rows with values only in other columns are returned as
+    `OtherColumnsRow`. Missing rows are returned as empty rows, like
+    `ReadOnlyWorksheet.iter_rows`, and the rows are not padded to the same
+    width.
+    """
+    workbook = worksheet.parent
+    columns = None
+    empty_row: tuple = ()
+    if positions is not None:
+        columns = {position + 1: index for index, position in enumerate(positions)}
+        empty_row = ("",) * len(positions)
+
+    counter = min_row
+    with worksheet._get_source() as source:
+        parser = ProjectedSheetParser(
+            source,
+            worksheet._shared_strings,
+            data_only=workbook.data_only,
+            epoch=workbook.epoch,
+            date_formats=workbook._date_formats,
+            timedelta_formats=workbook._timedelta_formats,
+            columns=None if columns is None else set(columns),
+        )
+        for row_number, (cells, other_data) in parser.parse():
+            if row_number < min_row:
+                continue
+            for _ in range(counter, row_number):
+                yield empty_row
+            counter = row_number + 1
+
+            if columns is None:
+                width = max((cell["column"] for cell in cells), default=0)
+                values = [""] * width
+                for cell in cells:
+                    values[cell["column"] - 1] = convert_cell(cell)
+            else:
+                values = [""] * len(columns)
+                for cell in cells:
+                    values[columns[cell["column"]]] = convert_cell(cell)
+
+            if other_data and all(value == "" for value in values):
+                yield OtherColumnsRow(values)
+            else:
+                yield tuple(values)
+
+
+def convert_cell(cell: dict) -> Any:
+    """Value of a parsed cell as `read_excel` returns it.
+
+    Same as `pandas.io.excel._openpyxl.OpenpyxlReader._convert_cell`: empty
+    cells are "", errors NaN and integral numbers int.
+    """
+    value = cell["value"]
+    if value is None:
+        return ""
+    data_type = cell["data_type"]
+    if data_type == TYPE_ERROR:
+        return nan
+    if data_type == TYPE_NUMERIC:
+        integer = int(value)
+        return integer if integer == value else float(value)
+    return value
+
+
+def _has_value(element) -> bool:
+    return bool(element.findtext(VALUE_TAG)) or element.find(INLINE_STRING) is not None
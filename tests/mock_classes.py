@@ -2,7 +2,8 @@
 # -*- coding: utf-8 -*-
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator
+from urllib.parse import unquote
 
 from pandas import DataFrame, read_pickle
 
@@ -15,8 +16,43 @@ class MockDBHandler:
     def set_credentials(self, **credentials) -> None: ...
     def connect_with_db(self) -> None: ...
     def close_db_connection(self, rollback: bool = False) -> None: ...
+    def commit(self) -> None: ...
     def insert_resource_data(self, resource_name: str, data: DataFrame) -> None: ...
-    def load_resource_data(self, resource_name: str, data: DataFrame) -> DataFrame: ...
+    def bulk_insert_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        batch_size: int = 10_000,
+        commit_every: int | None = None,
+    ) -> None: ...
+    def load_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str] | None = None,
+        chunksize: int = 10_000,
+    ) -> DataFrame: ...
+    def iter_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str] | None = None,
+        chunksize: int = 10_000,
+    ) -> Iterator[DataFrame]: ...
+    def update_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str],
+        batch_size: int = 10_000,
+    ) -> None: ...
+    def delete_resource_data(
+        self,
+        resource_name: str,
+        data: DataFrame,
+        key_columns: list[str],
+        batch_size: int = 10_000,
+    ) -> None: ...
 
 
 class MockImporter:
@@ -39,6 +75,7 @@ class MockResource:
     resource_name: str = "MockResource"
     section: int | str = "MockResource"
     validated_data: bool = False
+    validation_rules: dict[str, list] = {}
 
     def __init__(self, resource_sheet_name: str): ...
     def insert_data(self) -> None: ...
@@ -49,3 +86,96 @@ class MockResource:
     def show_db_data(self) -> DataFrame | None: ...
     def show_input_data(self) -> DataFrame | None: ...
     def validate_data(self) -> None: ...
+
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet: "FakeSpreadsheet", title: str):
+        self.spreadsheet = spreadsheet
+        self.title = title
+
+    def get_all_records(self) -> list[dict]:
+        self.spreadsheet.client.calls["get_all_records"] += 1
+        return [
+            {
+                "target_col": f"{self.title} value",
+                "left_col": 123.456,
+                "document": self.spreadsheet.title,
+            }
+        ]
+
+
+class FakeSpreadsheet:
+    def __init__(self, client: "FakeGspreadClient", title: str):
+        self.client = client
+        self.title = title
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self.client.calls["worksheet"] += 1
+        return FakeWorksheet(self, title)
+
+
+class FakeGspreadClient:
+    """Local stand-in for `gspread.Client` counting the calls to the API."""
+
+    def __init__(self):
+        self.calls: dict[str, int] = {
+            "open": 0,
+            "open_by_key": 0,
+            "worksheet": 0,
+            "get_all_records": 0,
+        }
+
+    def open(self, title: str) -> FakeSpreadsheet:
+        self.calls["open"] += 1
+        return FakeSpreadsheet(self, title)
+
+    def open_by_key(self, key: str) -> FakeSpreadsheet:
+        self.calls["open_by_key"] += 1
+        return FakeSpreadsheet(self, key)
+
+
+class StubResponse:
+    def __init__(self, payload: dict):
+        self.ok = True
+        self.status_code = 200
+        self.payload = payload
+
+    def json(self) -> dict:
+        return self.payload
+
+
+class StubSheetsSession:
+    """Local stand-in for the gspread HTTP session serving in-memory sheets.
+
+    Use it with `gspread.Client(None, session=StubSheetsSession(sheets))`.
+    Every request is recorded in `requests`.
+    """
+
+    def __init__(self, sheets: dict[str, list[list]], title: str = "test_gspread"):
+        self.sheets = sheets
+        self.title = title
+        self.requests: list[tuple[str, str]] = []
+
+    def request(self, method: str, url: str, **kwargs) -> StubResponse:
+        self.requests.append((method, url))
+        params = kwargs.get("params") or {}
+        if url.endswith("/values:batchGet"):
+            ranges = params["ranges"]
+            value_ranges = [{"range": r, "values": self._values(r)} for r in ranges]
+            return StubResponse({"valueRanges": value_ranges})
+        if "/values/" in url:
+            rng = url.rsplit("/values/", 1)[1]
+            payload = {"range": rng, "majorDimension": "ROWS"}
+            return StubResponse({**payload, "values": self._values(rng)})
+        return StubResponse(self._metadata(url.rsplit("/", 1)[1]))
+
+    def _values(self, rng: str) -> list[list]:
+        return self.sheets[unquote(rng).split("!")[0].strip("'")]
+
+    def _metadata(self, spreadsheet_id: str) -> dict:
+        sheets = [
+            {"properties": {"title": title, "sheetId": idx, "index": idx}}
+            for idx, title in enumerate(self.sheets)
+        ]
+        properties = {"id": spreadsheet_id, "title": self.title}
+        return {"properties": properties, "sheets": sheets}
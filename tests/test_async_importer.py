@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+from typing import Dict
+
+from pandas import DataFrame
+
+from src.async_importer import AsyncImporter
+
+
+class SlowImporter:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def load_data(
+        self,
+        source: str | bytes,
+        section: int | str | None = None,
+        types: Dict | None = None,
+    ) -> DataFrame:
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return DataFrame({"source": [source], "section": [section]})
+
+
+def test_async_importer_load_all_runs_concurrently() -> None:
+    case_delay = 0.2
+    case_jobs = [(f"file_{idx}.xlsx", f"sheet_{idx}") for idx in range(4)]
+
+    async def load() -> list[DataFrame]:
+        async with AsyncImporter(SlowImporter(case_delay), max_concurrency=4) as aio:
+            return await aio.load_all(case_jobs)
+
+    start = time.perf_counter()
+    output = asyncio.run(load())
+    elapsed = time.perf_counter() - start
+
+    assert case_jobs == [(df["source"][0], df["section"][0]) for df in output]
+    assert elapsed < case_delay * 2
+
+
+def test_async_importer_concurrency_cap() -> None:
+    case_max_concurrency = 2
+    case_jobs = [(f"file_{idx}.xlsx", None) for idx in range(6)]
+    importer = SlowImporter(0.05)
+
+    async def load() -> list[DataFrame]:
+        async with AsyncImporter(importer, case_max_concurrency) as aio:
+            return await aio.load_all(case_jobs)
+
+    asyncio.run(load())
+
+    assert case_max_concurrency == importer.max_running
+
+
+def test_async_importer_reused_across_event_loops() -> None:
+    case_jobs = [(f"file_{idx}.xlsx", None) for idx in range(4)]
+    importer = SlowImporter(0.02)
+    aio = AsyncImporter(importer, max_concurrency=1)
+
+    try:
+        first = asyncio.run(aio.load_all(case_jobs))
+        second = asyncio.run(aio.load_all(case_jobs))
+    finally:
+        aio.shutdown()
+
+    assert 4 == len(first) == len(second)
+    assert 1 == importer.max_running
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from src.cached_importer import CachedImporter
+
+
+class CountingImporter:
+    def __init__(self):
+        self.calls = 0
+
+    def load_data(
+        self,
+        source: str | bytes,
+        section: int | str | None = None,
+        types: Dict | None = None,
+    ) -> DataFrame:
+        self.calls += 1
+        return DataFrame({"section": [section] * 100, "call": [self.calls] * 100})
+
+
+@pytest.fixture
+def source_file(tmp_path: Path) -> str:
+    filename = tmp_path / "source.xlsx"
+    filename.write_bytes(b"some content")
+    return str(filename)
+
+
+@pytest.mark.parametrize("key_by", ["content", "mtime"])
+def test_cached_importer_hits(tmp_path: Path, source_file: str, key_by: str) -> None:
+    importer = CountingImporter()
+    cached = CachedImporter(importer, tmp_path / "cache", key_by=key_by)
+
+    expected = cached.load_data(source_file, "sheet")
+    output = cached.load_data(source_file, "sheet")
+    cached.load_data(source_file, "other_sheet")
+
+    assert_frame_equal(expected, output)
+    assert 2 == importer.calls
+    assert (1, 2) == (cached.hits, cached.misses)
+
+
+def test_cached_importer_changed_source(tmp_path: Path, source_file: str) -> None:
+    importer = CountingImporter()
+    cached = CachedImporter(importer, tmp_path / "cache")
+
+    cached.load_data(source_file, "sheet")
+    Path(source_file).write_bytes(b"new content")
+    cached.load_data(source_file, "sheet")
+
+    assert (0, 2) == (cached.hits, cached.misses)
+
+
+def test_cached_importer_lru_eviction(tmp_path: Path) -> None:
+    importer = CountingImporter()
+    cache_dir = tmp_path / "cache"
+    cached = CachedImporter(importer, cache_dir)
+    cached.load_data(b"content", "first")
+    cached.max_size = int(next(cache_dir.glob("*.pickle")).stat().st_size * 2.5)
+
+    cached.load_data(b"content", "second")
+    cached.load_data(b"content", "first")
+    cached.load_data(b"content", "third")
+    cached.load_data(b"content", "first")
+    cached.load_data(b"content", "second")
+
+    assert 2 == len(list(cache_dir.glob("*.pickle")))
+    assert (2, 4) == (cached.hits, cached.misses)
+
+
+class InterleavedWritesCache(CachedImporter):
+    """Stores the same entry again while the first write is not replaced yet."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tmp_entries: list[Path] = []
+
+    def _write_entry(self, entry: Path, data: DataFrame) -> None:
+        super()._write_entry(entry, data)
+        self.tmp_entries.append(entry)
+        if len(self.tmp_entries) == 1:
+            self.load_data(b"content", "sheet")
+
+
+def test_cached_importer_concurrent_writes(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cached = InterleavedWritesCache(CountingImporter(), cache_dir)
+
+    expected = cached.load_data(b"content", "sheet")
+    output = cached.load_data(b"content", "sheet")
+
+    assert 2 == len(set(cached.tmp_entries))
+    assert [] == list(cache_dir.glob("*.tmp"))
+    assert (1, 2) == (cached.hits, cached.misses)
+    assert_frame_equal(expected, output)
+
+
+class EvictedAfterReadCache(CachedImporter):
+    """Another process evicts each entry right after it is read."""
+
+    def _read_entry(self, entry: Path) -> DataFrame:
+        data = super()._read_entry(entry)
+        entry.unlink()
+        return data
+
+
+def test_cached_importer_entry_evicted_after_read(tmp_path: Path) -> None:
+    cached = EvictedAfterReadCache(CountingImporter(), tmp_path / "cache")
+
+    expected = cached.load_data(b"content", "sheet")
+    output = cached.load_data(b"content", "sheet")
+
+    assert (1, 1) == (cached.hits, cached.misses)
+    assert_frame_equal(expected, output)
+
+
+def test_cached_importer_entry_evicted_while_evicting(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path_glob = Path.glob
+
+    def glob_with_evicted_entry(path: Path, pattern: str):
+        # An entry listed, then removed by another process before its stat
+        return [*path_glob(path, pattern), path / f"evicted{pattern[1:]}"]
+
+    monkeypatch.setattr(Path, "glob", glob_with_evicted_entry)
+    cached = CachedImporter(CountingImporter(), tmp_path / "cache", max_size=0)
+
+    cached.load_data(b"content", "sheet")
+
+    assert [] == list(path_glob(tmp_path / "cache", "*.pickle"))
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+
+from datetime import date, datetime, time
+
+import numpy as np
+import pytest
+from pandas import Categorical, DataFrame, Timestamp, array, to_datetime
+from pandas.testing import assert_frame_equal
+
+from src.columnar_staging import (
+    StagedImporter,
+    read_columnar,
+    unsupported_columns,
+    write_columnar,
+)
+from src.xlsx_importer import XlsxImporter
+from tests.test_cached_importer import CountingImporter
+
+SIMPLE_XLSX = "tests/files/simple.xlsx"
+
+
+@pytest.fixture
+def imported_data() -> DataFrame:
+    return DataFrame(
+        {
+            "id": [1, 2, 3],
+            "amount": [1.5, np.nan, 3.0],
+            "active": [True, False, True],
+            "created": to_datetime(["2023-01-01", None, "2023-03-01"]),
+            "name": ["Ñandú", None, "Ana"],
+            "code": ["a", np.nan, None],
+            "group": Categorical(["x", "y", "x"]),
+            "count": array([1, None, 3], dtype="Int64"),
+            "ratio": array([0.5, 1.5, None], dtype="Float64"),
+            "flag": array([True, None, False], dtype="boolean"),
+            "label": array(["Ñandú", None, "b"], dtype="string[python]"),
+            "updated": to_datetime(["2023-01-01", None, "2023-03-01"]).tz_localize(
+                "Europe/Madrid"
+            ),
+        },
+        index=[10, 20, 30],
+    )
+
+
+@pytest.fixture(params=[False, True], ids=["buffers", "feather"])
+def use_arrow(request) -> bool:
+    if request.param:
+        pytest.importorskip("pyarrow")
+    return request.param
+
+
+def test_columnar_roundtrip(
+    tmp_path: Path, imported_data: DataFrame, use_arrow: bool
+) -> None:
+    filename = tmp_path / "data.columns"
+
+    write_columnar(imported_data, filename, use_arrow)
+    output = read_columnar(filename)
+
+    assert_frame_equal(imported_data, output)
+    assert [float, type(None)] == [type(value) for value in output["code"][1:]]
+
+
+def test_columnar_mixed_cells(tmp_path: Path, use_arrow: bool) -> None:
+    filename = tmp_path / "data.columns"
+    case_cells = [
+        "text",
+        "",
+        1,
+        -(2**70),
+        0.1,
+        np.nan,
+        True,
+        None,
+        datetime(2024, 2, 29, 1, 2, 3, 4),
+        Timestamp("2024-01-01 00:00:00.000000001"),
+        date(2024, 1, 2),
+        time(1, 2, 3),
+    ]
+    # Repeated labels of mixed types, like the header of a raw sheet
+    case_data = DataFrame([case_cells, case_cells[::-1]]).T
+    case_data.columns = ["key", "key"]
+    case_data.index = [f"row {row}" for row in range(len(case_cells))]
+
+    write_columnar(case_data, filename, use_arrow)
+    output = read_columnar(filename)
+
+    assert_frame_equal(case_data, output)
+    for column in range(2):
+        expected_types = [type(value) for value in case_data.iloc[:, column]]
+        assert expected_types == [type(value) for value in output.iloc[:, column]]
+
+
+def is_mapped(values: np.ndarray) -> bool:
+    base = values
+    while base.base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    return isinstance(base, np.memmap) and not values.flags.writeable
+
+
+def test_columnar_columns_are_mapped(tmp_path: Path) -> None:
+    filename = tmp_path / "data.columns"
+    case_data = DataFrame(
+        {
+            "id": range(1_000),
+            "count": array(range(1_000), dtype="Int64"),
+            "flag": array([True, None] * 500, dtype="boolean"),
+            "group": Categorical(["x", "y"] * 500),
+        }
+    )
+    write_columnar(case_data, filename, use_arrow=False)
+
+    output = read_columnar(filename)
+
+    assert is_mapped(output["id"].to_numpy())
+    for label in ("count", "flag"):
+        assert is_mapped(output[label].array._data)
+        assert is_mapped(output[label].array._mask)
+    assert is_mapped(output["group"].array.codes)
+
+
+def test_columnar_feather_is_mapped(tmp_path: Path) -> None:
+    pyarrow = pytest.importorskip("pyarrow")
+    filename = tmp_path / "data.columns"
+    case_data = DataFrame(
+        {
+            "id": range(100_000),
+            "text": array(["Ñandú", None] * 50_000, dtype="string[pyarrow]"),
+        }
+    )
+    write_columnar(case_data, filename)
+    allocated = pyarrow.total_allocated_bytes()
+
+    output = read_columnar(filename)
+
+    assert filename.read_bytes().startswith(b"ARROW1")
+    assert_frame_equal(case_data, output)
+    assert not output["id"].to_numpy().flags.writeable
+    # Neither the ids nor the text were copied out of the mapped file
+    assert pyarrow.total_allocated_bytes() - allocated < 100_000
+
+
+def test_columnar_unsupported_columns(tmp_path: Path) -> None:
+    filename = tmp_path / "data.columns"
+    case_data = DataFrame({"id": [1, 2], "raw": [1, {"a": 1}]})
+
+    assert ["raw"] == unsupported_columns(case_data)
+    with pytest.raises(ValueError):
+        write_columnar(case_data, filename)
+
+
+def test_columnar_invalid_file(tmp_path: Path) -> None:
+    filename = tmp_path / "data.columns"
+    filename.write_bytes(b"not staged")
+
+    with pytest.raises(ValueError):
+        read_columnar(filename)
+
+
+def test_staged_importer(tmp_path: Path) -> None:
+    importer = CountingImporter()
+    staged = StagedImporter(importer, tmp_path / "staging")
+
+    assert staged.staging_file(b"content", "sheet") is None
+    expected = staged.load_data(b"content", "sheet")
+    output = staged.load_data(b"content", "sheet")
+    staging_file = staged.staging_file(b"content", "sheet")
+
+    assert_frame_equal(expected, output)
+    assert_frame_equal(output, read_columnar(staging_file))
+    assert 1 == importer.calls
+    assert (1, 1) == (staged.hits, staged.misses)
+
+
+def test_staged_importer_raw_sheet(tmp_path: Path) -> None:
+    importer = XlsxImporter()
+    staged = StagedImporter(importer, tmp_path / "staging")
+    expected = importer.load_data(SIMPLE_XLSX, "Some_datatypes")
+
+    outputs = [staged.load_data(SIMPLE_XLSX, "Some_datatypes") for _ in range(3)]
+
+    assert (2, 1) == (staged.hits, staged.misses)
+    for output in outputs:
+        assert_frame_equal(expected, output)
+    assert staged.staging_file(SIMPLE_XLSX, "Some_datatypes") is not None
+
+
+class RawCellsImporter(CountingImporter):
+    def load_data(self, source, section=None, types=None) -> DataFrame:
+        data = super().load_data(source, section, types)
+        data["raw"] = [1, {"a": 1}] * 50
+        return data
+
+
+def test_staged_importer_unsupported_data(tmp_path: Path) -> None:
+    importer = RawCellsImporter()
+    staged = StagedImporter(importer, tmp_path / "staging")
+
+    with pytest.warns(RuntimeWarning, match="can't be staged"):
+        expected = staged.load_data(b"content", "sheet")
+    with pytest.warns(RuntimeWarning, match="can't be staged"):
+        output = staged.load_data(b"content", "sheet")
+
+    assert_frame_equal(expected.drop(columns="call"), output.drop(columns="call"))
+    assert 2 == importer.calls
+    assert staged.staging_file(b"content", "sheet") is None
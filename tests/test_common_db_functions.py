@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pandas import DataFrame, Series, to_datetime
+
+from src.common_db_functions import compute_resource_delta
+
+
+def test_compute_resource_delta() -> None:
+    case_input = DataFrame(
+        {
+            "key": [1, 2, 3, 5],
+            "value": ["same", "changed", "same", "new"],
+        },
+        dtype="object",
+    )
+    case_db = DataFrame(
+        {
+            "key": [1, 2, 3, 4],
+            "value": ["same", "old", "same", "removed"],
+            "db_only": [10, 20, 30, 40],
+        }
+    )
+
+    output = compute_resource_delta(case_input, case_db, ["key"])
+
+    assert [5] == output.inserts["key"].tolist()
+    assert [2] == output.updates["key"].tolist()
+    assert [4] == output.deletes["key"].tolist()
+    assert 3 == output.changed_rows
+
+
+def test_compute_resource_delta_compares_values_as_stored() -> None:
+    case_input = DataFrame(
+        {
+            "key": Series([1, 2, 3], dtype="Int64"),
+            "amount": Series([2, None, 4], dtype="Int64"),
+            "active": Series([True, False, None], dtype="boolean"),
+            "created": to_datetime(["2024-01-02 00:00", None, "2024-01-04 10:30"]),
+        }
+    )
+    case_db = DataFrame(
+        {
+            "key": [1.0, 2.0, 3.0],
+            "amount": [2.0, None, 5.0],
+            "active": [1, 0, None],
+            "created": ["2024-01-02 00:00:00", None, "2024-01-04 10:30:00"],
+        }
+    )
+
+    output = compute_resource_delta(case_input, case_db, ["key"])
+
+    assert [3] == output.updates["key"].tolist()
+    assert 1 == output.changed_rows
@@ -1,9 +1,24 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import datetime
+import sys
+
 import pytest
+from openpyxl import Workbook
+from pandas import DataFrame
 
+from src.common_importer_functions import coerce_types
 from src.common_resource_functions import CommonResourceFunctions
+from src.validation_errors import ErrorMessages
+from src.validation_rules import (
+    AllowedValues,
+    Length,
+    Pattern,
+    Range,
+    Unique,
+    compile_resource_rules,
+)
 from src.xlsx_importer import XlsxImporter
 from tests.mock_classes import MockResource
 
@@ -109,3 +124,382 @@ def test_validate_bad_characters() -> None:
 
     output = error.value.args[0]
     assert expected == output
+
+
+def test_column_validation_matches_per_cell_validation() -> None:
+    case_data = DataFrame(
+        {
+            "col_a": ["ok", "tab\there", " lead", "trail ", 12, None, ""],
+            "col_b": ["\nnew", "a – b", "fine ", " −", " both\t ", 3.5, "x\n"],
+            "col_c": [1, 2, 3, 4, 5, 6, 7],
+        }
+    )
+    resource = MockResource("mock")
+    resource.input_data = case_data
+    validator = CommonResourceFunctions(resource)
+    expected = [
+        problem
+        for label, content in case_data.items()
+        for index, value in content.items()
+        if (problem := validator.validate_cell_characters(label, index, value))
+    ]
+
+    validator.check_all_cells_characters()
+
+    assert expected == validator.errors
+    assert len(expected) == validator.errors_count
+
+
+def test_input_data_type_errors() -> None:
+    case_data = coerce_types(
+        DataFrame({"col_a": [1, "two", 3, "four"], "col_b": ["1.5", "", "x", 2]}),
+        {"col_a": int, "col_b": float},
+    )
+    expected = (
+        "Detected 2 problem(s):\n"
+        "- Invalid data type in fields:\n"
+        "  - Column 'col_a' (expected int):\n"
+        "    - Row 3\n"
+        "    - Row 5\n"
+        "  - Column 'col_b' (expected float):\n"
+        "    - Row 4\n"
+    )
+
+    resource = MockResource("mock")
+    resource.expected_input_data_format = {"col_a": int, "col_b": float}
+    resource.input_data = case_data
+    validator = CommonResourceFunctions(resource)
+    with pytest.raises(ValueError) as error:
+        validator.run_common_validations()
+
+    output = error.value.args[0]
+    assert expected == output
+
+
+def test_missing_values_include_blank_and_null_values() -> None:
+    case_data = DataFrame(
+        {
+            "col_a": ["value", "", None, "  ", "value"],
+            "col_b": [1.5, float("nan"), 2.0, 3.0, 4.0],
+            "col_c": ["value", "value", 0, "\n", "value"],
+        },
+        dtype="object",
+    )
+    expected = [
+        "Missing data in mandatory fields:\n"
+        "  - Column 'col_a':\n"
+        "    - Row 3\n"
+        "    - Row 4\n"
+        "    - Row 5\n"
+        "  - Column 'col_b':\n"
+        "    - Row 3\n"
+        "  - Column 'col_c':\n"
+        "    - Row 5\n"
+    ]
+
+    resource = MockResource("mock")
+    resource.input_data = case_data
+    validator = CommonResourceFunctions(resource)
+    validator.check_missing_values_in_required_fields(["col_a", "col_b", "col_c"])
+
+    assert expected == validator.errors
+    assert 3 == validator.errors_count
+
+
+def test_missing_values_in_string_dtype_columns() -> None:
+    case_data = coerce_types(
+        DataFrame(
+            {"col_a": ["value", None, " ", "tab\t"], "col_b": ["", "x", "y", "z"]}
+        ),
+        {"col_a": str, "col_b": str},
+    )
+    expected = (
+        "Detected 4 problem(s):\n"
+        "- Missing data in mandatory fields:\n"
+        "  - Column 'col_a':\n"
+        "    - Row 3\n"
+        "    - Row 4\n"
+        "  - Column 'col_b':\n"
+        "    - Row 2\n"
+        "\n- Invalid first char: ' ' in column 'col_a' row '4'."
+        "\n- Invalid character in column 'col_a' row '5'."
+    )
+
+    resource = MockResource("mock")
+    resource.required_fields = ["col_a", "col_b"]
+    resource.input_data = case_data
+    validator = CommonResourceFunctions(resource)
+    with pytest.raises(ValueError) as error:
+        validator.run_common_validations()
+
+    output = error.value.args[0]
+    assert "string" == str(case_data["col_a"].dtype)
+    assert expected == output
+
+
+def test_errors_details_are_capped_with_exact_counts() -> None:
+    case_data = DataFrame(
+        {"col_a": ["", "", "", "ok"], "col_b": [" a", "b ", "c\t", "d\t"]},
+        dtype="object",
+    )
+    expected = [
+        "Missing data in mandatory fields:\n"
+        "  - Column 'col_a':\n"
+        "    - Row 2\n"
+        "    - Row 3\n"
+        "    - ... and 1 more row(s)\n",
+        "... and 4 more problem(s) not shown.",
+    ]
+
+    resource = MockResource("mock")
+    resource.input_data = case_data
+    validator = CommonResourceFunctions(resource, max_errors=2)
+    validator.check_missing_values_in_required_fields(["col_a"])
+    validator.check_all_cells_characters()
+
+    assert expected == validator.errors
+    assert 5 == validator.errors_count
+    assert {"col_a": 3, "col_b": 4} == validator.error_store.column_counts()
+
+
+def test_missing_fields_are_capped_with_exact_counts() -> None:
+    expected = [
+        "Missing required field(s):\n   - col_x\n   - ... and 2 more field(s)\n"
+    ]
+
+    resource = MockResource("mock")
+    resource.required_fields = ["col_a", "col_x", "col_y", "col_z"]
+    resource.input_data = DataFrame({"col_a": ["ok"]}, dtype="object")
+    validator = CommonResourceFunctions(resource, max_errors=1)
+    validator.check_missing_required_fields(resource.required_fields)
+
+    assert expected == validator.errors
+    assert 3 == validator.errors_count
+
+
+def test_errors_list_changes_are_kept() -> None:
+    case_data = DataFrame({"col_a": ["", "ok"]}, dtype="object")
+    expected = ["First check failed.", "Third check failed."]
+
+    resource = MockResource("mock")
+    resource.input_data = case_data
+    validator = CommonResourceFunctions(resource)
+    validator.check_missing_values_in_required_fields(["col_a"])
+    validator.errors.clear()
+    validator.errors.extend(["Second check failed.", "Third check failed."])
+    validator.errors.insert(0, "First check failed.")
+    validator.errors.remove("Second check failed.")
+    errors = validator.errors
+    errors += ["Fourth check failed."]
+    validator.errors = errors
+    del validator.errors[-1:]
+
+    assert expected == validator.errors
+    assert 1 == validator.errors_count
+
+    validator.errors = ErrorMessages(["Stale check failed."], print, print)
+    assert ["Stale check failed."] == validator.errors
+    assert 1 == validator.errors_count
+
+
+def test_custom_errors() -> None:
+    case_data = DataFrame({"col_a": ["", "ok"]}, dtype="object")
+    expected = (
+        "Detected 3 problem(s):\n"
+        "- Missing data in mandatory fields:\n"
+        "  - Column 'col_a':\n"
+        "    - Row 2\n"
+        "\n- Custom check failed."
+        "\n- Legacy check failed."
+    )
+
+    resource = MockResource("mock")
+    resource.input_data = case_data
+    validator = CommonResourceFunctions(resource)
+    validator.check_missing_values_in_required_fields(["col_a"])
+    validator.add_error("Custom check failed.")
+    # Code written when errors and errors_count were plain attributes
+    validator.errors.append("Legacy check failed.")
+    validator.errors_count += 1
+    with pytest.raises(ValueError) as error:
+        validator.raise_validation_errors()
+
+    output = error.value.args[0]
+    assert expected == output
+
+
+def test_fail_fast_threshold_stops_the_validations() -> None:
+    case_data = DataFrame({"col_a": ["", "ok"], "col_b": [" a", "b"]}, dtype="object")
+    expected = (
+        "Detected 1 problem(s):\n"
+        "- Missing data in mandatory fields:\n"
+        "  - Column 'col_a':\n"
+        "    - Row 2\n"
+    )
+
+    resource = MockResource("mock")
+    resource.required_fields = ["col_a"]
+    resource.input_data = case_data
+    validator = CommonResourceFunctions(resource, fail_fast_threshold=1)
+    with pytest.raises(ValueError) as error:
+        validator.run_common_validations()
+
+    output = error.value.args[0]
+    assert expected == output
+
+
+def test_sharded_validation_matches_serial_validation() -> None:
+    case_data = DataFrame(
+        {
+            "col_a": ["ok", "tab\there", "", " lead", None, "x", "  ", "ñ" * 10_000],
+            "col_b": [1.5, float("nan"), 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+            "col_c": ["\nnew", "a – b", "fine ", 7, " −", "", "x\n", "\u3000"],
+        }
+    )
+
+    def run(**options) -> str:
+        resource = MockResource("mock")
+        resource.required_fields = ["col_c", "col_a", "col_b"]
+        resource.input_data = case_data
+        validator = CommonResourceFunctions(resource, **options)
+        with pytest.raises(ValueError) as error:
+            validator.run_common_validations()
+        return error.value.args[0]
+
+    expected = run()
+    output = run(workers=2, rows_per_shard=3)
+
+    assert expected == output
+
+
+class RulesResource(MockResource):
+    validation_rules = {
+        "code": [Pattern(r"[A-Z]{3}-\d+"), Length(max=7), Unique()],
+        "status": [AllowedValues(("open", "closed"))],
+        "score": [Range(0, 10)],
+    }
+
+
+def test_validation_rules() -> None:
+    case_data = DataFrame(
+        {
+            "code": ["ABC-1", "abc-2", "ABC-1234", "ABC-1", ""],
+            "status": ["open", "closed", "done", "open", "open"],
+            "score": [0, 10, 11, "high", -1],
+        },
+        dtype="object",
+    )
+    expected = [
+        "Invalid value 'abc-2' in column 'code' row '3'. It must match "
+        "'[A-Z]{3}-\\d+'.",
+        "Invalid value 'ABC-1234' in column 'code' row '4'. It must have at most 7 "
+        "characters.",
+        "Invalid value 'ABC-1' in column 'code' row '5'. It must be unique in the "
+        "column.",
+        "Invalid value 'done' in column 'status' row '4'. It must be one of 'open', "
+        "'closed'.",
+        "Invalid value '11' in column 'score' row '4'. It must be between 0 and 10.",
+        "Invalid value 'high' in column 'score' row '5'. It must be between 0 and 10.",
+        "Invalid value '-1' in column 'score' row '6'. It must be between 0 and 10.",
+    ]
+
+    resource = RulesResource("mock")
+    resource.input_data = case_data
+    validator = CommonResourceFunctions(resource)
+    validator.check_validation_rules()
+
+    assert expected == validator.errors
+    assert compile_resource_rules(RulesResource) is compile_resource_rules(
+        RulesResource
+    )
+
+
+class UnmergedRulesResource(MockResource):
+    validation_rules = {
+        "code": [Pattern(r"(?i)[a-z]{3}-\d+"), Pattern(r"(\w)\1.*"), Pattern(r".{5}")],
+        "day": [Range(datetime.date(2024, 1, 1), datetime.date(2024, 12, 31))],
+        "day_text": [Range(max=datetime.datetime(2024, 12, 31))],
+    }
+
+
+def test_validation_rules_with_flags_and_dates() -> None:
+    case_data = DataFrame(
+        {
+            "code": ["AAb-1", "aab-1", "abc-1", "AAb-12"],
+            "day": ["2024-01-01", "2023-12-31", "2024-06-30", "2025-01-01"],
+            "day_text": ["2024-06-30", "2025-01-01", 45000, "soon"],
+        },
+        dtype="object",
+    )
+    case_data = coerce_types(case_data, {"day": datetime.date})
+    expected = [
+        "Invalid value 'abc-1' in column 'code' row '4'. It must match '(\\w)\\1.*'.",
+        "Invalid value 'AAb-12' in column 'code' row '5'. It must match '.{5}'.",
+        "Invalid value '2023-12-31 00:00:00' in column 'day' row '3'. It must be "
+        "between 2024-01-01 and 2024-12-31.",
+        "Invalid value '2025-01-01 00:00:00' in column 'day' row '5'. It must be "
+        "between 2024-01-01 and 2024-12-31.",
+        "Invalid value '2025-01-01' in column 'day_text' row '3'. It must be at most "
+        "2024-12-31 00:00:00.",
+        "Invalid value '45000' in column 'day_text' row '4'. It must be at most "
+        "2024-12-31 00:00:00.",
+        "Invalid value 'soon' in column 'day_text' row '5'. It must be at most "
+        "2024-12-31 00:00:00.",
+    ]
+
+    resource = UnmergedRulesResource("mock")
+    resource.input_data = case_data
+    validator = CommonResourceFunctions(resource)
+    validator.check_validation_rules()
+
+    assert expected == validator.errors
+
+
+@pytest.fixture
+def show_validator() -> CommonResourceFunctions:
+    resource = MockResource("mock")
+    resource.input_data = DataFrame({"col_a": range(10), "col_b": list("abcdefghij")})
+    resource.db_data = DataFrame({"col_a": range(100, 105)})
+    return CommonResourceFunctions(resource)
+
+
+def test_show_data_windows(show_validator, capsys, monkeypatch) -> None:
+    monkeypatch.setattr(CommonResourceFunctions, "SHOW_PAGE_SIZE", 2)
+    expected = "  col_b\n7     h\n8     i\n  col_b\n9     j\n"
+
+    show_validator.show_input_data(mode="tail", rows=3, columns=["col_b"])
+    output = capsys.readouterr().out
+
+    assert expected == output
+
+
+def test_show_db_data_in_jupyter(show_validator, monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "ipykernel", None)
+    expected = show_validator.attached_resource.db_data.head(2)
+
+    output = show_validator.show_db_data(rows=2)
+
+    assert expected.equals(output)
+
+
+def test_check_source_header(tmp_path) -> None:
+    case_filename = str(tmp_path / "header.xlsx")
+    workbook = Workbook()
+    workbook.active.title = "header"
+    workbook.active.append(["col_a", "col_b", "notes", "col_d"])
+    workbook.save(case_filename)
+    expected = "Detected 1 problem(s):\n- Missing required field(s):\n   - col_c\n"
+
+    resource = MockResource("mock")
+    resource.data_importer = XlsxImporter()
+    resource.section = "header"
+    resource.required_fields = ["col_a"]
+    resource.expected_input_data_format = {"col_d": str}
+    output = CommonResourceFunctions(resource).check_source_header(case_filename)
+
+    resource.required_fields = ["col_a", "col_c"]
+    with pytest.raises(ValueError) as error:
+        CommonResourceFunctions(resource).check_source_header(case_filename)
+
+    assert ["col_a", "col_d"] == output
+    assert expected == error.value.args[0]
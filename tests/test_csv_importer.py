@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+
+import pytest
+from pandas import concat
+from pandas.testing import assert_frame_equal
+
+from src.csv_importer import CsvImporter, TsvImporter
+from src.importers import get_importer, importer_name_for_source
+
+CSV_CONTENT = "id,code,amount,comment\n1,007,1.5,\n2,010,,hello\n3,x12,3.25,world\n"
+
+
+@pytest.fixture
+def csv_file(tmp_path: Path) -> str:
+    filename = tmp_path / "data.csv"
+    filename.write_text(CSV_CONTENT)
+    return str(filename)
+
+
+def test_csv_importer_reads_text_cells(csv_file: str) -> None:
+    output = CsvImporter().load_data(csv_file)
+
+    assert ["id", "code", "amount", "comment"] == list(output.columns)
+    assert ["007", "010", "x12"] == output["code"].tolist()
+    assert ["", "hello", "world"] == output["comment"].tolist()
+
+
+def test_csv_importer_projects_and_coerces_types(csv_file: str) -> None:
+    case_types = {"id": int, "amount": float, "missing_column": str}
+
+    output = CsvImporter().load_data(csv_file, types=case_types)
+
+    assert ["id", "amount"] == list(output.columns)
+    assert [1, 2, 3] == output["id"].tolist()
+    assert "Int64" == output["id"].dtype
+
+
+def test_csv_importer_iter_chunks(csv_file: str) -> None:
+    importer = CsvImporter()
+    case_types = {"id": int, "code": str}
+    expected = importer.load_data(csv_file, types=case_types)
+
+    chunks = list(importer.iter_chunks(csv_file, None, 2, case_types))
+    output = concat(chunks)
+
+    assert [2, 1] == [len(chunk) for chunk in chunks]
+    assert_frame_equal(expected, output)
+
+
+def test_tsv_importer_from_bytes() -> None:
+    case_source = CSV_CONTENT.replace(",", "\t").encode()
+    expected = CsvImporter().load_data(CSV_CONTENT.encode())
+
+    output = TsvImporter().load_data(case_source)
+
+    assert_frame_equal(expected, output)
+
+
+def test_csv_importer_errors(tmp_path: Path) -> None:
+    empty_file = tmp_path / "empty.csv"
+    empty_file.write_text("id,code\n")
+
+    with pytest.raises(Exception, match="File not found"):
+        CsvImporter().load_data(str(tmp_path / "missing.csv"))
+    with pytest.raises(Exception, match="empty"):
+        CsvImporter().load_data(str(empty_file))
+
+
+def test_csv_importer_registry() -> None:
+    assert "tsv" == importer_name_for_source("feed.TSV")
+    assert isinstance(get_importer("csv"), CsvImporter)
@@ -1,10 +1,17 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+import threading
+
+import gspread
 import pytest
 from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 
+from src.async_importer import AsyncImporter
 from src.google_sheets_importer import GoogleSheetsImporter
+from tests.mock_classes import FakeGspreadClient, FakeSpreadsheet, StubSheetsSession
 from tests.sensitive_data import get_google_credentials
 
 
@@ -32,3 +39,112 @@ def test_google_sheets_importer(gsheets: GoogleSheetsImporter) -> None:
 
 
 # TODO: Add tests for dates, floats, percentages.
+
+
+@pytest.fixture
+def fake_gspread(monkeypatch: pytest.MonkeyPatch) -> list[FakeGspreadClient]:
+    created_clients: list[FakeGspreadClient] = []
+
+    def service_account_from_dict(credentials: dict) -> FakeGspreadClient:
+        created_clients.append(FakeGspreadClient())
+        return created_clients[-1]
+
+    GoogleSheetsImporter.clear_cache()
+    monkeypatch.setattr(gspread, "service_account_from_dict", service_account_from_dict)
+    yield created_clients
+    GoogleSheetsImporter.clear_cache()
+
+
+def test_google_sheets_importer_reuses_client_and_handles(
+    fake_gspread: list[FakeGspreadClient],
+) -> None:
+    case_credentials = {"client_email": "test@example.com"}
+    expected_calls = {
+        "open": 1,
+        "open_by_key": 0,
+        "worksheet": 2,
+        "get_all_records": 3,
+    }
+
+    first_importer = GoogleSheetsImporter(case_credentials)
+    second_importer = GoogleSheetsImporter(dict(case_credentials))
+    first_importer.load_data("test_gspread", "tab_a")
+    second_importer.load_data("test_gspread", "tab_b")
+    dataframe = second_importer.load_data("test_gspread", "tab_a")
+
+    assert 1 == len(fake_gspread)
+    assert expected_calls == fake_gspread[0].calls
+    assert "tab_a value" == dataframe["target_col"].iloc[0]
+
+
+def test_google_sheets_importer_open_by_key_and_ttl(
+    fake_gspread: list[FakeGspreadClient],
+) -> None:
+    case_credentials = {"client_email": "test@example.com"}
+
+    gsheets = GoogleSheetsImporter(case_credentials, open_by="key", handles_ttl=0)
+    gsheets.load_data("spreadsheet-key", "tab_a")
+    gsheets.load_data("spreadsheet-key", "tab_a")
+
+    assert 0 == fake_gspread[0].calls["open"]
+    assert 2 == fake_gspread[0].calls["open_by_key"]
+
+
+def test_google_sheets_importer_concurrent_documents(
+    fake_gspread: list[FakeGspreadClient],
+) -> None:
+    case_jobs = [("doc_a", "tab"), ("doc_b", "tab")] * 4
+    gsheets = GoogleSheetsImporter({"client_email": "test@example.com"})
+    opened = threading.Barrier(2)
+    open_spreadsheet = fake_gspread[0].open
+
+    def open_together(title: str) -> FakeSpreadsheet:
+        # Both documents are opened at the same time by the first two loads
+        spreadsheet = open_spreadsheet(title)
+        opened.wait(timeout=1)
+        return spreadsheet
+
+    fake_gspread[0].open = open_together
+
+    async def load_all() -> list[DataFrame]:
+        async with AsyncImporter(gsheets, max_concurrency=2) as importer:
+            return await importer.load_all(case_jobs)
+
+    output = [data["document"].iloc[0] for data in asyncio.run(load_all())]
+
+    assert [source for source, _ in case_jobs] == output
+
+
+@pytest.fixture
+def stub_session(monkeypatch: pytest.MonkeyPatch) -> StubSheetsSession:
+    sheets = {
+        f"tab_{tab}": [
+            ["target_col", "left_col"],
+            *[[f"tab {tab} row {row}", "123.456"] for row in range(3)],
+        ]
+        for tab in range(5)
+    }
+    session = StubSheetsSession(sheets)
+
+    def service_account_from_dict(credentials: dict) -> gspread.Client:
+        return gspread.Client(None, session=session)
+
+    GoogleSheetsImporter.clear_cache()
+    monkeypatch.setattr(gspread, "service_account_from_dict", service_account_from_dict)
+    yield session
+    GoogleSheetsImporter.clear_cache()
+
+
+def test_google_sheets_importer_load_many(stub_session: StubSheetsSession) -> None:
+    case_sections = ["tab_3", "tab_0", "tab_4"]
+    expected_requests = 2  # spreadsheet metadata + values:batchGet
+
+    gsheets = GoogleSheetsImporter({"client_email": "test@example.com"}, "key")
+    output = gsheets.load_many("spreadsheet-key", case_sections)
+
+    assert expected_requests == len(stub_session.requests)
+    assert case_sections == list(output)
+    GoogleSheetsImporter.clear_cache()
+    for section in case_sections:
+        expected = gsheets.load_data("spreadsheet-key", section)
+        assert_frame_equal(expected, output[section])
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+from importlib import import_module
+
+import pytest
+
+import src.importers
+from src.importers import (
+    get_importer,
+    get_importer_class,
+    importer_name_for_source,
+    register_importer,
+)
+from src.xlsx_importer import XlsxImporter
+
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "gspread")
+
+
+@pytest.fixture
+def fresh_import(monkeypatch):
+    """Import the src modules again, failing on the given modules."""
+
+    def fresh_import(module_name: str, blocked_modules: tuple[str, ...]):
+        for name in list(sys.modules):
+            if name == "src" or name.startswith("src."):
+                monkeypatch.delitem(sys.modules, name)
+        # A None entry makes any import of the module raise ImportError
+        for name in blocked_modules:
+            monkeypatch.setitem(sys.modules, name, None)
+        return import_module(module_name)
+
+    return fresh_import
+
+
+@pytest.mark.parametrize(
+    "case_module",
+    ["src.importers", "src.protocols", "src.cached_importer", "src.async_importer"],
+)
+def test_light_modules_do_not_import_heavy_dependencies(
+    fresh_import, case_module
+) -> None:
+    fresh_import(case_module, HEAVY_MODULES)
+
+
+def test_importer_loads_only_its_dependencies(fresh_import) -> None:
+    importers = fresh_import("src.importers", ("gspread",))
+
+    output = importers.get_importer("xlsx")
+
+    assert "XlsxImporter" == type(output).__name__
+    with pytest.raises(ImportError):
+        importers.get_importer("google_sheets", None)
+
+
+def test_validations_load_their_optional_steps_on_first_use(fresh_import) -> None:
+    optional_modules = (
+        "src.common_db_functions",
+        "src.sharded_validation",
+        "src.validation_rules",
+    )
+
+    fresh_import("src.common_resource_functions", ())
+
+    assert [] == [name for name in optional_modules if name in sys.modules]
+
+
+def test_importer_registry(monkeypatch) -> None:
+    monkeypatch.setattr(src.importers, "_IMPORTERS", dict(src.importers._IMPORTERS))
+    monkeypatch.setattr(src.importers, "_EXTENSIONS", dict(src.importers._EXTENSIONS))
+    register_importer("custom_xlsx", "src.xlsx_importer:XlsxImporter", (".XLSB",))
+
+    assert XlsxImporter is get_importer_class("custom_xlsx")
+    assert isinstance(get_importer("xlsx"), XlsxImporter)
+    assert "custom_xlsx" == importer_name_for_source("data/report.xlsb")
+    with pytest.raises(ValueError):
+        get_importer_class("unknown")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+
+import pytest
+from pandas import DataFrame
+
+from src.instrumentation import Instrumentation, logging_hook
+from src.sqlite_handler import SQLiteDataBaseHandler
+from tests.mock_classes import MockResource
+
+
+class StagesResource(MockResource):
+    def __init__(self, resource_sheet_name: str):
+        self.data_importer = StubImporter()
+        self.db_handler = SQLiteDataBaseHandler()
+
+    def load_input_data(self, source: str | bytes) -> None:
+        self.input_data = self.data_importer.load_data(source, "sheet")
+
+    def insert_data(self) -> None:
+        self.db_handler.connect_with_db()
+        self.db_handler.bulk_insert_resource_data(self.resource_name, self.input_data)
+
+    def load_db_data(self) -> None:
+        self.db_data = self.db_handler.load_resource_data(self.resource_name, None)
+
+
+class StubImporter:
+    def load_data(self, source, section=None, types=None) -> DataFrame:
+        return DataFrame({"col_a": range(100), "col_b": ["value"] * 100})
+
+
+@pytest.fixture
+def resource() -> StagesResource:
+    return StagesResource("mock")
+
+
+def test_instrument_resource_stages(resource) -> None:
+    expected = [
+        ("StubImporter.load_data", 100),
+        ("StagesResource.load_input_data", 100),
+        ("SQLiteDataBaseHandler.connect_with_db", None),
+        ("SQLiteDataBaseHandler.bulk_insert_resource_data", 100),
+        ("StagesResource.insert_data", 100),
+        ("SQLiteDataBaseHandler.load_resource_data", 100),
+        ("StagesResource.load_db_data", 100),
+    ]
+
+    instrumentation = Instrumentation()
+    instrumentation.instrument_resource(resource)
+    resource.load_input_data("source.xlsx")
+    resource.insert_data()
+    resource.load_db_data()
+
+    output = [(totals["stage"], totals["rows"]) for totals in instrumentation.report()]
+    assert expected == output
+    for record in instrumentation.records:
+        assert record.wall_seconds >= 0 and record.cpu_seconds >= 0
+        assert record.peak_bytes is not None and record.peak_bytes >= 0
+    outer_peak = instrumentation.records[1].peak_bytes
+    assert outer_peak >= instrumentation.records[0].peak_bytes
+
+
+def test_disabled_instrumentation_does_not_wrap(resource) -> None:
+    load_input_data = resource.load_input_data
+
+    instrumentation = Instrumentation(enabled=False)
+    instrumentation.instrument_resource(resource)
+    with instrumentation.stage("block"):
+        resource.load_input_data("source.xlsx")
+
+    assert load_input_data == resource.load_input_data
+    assert [] == instrumentation.records
+
+
+def test_instrumentation_exports(caplog) -> None:
+    expected = (
+        "# HELP load_transmuter_stage_calls_total Finished runs of the stage.\n"
+        "# TYPE load_transmuter_stage_calls_total counter\n"
+        'load_transmuter_stage_calls_total{stage="parse"} 2\n'
+    )
+
+    instrumentation = Instrumentation(trace_memory=False, hooks=[logging_hook()])
+    with caplog.at_level(logging.INFO, logger="load_transmuter"):
+        for _ in range(2):
+            with instrumentation.stage("parse") as stage:
+                stage.rows = 10
+
+    output = instrumentation.to_prometheus()
+    assert output.startswith(expected)
+    assert 'load_transmuter_stage_rows{stage="parse"} 20\n' in output
+    assert "peak_bytes{" not in output
+    assert 2 == len(caplog.records)
+    assert caplog.records[0].getMessage().startswith("parse: ")
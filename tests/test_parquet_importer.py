@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from pandas import DataFrame, concat
+from pandas.testing import assert_frame_equal
+
+from src import parquet_importer
+from src.parquet_importer import ParquetImporter
+
+
+@pytest.fixture
+def source_data() -> DataFrame:
+    return DataFrame(
+        {
+            "id": range(10),
+            "code": [f"{row:03}" for row in range(10)],
+            "year": [2023] * 5 + [2024] * 5,
+        }
+    )
+
+
+class FakeTable:
+    """The pyarrow Table and RecordBatch calls used by the importer."""
+
+    def __init__(self, data: DataFrame):
+        self.data = data
+        self.num_rows = len(data)
+
+    def to_pandas(self) -> DataFrame:
+        # pyarrow always returns a fresh DataFrame with a RangeIndex
+        return self.data.reset_index(drop=True)
+
+
+class FakeParquetFile:
+    """A single file reader, with row groups of `row_group_size` rows."""
+
+    def __init__(self, data: DataFrame, row_group_size: int):
+        self.data = data
+        self.row_group_size = row_group_size
+        self.schema_arrow = SimpleNamespace(names=list(data.columns))
+
+    def _select(self, rows: slice, columns: list[str] | None) -> DataFrame:
+        return self.data.iloc[rows][columns or list(self.data.columns)]
+
+    def read(self, columns=None, use_threads=True) -> FakeTable:
+        return FakeTable(self._select(slice(None), columns))
+
+    def read_row_group(self, index, columns=None, use_threads=True) -> FakeTable:
+        start = index * self.row_group_size
+        if not 0 <= start < len(self.data):
+            raise IndexError(f"Row group index out of range: {index}")
+        rows = slice(start, start + self.row_group_size)
+        return FakeTable(self._select(rows, columns))
+
+    def iter_batches(self, batch_size, row_groups=None, columns=None, use_threads=True):
+        for index in row_groups or range(-(-len(self.data) // self.row_group_size)):
+            group = self.read_row_group(index, columns).data
+            for start in range(0, len(group), batch_size):
+                yield FakeTable(group.iloc[start : start + batch_size])
+
+
+class FakeDataset:
+    def __init__(self, data: DataFrame):
+        self.data = data
+        self.schema = SimpleNamespace(names=list(data.columns))
+
+    def to_table(self, columns=None, use_threads=True) -> FakeTable:
+        return FakeTable(self.data[columns or list(self.data.columns)])
+
+    def to_batches(self, columns=None, batch_size=None, use_threads=True):
+        data = self.to_table(columns).data
+        for start in range(0, len(data), batch_size):
+            yield FakeTable(data.iloc[start : start + batch_size])
+
+
+@pytest.fixture
+def fake_pyarrow(monkeypatch: pytest.MonkeyPatch, source_data: DataFrame) -> dict:
+    """Replace pyarrow with fake readers over `source_data`, recording the calls."""
+    calls: dict = {}
+
+    def parquet_file(stream):
+        calls["file"] = stream
+        return FakeParquetFile(source_data, row_group_size=4)
+
+    def dataset(path, format, partitioning):
+        calls["dataset"] = (path, format, partitioning)
+        return FakeDataset(source_data)
+
+    modules = (
+        SimpleNamespace(ParquetFile=parquet_file),
+        SimpleNamespace(dataset=dataset),
+    )
+    monkeypatch.setattr(parquet_importer, "_import_pyarrow", lambda: modules)
+    return calls
+
+
+def test_parquet_importer_mocked_file(
+    fake_pyarrow: dict, source_data: DataFrame
+) -> None:
+    importer = ParquetImporter()
+
+    output = importer.load_data(b"content", 1)
+    full = importer.load_data(b"content")
+
+    assert b"content" == fake_pyarrow["file"].getvalue()
+    assert [4, 5, 6, 7] == output["id"].tolist()
+    assert_frame_equal(source_data, full)
+
+
+def test_parquet_importer_mocked_chunks(fake_pyarrow: dict) -> None:
+    importer = ParquetImporter()
+    case_types = {"id": int, "code": str, "missing": str}
+    expected = importer.load_data(b"content", types=case_types)
+
+    chunks = list(importer.iter_chunks(b"content", None, 3, case_types))
+    output = concat(chunks)
+
+    # Shorter chunks at the row group boundaries, with a continuous index
+    assert [3, 1, 3, 1, 2] == [len(chunk) for chunk in chunks]
+    assert ["id", "code"] == list(expected.columns)
+    assert_frame_equal(expected, output)
+    row_group = importer.load_data(b"content", 1)
+    assert_frame_equal(row_group, next(importer.iter_chunks(b"content", 1, 5)))
+
+
+def test_parquet_importer_mocked_dataset(tmp_path: Path, fake_pyarrow: dict) -> None:
+    dataset_dir = tmp_path / "dataset"
+    (dataset_dir / "year=2024").mkdir(parents=True)
+    importer = ParquetImporter()
+
+    output = importer.load_data(str(dataset_dir), "year=2024", {"id": int})
+    opened = fake_pyarrow["dataset"]
+    chunks = list(importer.iter_chunks(str(dataset_dir), None, 4))
+
+    assert (str(dataset_dir / "year=2024"), "parquet", "hive") == opened
+    assert ["id"] == list(output.columns)
+    assert [4, 4, 2] == [len(chunk) for chunk in chunks]
+    assert list(range(10)) == list(concat(chunks).index)
+
+
+def test_parquet_importer_mocked_errors(tmp_path: Path, fake_pyarrow: dict) -> None:
+    importer = ParquetImporter()
+
+    with pytest.raises(Exception, match="File not found"):
+        importer.load_data(str(tmp_path / "missing.parquet"))
+    with pytest.raises(Exception, match="partition directory"):
+        importer.load_data(b"content", "year=2024")
+    with pytest.raises(Exception, match="partition directory"):
+        importer.load_data(str(tmp_path), 0)
+    with pytest.raises(Exception, match="Error loading"):
+        importer.load_data(b"content", 10)
+    with pytest.raises(ValueError):
+        next(importer.iter_chunks(b"content", None, 0))
+
+
+@pytest.fixture
+def parquet_file(tmp_path: Path, source_data: DataFrame) -> str:
+    pytest.importorskip("pyarrow")
+    filename = str(tmp_path / "data.parquet")
+    source_data.to_parquet(filename, index=False, row_group_size=4)
+    return filename
+
+
+def test_parquet_importer_row_groups(
+    parquet_file: str, source_data: DataFrame
+) -> None:
+    importer = ParquetImporter()
+
+    output = importer.load_data(parquet_file, 1)
+    full = importer.load_data(parquet_file)
+
+    assert [4, 5, 6, 7] == output["id"].tolist()
+    assert_frame_equal(source_data, full)
+
+
+def test_parquet_importer_projection_and_chunks(parquet_file: str) -> None:
+    importer = ParquetImporter()
+    case_types = {"id": int, "code": str}
+    expected = importer.load_data(parquet_file, types=case_types)
+
+    chunks = list(importer.iter_chunks(parquet_file, None, 3, case_types))
+    output = concat(chunks)
+
+    assert ["id", "code"] == list(expected.columns)
+    assert_frame_equal(expected, output)
+
+
+def test_parquet_importer_partitions(tmp_path: Path, source_data: DataFrame) -> None:
+    pytest.importorskip("pyarrow")
+    dataset_dir = str(tmp_path / "dataset")
+    source_data.to_parquet(dataset_dir, partition_cols=["year"], index=False)
+
+    output = ParquetImporter().load_data(dataset_dir, "year=2024")
+
+    assert [5, 6, 7, 8, 9] == sorted(output["id"].tolist())
+
+
+def test_parquet_importer_without_pyarrow(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match="requires pyarrow"):
+        ParquetImporter().load_data(b"content")
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+from pandas import DataFrame
+
+from src.cached_importer import content_hash
+from src.common_resource_functions import CommonResourceFunctions
+from src.load_checkpoints import LoadCheckpoint, LoadCheckpoints
+from src.pipeline_runner import PipelineRunner
+from src.sqlite_handler import SQLiteDataBaseHandler
+from src.xlsx_importer import XlsxImporter
+from tests.mock_classes import MockResource
+
+
+class PipelineResource(MockResource):
+    required_fields = ["key", "value"]
+    resource_name = "pipeline"
+    section = "data"
+
+    def __init__(self, resource_sheet_name: str):
+        self.data_importer = XlsxImporter()
+        self.db_handler = SQLiteDataBaseHandler()
+
+    def validate_data(self) -> None:
+        CommonResourceFunctions(self).run_common_validations()
+
+
+def make_workbook(filename: str, rows: list[list]) -> None:
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "data"
+    worksheet.append(["key", "value"])
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(filename)
+
+
+def load_db_rows(database: str) -> DataFrame:
+    db_handler = SQLiteDataBaseHandler()
+    db_handler.set_credentials(database=database)
+    db_handler.connect_with_db()
+    try:
+        return db_handler.load_resource_data("pipeline", DataFrame())
+    finally:
+        db_handler.close_db_connection()
+
+
+@pytest.fixture
+def resource(tmp_path: Path) -> PipelineResource:
+    resource = PipelineResource("data")
+    resource.db_handler.set_credentials(database=str(tmp_path / "pipeline.db"))
+    return resource
+
+
+def test_pipeline_inserts_every_chunk(resource, tmp_path: Path) -> None:
+    case_file = str(tmp_path / "pipeline.xlsx")
+    make_workbook(case_file, [[idx, f"value {idx}"] for idx in range(25)])
+    expected = (3, 25)
+
+    output = PipelineRunner(resource, chunksize=10, queue_size=1).run(case_file)
+
+    assert expected == output
+    assert resource.validated_data
+    assert 25 == len(load_db_rows(resource.db_handler.database))
+
+
+def test_pipeline_rolls_back_on_failure(resource, tmp_path: Path) -> None:
+    case_rows = [[idx, f"value {idx}"] for idx in range(25)]
+    case_rows[22][1] = None
+    case_file = str(tmp_path / "pipeline.xlsx")
+    make_workbook(case_file, case_rows)
+    expected = (
+        "Detected 1 problem(s):\n"
+        "- Missing data in mandatory fields:\n"
+        "  - Column 'value':\n"
+        "    - Row 24\n"
+    )
+
+    with pytest.raises(ValueError) as error:
+        PipelineRunner(resource, chunksize=10, queue_size=1).run(case_file)
+
+    assert expected == error.value.args[0]
+    assert load_db_rows(resource.db_handler.database).empty
+
+
+KILLED_RUN = """
+import os, sys
+from src.load_checkpoints import LoadCheckpoints
+from src.pipeline_runner import PipelineRunner
+from tests.test_pipeline_runner import PipelineResource
+
+def validate(chunk):
+    if chunk.index[0] >= 30:
+        os._exit(3)  # killed, without closing nor rolling back anything
+
+resource = PipelineResource("data")
+resource.db_handler.set_credentials(database=sys.argv[2])
+PipelineRunner(
+    resource, chunksize=10, queue_size=1, validate=validate,
+    checkpoints=LoadCheckpoints(), key_columns=["key"],
+).run(sys.argv[1])
+"""
+
+
+def test_pipeline_resumes_a_killed_run(resource, tmp_path: Path) -> None:
+    case_file = str(tmp_path / "pipeline.xlsx")
+    make_workbook(case_file, [[idx, f"value {idx}"] for idx in range(45)])
+    database = resource.db_handler.database
+    checkpoints = LoadCheckpoints()
+    runner = PipelineRunner(
+        resource, chunksize=10, checkpoints=checkpoints, key_columns=["key"]
+    )
+
+    killed = subprocess.run([sys.executable, "-c", KILLED_RUN, case_file, database])
+    committed_rows = len(load_db_rows(database))
+    output = runner.run(case_file)
+    rerun = runner.run(case_file)
+
+    db_rows = load_db_rows(database)
+    resource.db_handler.connect_with_db()
+    source_id = str(Path(case_file).resolve())
+    checkpoint = checkpoints.load(resource.db_handler, "pipeline", source_id)
+    resource.db_handler.close_db_connection()
+    assert 3 == killed.returncode
+    assert committed_rows in (10, 20, 30)
+    assert 45 - committed_rows == output.rows
+    assert list(range(45)) == sorted(db_rows["key"])
+    assert (0, 0) == rerun
+    assert LoadCheckpoint(45, True, content_hash(case_file)) == checkpoint
+
+
+def test_pipeline_discards_an_invalidated_load(resource, tmp_path: Path) -> None:
+    case_rows = [[idx, f"value {idx}"] for idx in range(25)]
+    case_rows[22][1] = None
+    case_file = str(tmp_path / "pipeline.xlsx")
+    make_workbook(case_file, case_rows)
+    checkpoints = LoadCheckpoints()
+    runner = PipelineRunner(
+        resource,
+        chunksize=10,
+        queue_size=1,
+        checkpoints=checkpoints,
+        key_columns=["key"],
+    )
+
+    with pytest.raises(ValueError):
+        runner.run(case_file)
+    committed_rows = len(load_db_rows(resource.db_handler.database))
+    case_rows[22][1] = "value 22"  # Corrected, a new content hash
+    make_workbook(case_file, case_rows)
+    output = runner.run(case_file)
+
+    db_rows = load_db_rows(resource.db_handler.database)
+    resource.db_handler.connect_with_db()
+    keys_table = checkpoints.keys_table("pipeline")
+    row_keys = resource.db_handler.load_resource_data(keys_table, DataFrame())
+    resource.db_handler.close_db_connection()
+    assert committed_rows in (10, 20)
+    assert (3, 25) == output
+    assert list(range(25)) == sorted(db_rows["key"])
+    assert row_keys.empty
+
+
+class TitleImporter:
+    """Rows of a source that isn't a file, e.g. a Google Sheet title."""
+
+    def load_data(self, source, section=None, types=None) -> DataFrame:
+        keys = range(25)
+        return DataFrame({"key": keys, "value": [f"{source} {key}" for key in keys]})
+
+
+def test_pipeline_checkpoints_a_title_source(resource) -> None:
+    failures = iter([True])
+
+    def validate(chunk: DataFrame) -> None:
+        if chunk.index[0] >= 10 and next(failures, False):
+            raise ValueError("Invalid chunk")
+
+    runner = PipelineRunner(
+        resource,
+        importer=TitleImporter(),
+        chunksize=10,
+        queue_size=1,
+        validate=validate,
+        checkpoints=LoadCheckpoints(),
+        key_columns=["key"],
+    )
+
+    with pytest.raises(ValueError):
+        runner.run("sheet title", "sheet title@1")
+    committed_rows = len(load_db_rows(resource.db_handler.database))
+    output = runner.run("sheet title", "sheet title@1")
+    rerun = runner.run("sheet title", "sheet title@1")
+
+    db_rows = load_db_rows(resource.db_handler.database)
+    assert 10 == committed_rows
+    assert (3, 25) == output
+    assert (0, 0) == rerun
+    assert list(range(25)) == sorted(db_rows["key"])
+
+
+class KeptMemoryHandler(SQLiteDataBaseHandler):
+    """In memory handler keeping its last connection open after closing it."""
+
+    def close_db_connection(self, rollback: bool = False) -> None:
+        self.kept = self.connection
+        if rollback:
+            self.connection.rollback()
+        else:
+            self.connection.commit()
+        self.connection = None
+
+
+def test_pipeline_checkpoints_in_memory(resource) -> None:
+    db_handler = KeptMemoryHandler()
+    runner = PipelineRunner(
+        resource,
+        importer=TitleImporter(),
+        db_handler=db_handler,
+        chunksize=10,
+        checkpoints=LoadCheckpoints(),
+        key_columns=["key"],
+    )
+
+    output = runner.run("sheet title", "sheet title@1")
+
+    db_handler.connection = db_handler.kept
+    db_rows = db_handler.load_resource_data("pipeline", DataFrame())
+    checkpoint = runner.checkpoints.load(db_handler, "pipeline", "sheet title@1")
+    assert (3, 25) == output
+    assert list(range(25)) == sorted(db_rows["key"])
+    assert LoadCheckpoint(25, True) == checkpoint
+
+
+def test_pipeline_checkpoints_need_a_version_of_title_sources(resource) -> None:
+    runner = PipelineRunner(
+        resource,
+        importer=TitleImporter(),
+        checkpoints=LoadCheckpoints(),
+        key_columns=["key"],
+    )
+
+    with pytest.raises(ValueError, match="source_id"):
+        runner.run("sheet title")
+
+
+def test_pipeline_checkpoints_reject_stored_keys(resource) -> None:
+    runner = PipelineRunner(
+        resource,
+        importer=TitleImporter(),
+        chunksize=10,
+        checkpoints=LoadCheckpoints(),
+        key_columns=["key"],
+    )
+
+    runner.run("sheet title", "sheet title@1")
+    with pytest.raises(ValueError, match=r"key \[0\]"):
+        runner.run("other title", "other title@1")
+    with pytest.raises(ValueError, match=r"key \[0\]"):
+        runner.run("other title", "other title@2")
+
+    db_rows = load_db_rows(resource.db_handler.database)
+    assert 25 == len(db_rows)
+    assert {"sheet title"} == {value.rsplit(" ", 1)[0] for value in db_rows["value"]}
+
+
+def test_pipeline_checkpoints_need_key_columns(resource) -> None:
+    with pytest.raises(ValueError):
+        PipelineRunner(resource, checkpoints=LoadCheckpoints())
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from pandas import DataFrame, concat
+from pandas.testing import assert_frame_equal
+
+from src.common_importer_functions import coerce_types
+from src.common_resource_functions import CommonResourceFunctions
+from src.sqlite_handler import SQLiteDataBaseHandler
+from tests.mock_classes import MockResource
+
+
+@pytest.fixture
+def sqlite_db(tmp_path: Path):
+    db_manager = SQLiteDataBaseHandler()
+    db_manager.set_credentials(database=str(tmp_path / "test.db"))
+    db_manager.connect_with_db()
+    yield db_manager
+    db_manager.close_db_connection(rollback=True)
+
+
+@pytest.fixture
+def resource_data() -> DataFrame:
+    return DataFrame(
+        {
+            "key": list(range(10)),
+            "value": [f"value {idx}" for idx in range(10)],
+            "amount": [idx * 1.5 for idx in range(10)],
+        }
+    )
+
+
+def test_bulk_insert_and_load(
+    sqlite_db: SQLiteDataBaseHandler, resource_data: DataFrame
+) -> None:
+    sqlite_db.bulk_insert_resource_data("resource", resource_data, batch_size=3)
+    output = sqlite_db.load_resource_data("resource", resource_data[["key"]])
+
+    assert_frame_equal(resource_data, output)
+
+
+def test_bulk_insert_coerced_blanks(sqlite_db: SQLiteDataBaseHandler) -> None:
+    case_data = coerce_types(
+        DataFrame(
+            {
+                "key": [1, 2, 3],
+                "amount": ["1", "", "3"],
+                "active": ["yes", "", "no"],
+                "created": ["2024-01-02 10:30", "", "2024-01-04"],
+                "name": ["a", "", None],
+            },
+            dtype="object",
+        ),
+        {"key": int, "amount": int, "active": bool, "created": datetime, "name": str},
+    )
+    expected = DataFrame(
+        {
+            "key": [1, 2, 3],
+            "amount": [1, None, 3],
+            "active": [1, None, 0],
+            "created": ["2024-01-02 10:30:00", None, "2024-01-04 00:00:00"],
+            "name": ["a", "", None],
+        }
+    )
+
+    sqlite_db.bulk_insert_resource_data("resource", case_data)
+    output = sqlite_db.load_resource_data("resource", DataFrame())
+
+    assert_frame_equal(expected, output)
+
+
+def test_bulk_insert_commit_every(
+    sqlite_db: SQLiteDataBaseHandler, resource_data: DataFrame
+) -> None:
+    case_batch_size = 4
+    case_commit_every = 2
+    expected = resource_data.iloc[:8].reset_index(drop=True)
+
+    sqlite_db.bulk_insert_resource_data(
+        "resource", resource_data, case_batch_size, case_commit_every
+    )
+    sqlite_db.close_db_connection(rollback=True)
+    sqlite_db.connect_with_db()
+    output = sqlite_db.load_resource_data("resource", DataFrame())
+
+    assert_frame_equal(expected, output)
+
+
+@pytest.mark.parametrize("delete_missing", [False, True])
+def test_sync_input_data(
+    sqlite_db: SQLiteDataBaseHandler, resource_data: DataFrame, delete_missing: bool
+) -> None:
+    sqlite_db.bulk_insert_resource_data("resource", resource_data)
+    input_data = resource_data.drop(index=[0]).astype(object)
+    input_data.loc[5, "value"] = "changed"
+    input_data.loc[10] = [10, "value 10", 15.0]
+    resource = MockResource("mock")
+    resource.resource_name = "resource"
+    resource.input_data = input_data
+    resource.db_handler = sqlite_db
+    expected = input_data
+    if not delete_missing:
+        expected = concat([resource_data.iloc[:1], input_data])
+
+    delta = CommonResourceFunctions(resource).sync_input_data(["key"], delete_missing)
+    output = sqlite_db.load_resource_data("resource", DataFrame())
+
+    assert 2 + delete_missing == delta.changed_rows
+    assert_frame_equal(
+        expected.reset_index(drop=True).astype(output.dtypes.to_dict()),
+        output.sort_values("key").reset_index(drop=True),
+    )
+
+
+def test_sync_unchanged_input_data(sqlite_db: SQLiteDataBaseHandler) -> None:
+    input_data = coerce_types(
+        DataFrame(
+            {
+                "key": ["1", "2", "3"],
+                "amount": ["2", "", "4.5"],
+                "active": ["yes", "", "no"],
+                "created": ["2024-01-02", "", "2024-01-04 10:30"],
+                "name": ["a", "", "c"],
+            },
+            dtype="object",
+        ),
+        {"key": int, "amount": float, "active": bool, "created": datetime},
+    )
+    resource = MockResource("mock")
+    resource.resource_name = "resource"
+    resource.input_data = input_data
+    resource.db_handler = sqlite_db
+    sqlite_db.bulk_insert_resource_data("resource", input_data)
+
+    delta = CommonResourceFunctions(resource).sync_input_data(["key"], True)
+
+    assert 0 == delta.changed_rows
+
+
+def test_keyed_load_in_chunks(
+    sqlite_db: SQLiteDataBaseHandler, resource_data: DataFrame
+) -> None:
+    sqlite_db.bulk_insert_resource_data("resource", resource_data)
+    case_keys = DataFrame({"key": [8, 1, 3, 1, 42], "value": ["value 8"] * 5})
+    expected = resource_data.iloc[[1, 3, 8]].reset_index(drop=True)
+
+    chunks = list(sqlite_db.iter_resource_data("resource", case_keys, ["key"], 2))
+    output = sqlite_db.load_resource_data("resource", case_keys, ["key"])
+
+    assert [2, 1] == [len(chunk) for chunk in chunks]
+    assert_frame_equal(expected, concat(chunks, ignore_index=True))
+    assert_frame_equal(expected, output)
+    temp_tables = sqlite_db.connection.execute(
+        "SELECT name FROM sqlite_temp_master WHERE type = 'table'"
+    ).fetchall()
+    assert [] == temp_tables
+    index_names = [
+        row[1] for row in sqlite_db.connection.execute("PRAGMA index_list(resource)")
+    ]
+    assert [] == index_names
+
+
+def test_create_key_index(
+    sqlite_db: SQLiteDataBaseHandler, resource_data: DataFrame
+) -> None:
+    sqlite_db.bulk_insert_resource_data("resource", resource_data)
+    sqlite_db.bulk_insert_resource_data("other", resource_data)
+
+    sqlite_db.create_key_index("resource", ["key"])
+    sqlite_db.delete_resource_data("other", resource_data.iloc[:1], ["key"])
+
+    for table in ("resource", "other"):
+        query = f"PRAGMA index_list({table})"
+        index_names = [row[1] for row in sqlite_db.connection.execute(query)]
+        assert [f"ix__{table}__key"] == index_names
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+from pathlib import Path
+
+import pytest
+from pandas import DataFrame
+
+from src.sqlite_pool import SQLiteConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path: Path):
+    pool = SQLiteConnectionPool(min_size=1, max_size=2, timeout=0.5)
+    pool.set_credentials(database=str(tmp_path / "pool.db"))
+    pool.open_pool()
+    yield pool
+    pool.close_pool()
+
+
+def test_pool_reuses_connections(pool) -> None:
+    case_data = DataFrame({"key": [1, 2, 3]})
+
+    for _ in range(3):
+        db_handler = pool.handler()
+        db_handler.connect_with_db()
+        db_handler.bulk_insert_resource_data("resource", case_data)
+        db_handler.close_db_connection()
+
+    db_handler = pool.handler()
+    db_handler.connect_with_db()
+    output = db_handler.load_resource_data("resource", DataFrame())
+    db_handler.close_db_connection()
+
+    assert 9 == len(output)
+    assert 1 == pool.created_count
+
+
+def test_pool_nested_checkouts_share_the_transaction(pool) -> None:
+    outer_handler = pool.handler()
+    inner_handler = pool.handler()
+
+    outer_handler.connect_with_db()
+    inner_handler.connect_with_db()
+    inner_handler.bulk_insert_resource_data("resource", DataFrame({"key": [1]}))
+    inner_handler.close_db_connection(rollback=True)
+    assert outer_handler.connection is not None
+    outer_handler.close_db_connection()
+
+    outer_handler.connect_with_db()
+    output = outer_handler.load_resource_data("resource", DataFrame())
+    outer_handler.close_db_connection()
+
+    assert output.empty
+
+
+def test_pool_max_size_and_health_check(pool) -> None:
+    pool.health_check_interval = 0
+    holders = [pool.handler(), pool.handler()]
+    started = threading.Barrier(3)
+    release = threading.Event()
+
+    def hold(db_handler) -> None:
+        db_handler.connect_with_db()
+        started.wait()
+        release.wait()
+        db_handler.close_db_connection()
+
+    threads = [threading.Thread(target=hold, args=(holder,)) for holder in holders]
+    for thread in threads:
+        thread.start()
+    started.wait()
+    with pytest.raises(ConnectionError):
+        pool.handler().connect_with_db()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    # Broken idle connection, dropped at checkout
+    broken_connection = pool._idle[-1][0]
+    broken_connection.close()
+    db_handler = pool.handler()
+    db_handler.connect_with_db()
+
+    assert db_handler.connection is not broken_connection
+    assert 1 == db_handler.connection.execute("SELECT 1").fetchone()[0]
+    db_handler.close_db_connection()
+
+
+def test_pool_connects_outside_the_lock(pool, monkeypatch) -> None:
+    connect = pool._connect
+    holding = threading.Event()
+    connecting = threading.Event()
+    connected = threading.Event()
+
+    def slow_connect():
+        connecting.set()
+        connected.wait()
+        return connect()
+
+    def use(db_handler, event: threading.Event) -> None:
+        db_handler.connect_with_db()
+        holding.set()
+        event.wait()
+        db_handler.close_db_connection()
+
+    monkeypatch.setattr(pool, "_connect", slow_connect)
+    release = threading.Event()
+    holder = threading.Thread(target=use, args=(pool.handler(), release))
+    holder.start()
+    holding.wait()
+    connector = threading.Thread(target=use, args=(pool.handler(), connected))
+    connector.start()
+    connecting.wait()
+
+    # Released while the other thread is still connecting
+    release.set()
+    holder.join(timeout=5)
+    released = not holder.is_alive()
+    connected.set()
+    holder.join()
+    connector.join()
+
+    assert released
+    assert 2 == pool.created_count
+    assert 2 == len(pool._idle)
+
+
+def test_pool_failed_connection_frees_its_slot(pool, monkeypatch) -> None:
+    errors = []
+
+    def failed_connect():
+        raise ConnectionError("Can't connect")
+
+    def use() -> None:
+        db_handler = pool.handler()
+        try:
+            db_handler.connect_with_db()
+        except ConnectionError as err:
+            errors.append(err)
+            return
+        db_handler.close_db_connection()
+
+    def use_while_holding() -> None:
+        thread = threading.Thread(target=use)
+        thread.start()
+        thread.join()
+
+    db_handler = pool.handler()
+    db_handler.connect_with_db()
+    with monkeypatch.context() as patch:
+        patch.setattr(pool, "_connect", failed_connect)
+        use_while_holding()
+    use_while_holding()
+    db_handler.close_db_connection()
+
+    assert 1 == len(errors)
+    assert 2 == pool.created_count
+    assert 2 == pool._open_count
@@ -1,11 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from datetime import datetime, time
 from pathlib import Path
 
 import pytest
+from openpyxl import Workbook
+from pandas import concat, read_excel
+from pandas.testing import assert_frame_equal
 
 from src.xlsx_importer import XlsxImporter
+from src.xlsx_projection import check_openpyxl_version
 
 TEST_FILES = Path("tests/files")
 
@@ -25,3 +30,202 @@ def test_xlsx_importer_read_sheet(xlsx_importer: XlsxImporter) -> None:
     output = parsed_xlsx["target_col"][0]
 
     assert expected == output
+
+
+@pytest.fixture
+def chunked_xlsx_file(tmp_path: Path) -> str:
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "chunks"
+    worksheet.append(["col_a", "col_b", None, "col_d"])
+    for row in range(10):
+        worksheet.append([row, f"value {row}", None, None if row % 3 else "x"])
+    worksheet.append([None, None, None, None])
+    worksheet.append(["last", None, "z", None])
+    worksheet.append([None, None, None, None])
+    filename = str(tmp_path / "chunks.xlsx")
+    workbook.save(filename)
+    return filename
+
+
+def test_xlsx_importer_iter_chunks(
+    xlsx_importer: XlsxImporter, chunked_xlsx_file: str
+) -> None:
+    case_chunksize = 4
+    expected = xlsx_importer.load_data(chunked_xlsx_file, "chunks")
+
+    chunks = list(
+        xlsx_importer.iter_chunks(chunked_xlsx_file, "chunks", case_chunksize)
+    )
+    output = concat(chunks)
+
+    assert [4, 4, 4] == [len(chunk) for chunk in chunks]
+    assert_frame_equal(expected, output)
+
+
+@pytest.fixture
+def mixed_xlsx_file(tmp_path: Path) -> str:
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "mixed"
+    worksheet.append(["key", "key", 2.0, None, "key.1", True, "flag", "number"])
+    worksheet.append([1, "a", 1.5, "x", 3, "t", True, 2.0])
+    worksheet.append([2, "b", None, None, 4.0, 1, 1, 1e20])
+    worksheet.append([3, "c", time(1, 2), None, None, None, False, None])
+    worksheet["H4"].value = "#DIV/0!"
+    worksheet["H4"].data_type = "e"
+    filename = str(tmp_path / "mixed.xlsx")
+    workbook.save(filename)
+    return filename
+
+
+def test_xlsx_importer_iter_chunks_read_excel_parity(
+    xlsx_importer: XlsxImporter, mixed_xlsx_file: str
+) -> None:
+    expected = read_excel(
+        mixed_xlsx_file,
+        sheet_name="mixed",
+        engine="openpyxl",
+        keep_default_na=False,
+        dtype="object",
+    )
+
+    output = concat(xlsx_importer.iter_chunks(mixed_xlsx_file, "mixed", 100))
+    output_header = xlsx_importer.read_header(mixed_xlsx_file, "mixed")
+
+    assert ["key", "key.2", 2, "Unnamed: 3", "key.1", True] == output_header[:6]
+    assert list(expected.columns) == output_header
+    assert_frame_equal(expected, output)
+
+
+@pytest.fixture
+def multi_sheet_xlsx_file(tmp_path: Path) -> str:
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for sheet in range(3):
+        worksheet = workbook.create_sheet(f"sheet_{sheet}")
+        worksheet.append(["col_a", "col_b"])
+        for row in range(5):
+            worksheet.append([sheet, f"value {row}"])
+    filename = str(tmp_path / "multi_sheet.xlsx")
+    workbook.save(filename)
+    return filename
+
+
+def test_xlsx_importer_load_many(
+    xlsx_importer: XlsxImporter, multi_sheet_xlsx_file: str
+) -> None:
+    case_sections = ["sheet_2", "sheet_0", "sheet_1"]
+
+    output = xlsx_importer.load_many(multi_sheet_xlsx_file, case_sections, 2)
+
+    assert case_sections == list(output)
+    for section in case_sections:
+        expected = xlsx_importer.load_data(multi_sheet_xlsx_file, section)
+        assert_frame_equal(expected, output[section])
+
+
+def test_xlsx_importer_load_many_errors(
+    xlsx_importer: XlsxImporter, multi_sheet_xlsx_file: str
+) -> None:
+    case_sections = ["missing_b", "sheet_0", "missing_a"]
+
+    with pytest.raises(Exception) as error:
+        xlsx_importer.load_many(multi_sheet_xlsx_file, case_sections, 2)
+
+    output = error.value.args[0].splitlines()
+    assert "Error loading 2 section(s) of the xlsx file:" == output[0]
+    assert output[1].startswith("   - missing_b: ")
+    assert output[2].startswith("   - missing_a: ")
+
+
+def test_xlsx_importer_typed_columns(
+    tmp_path: Path, xlsx_importer: XlsxImporter
+) -> None:
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "typed"
+    worksheet.append(["amount", "price", "date", "name"])
+    worksheet.append([1, 1.5, datetime(2024, 1, 2), "first"])
+    worksheet.append(["2", None, "2024-01-03", None])
+    worksheet.append(["three", "x", "not a date", 3])
+    filename = str(tmp_path / "typed.xlsx")
+    workbook.save(filename)
+    case_types = {"amount": int, "price": float, "date": datetime, "name": str}
+    expected_dtypes = ["Int64", "float64", "datetime64[ns]", "string"]
+    expected_type_errors = {"amount": [2], "price": [2], "date": [2]}
+
+    output = xlsx_importer.load_data(filename, "typed", case_types)
+
+    assert expected_dtypes == [str(dtype) for dtype in output.dtypes]
+    assert expected_type_errors == output.attrs["type_errors"]
+    assert [1, 2] == output["amount"].iloc[:2].tolist()
+
+
+@pytest.fixture
+def wide_xlsx_file(tmp_path: Path) -> str:
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "wide"
+    worksheet.append(["col_a", "col_b", None, "col_d", 5])
+    for row in range(6):
+        date = datetime(2024, 1, row + 1) if row % 2 else None
+        worksheet.append([row, f"value {row}", "x", date, 1.5])
+    worksheet.append([None, None, None, None, None])
+    worksheet.append(["last", None, "only in skipped columns", None, None])
+    filename = str(tmp_path / "wide.xlsx")
+    workbook.save(filename)
+    return filename
+
+
+def test_xlsx_importer_read_header(
+    xlsx_importer: XlsxImporter, wide_xlsx_file: str
+) -> None:
+    expected = ["col_a", "col_b", "Unnamed: 2", "col_d", 5]
+
+    output = xlsx_importer.read_header(wide_xlsx_file, "wide")
+
+    assert expected == output
+
+
+@pytest.mark.parametrize(
+    "case_usecols", [["col_d", "5"], ["col_a", "col_d", "missing_col"]]
+)
+def test_xlsx_importer_usecols(
+    xlsx_importer: XlsxImporter, wide_xlsx_file: str, case_usecols: list[str]
+) -> None:
+    full_data = xlsx_importer.load_data(wide_xlsx_file, "wide")
+    expected = full_data[[col for col in full_data.columns if str(col) in case_usecols]]
+
+    output = xlsx_importer.load_data(wide_xlsx_file, "wide", usecols=case_usecols)
+    chunks = xlsx_importer.iter_chunks(wide_xlsx_file, "wide", 3, usecols=case_usecols)
+
+    assert_frame_equal(expected, output)
+    assert_frame_equal(expected, concat(chunks))
+
+
+@pytest.mark.parametrize(
+    "case_usecols",
+    [["key", "key.1"], ["key.2", "True"], ["2", "Unnamed: 3", "number"], ["flag"]],
+)
+def test_xlsx_importer_usecols_read_excel_parity(
+    xlsx_importer: XlsxImporter, mixed_xlsx_file: str, case_usecols: list[str]
+) -> None:
+    full_data = xlsx_importer.load_data(mixed_xlsx_file, "mixed")
+    expected = full_data[[col for col in full_data.columns if str(col) in case_usecols]]
+
+    output = xlsx_importer.load_data(mixed_xlsx_file, "mixed", usecols=case_usecols)
+    chunks = xlsx_importer.iter_chunks(
+        mixed_xlsx_file, "mixed", 2, usecols=case_usecols
+    )
+
+    assert len(case_usecols) == len(output.columns)
+    assert_frame_equal(expected, output)
+    assert_frame_equal(expected, concat(chunks))
+
+
+def test_xlsx_projection_openpyxl_version() -> None:
+    check_openpyxl_version("3.1.5")
+
+    with pytest.warns(RuntimeWarning, match="private worksheet parser"):
+        check_openpyxl_version("3.2.0")